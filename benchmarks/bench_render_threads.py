@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-deck rasterization throughput against render thread count.
+
+Usage:
+    python benchmarks/bench_render_threads.py [--pdf deck.pdf] [--threads 1,2,4,8]
+        [--backend thread|process]
+
+Without --pdf a synthetic vector-heavy deck is generated. Every run uses a
+fresh cache directory so nothing is served from an earlier run.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from corpus import make_synthetic_deck  # noqa: E402
+from PySide6.QtCore import QCoreApplication  # noqa: E402
+
+from pdfpc_pyqt6.config import config  # noqa: E402
+from pdfpc_pyqt6.core.pdf_processor import PDFProcessor  # noqa: E402
+from pdfpc_pyqt6.core.state_manager import AppState  # noqa: E402
+from pdfpc_pyqt6.core.threading_manager import RenderThreadPool  # noqa: E402
+
+
+def run(pdf_path: str, threads: int, scale: float, backend: str) -> float:
+    """Rasterize the whole deck once and return pages/sec"""
+    with tempfile.TemporaryDirectory(prefix="pdfpc-bench-") as cache_dir:
+        config.CACHE_DIR = Path(cache_dir)
+        config.RENDER_BACKEND = backend
+        config.RENDER_PROCESSES = threads
+        # Raw throughput: no thread held back for foreground renders
+        config.RENDER_FOREGROUND_THREADS = 0
+        state = AppState()
+        processor = PDFProcessor()
+        processor.set_render_scale(scale)
+        pool = RenderThreadPool(processor, state, max_threads=threads)
+
+        processor.load_pdf(pdf_path)
+        page_count = processor.get_page_count()
+        state.set_total_pages(page_count)
+
+        start = time.perf_counter()
+        pool.render_all_pages()
+        pool.wait_for_all()
+        elapsed = time.perf_counter() - start
+
+        pool.shutdown()
+        processor.close()
+        return page_count / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pdf", help="PDF to render (default: synthetic deck)")
+    parser.add_argument("--pages", type=int, default=60, help="synthetic deck size")
+    parser.add_argument("--threads", default="1,2,4,8", help="thread counts")
+    parser.add_argument("--scale", type=float, default=config.DEFAULT_SCALE)
+    parser.add_argument("--backend", choices=("thread", "process"), default="thread")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pdfpc-deck-") as deck_dir:
+        pdf_path = args.pdf
+        if pdf_path is None:
+            pdf_path = str(Path(deck_dir) / "synthetic.pdf")
+            make_synthetic_deck(Path(pdf_path), args.pages)
+
+        print(f"{'threads':>8} {'pages/sec':>10} {'speedup':>8}")
+        baseline = None
+        for threads in (int(t) for t in args.threads.split(",")):
+            rate = run(pdf_path, threads, args.scale, args.backend)
+            baseline = baseline or rate
+            print(f"{threads:>8} {rate:>10.1f} {rate / baseline:>7.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    app = QCoreApplication.instance() or QCoreApplication([])
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Benchmark corpus: synthetic decks that are generated deterministically, so
+every run measures the same documents.
+"""
+
+from pathlib import Path
+
+
+def make_synthetic_deck(path: Path, pages: int) -> None:
+    """Write a deck with text and many vector shapes on every page"""
+    import fitz
+
+    doc = fitz.open()
+    for page_idx in range(pages):
+        page = doc.new_page(width=1024, height=768)
+        page.insert_text((60, 80), f"Slide {page_idx + 1}", fontsize=36)
+        for i in range(400):
+            x = 40 + (i * 37) % 940
+            y = 120 + (i * 53) % 600
+            page.draw_circle((x, y), 6 + i % 11, color=(i % 3 / 2, 0.2, 0.6))
+        for line in range(12):
+            page.insert_text(
+                (60, 140 + line * 40), "Lorem ipsum dolor sit amet " * 3, fontsize=14
+            )
+    doc.save(str(path))
+    doc.close()
+
+
+def make_text_deck(path: Path, pages: int) -> None:
+    """Write a light deck (a title and a few bullets per page) for large page counts"""
+    import fitz
+
+    doc = fitz.open()
+    for page_idx in range(pages):
+        page = doc.new_page(width=1024, height=768)
+        page.insert_text((60, 80), f"Slide {page_idx + 1}", fontsize=36)
+        for line in range(4):
+            page.insert_text((80, 180 + line * 60), f"- Point {line + 1}", fontsize=24)
+    doc.save(str(path))
+    doc.close()
+
+
+DECKS = {
+    "vector": make_synthetic_deck,
+    "text": make_text_deck,
+}
+
+
+def deck(directory: Path, kind: str, pages: int) -> Path:
+    """Get a synthetic deck in directory, generating it on first use"""
+    path = Path(directory) / f"{kind}_{pages}.pdf"
+    if not path.exists():
+        DECKS[kind](path, pages)
+    return path
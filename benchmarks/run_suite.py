@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark suite for the render and navigation pipeline.
+
+Usage:
+    python benchmarks/run_suite.py [--output results.json] [--quick]
+        [--only render_scale,pool_threads,overview_build,navigation,cache_codec,
+                startup,prefetch,render_budget,display_lists]
+
+Runs under the offscreen Qt platform on the benchmark corpus (see
+corpus.py). Every benchmark runs in its own process with a fresh cache
+directory, so results are independent and peak RSS is per benchmark. The
+results are printed as a table and, with --output, written as JSON for
+comparing releases.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+BENCHMARKS = (
+    "render_scale",
+    "pool_threads",
+    "overview_build",
+    "navigation",
+    "cache_codec",
+    "startup",
+    "prefetch",
+    "render_budget",
+    "display_lists",
+)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB"""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def pump_events(app, seconds: float, until=None) -> bool:
+    """Process events for up to seconds, or until until() is true"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        if until is not None and until():
+            return True
+        time.sleep(0.001)
+    return until is None
+
+
+def bench_render_scale(args, work_dir: Path) -> dict:
+    """PDFProcessor.render_page throughput (pages/sec) per render scale"""
+    from corpus import deck
+
+    from pdfpc_pyqt6.config import config
+    from pdfpc_pyqt6.core.pdf_processor import PDFProcessor
+
+    pdf_path = deck(work_dir, "vector", args.pages)
+    results = {}
+    for scale in args.scales:
+        config.CACHE_DIR = Path(tempfile.mkdtemp(dir=work_dir, prefix="cache-"))
+        processor = PDFProcessor()
+        processor.set_render_scale(scale)
+        processor.load_pdf(str(pdf_path))
+
+        start = time.perf_counter()
+        for page_idx in range(processor.get_page_count()):
+            processor.render_page(page_idx)
+        processor.flush_cache_writes()
+        elapsed = time.perf_counter() - start
+
+        processor.close()
+        results[f"{scale:g}x"] = {
+            "pages": args.pages,
+            "seconds": round(elapsed, 4),
+            "pages_per_sec": round(args.pages / elapsed, 2),
+        }
+    return results
+
+
+def bench_pool_threads(args, work_dir: Path) -> dict:
+    """RenderThreadPool full-deck time per thread count"""
+    from bench_render_threads import run
+    from corpus import deck
+
+    pdf_path = deck(work_dir, "vector", args.pages)
+    results = {}
+    for threads in args.threads:
+        rate = run(str(pdf_path), threads, args.scale, args.backend)
+        results[str(threads)] = {
+            "pages": args.pages,
+            "seconds": round(args.pages / rate, 4),
+            "pages_per_sec": round(rate, 2),
+        }
+    return results
+
+
+def bench_overview_build(args, work_dir: Path) -> dict:
+    """
+    OverviewView construction time per page count: building the widget,
+    loading the document into it, and its first paint
+    """
+    from corpus import deck
+    from PySide6.QtWidgets import QApplication
+
+    from pdfpc_pyqt6.config import config
+    from pdfpc_pyqt6.core.pdf_processor import PDFProcessor
+    from pdfpc_pyqt6.core.state_manager import AppState
+    from pdfpc_pyqt6.core.threading_manager import RenderThreadPool
+    from pdfpc_pyqt6.ui.overview_view import OverviewView
+
+    app = QApplication.instance()
+    results = {}
+    for pages in args.overview_pages:
+        pdf_path = deck(work_dir, "text", pages)
+        config.CACHE_DIR = Path(tempfile.mkdtemp(dir=work_dir, prefix="cache-"))
+        state = AppState()
+        processor = PDFProcessor()
+        pool = RenderThreadPool(processor, state, max_threads=config.MAX_RENDER_THREADS)
+        processor.load_pdf(str(pdf_path))
+
+        start = time.perf_counter()
+        view = OverviewView(state, processor, pool)
+        view.resize(config.DEFAULT_WINDOW_WIDTH, config.DEFAULT_WINDOW_HEIGHT)
+        state.set_total_pages(processor.get_page_count())
+        view.show()
+        view.repaint()
+        app.processEvents()
+        elapsed = time.perf_counter() - start
+
+        view.close()
+        pool.shutdown()
+        processor.close()
+        view.deleteLater()
+        app.processEvents()
+        results[str(pages)] = {"ms": round(elapsed * 1000.0, 2)}
+    return results
+
+
+def bench_navigation(args, work_dir: Path) -> dict:
+    """
+    Keypress-to-paint latency in the presenter view with the projector
+    open, paging through the deck forward and back again. Each turn waits
+    for every display to paint, so background rendering proceeds as it
+    would between real key presses.
+    """
+    from corpus import deck
+    from PySide6.QtWidgets import QApplication
+
+    from pdfpc_pyqt6.config import config
+    from pdfpc_pyqt6.core.latency_monitor import latency_monitor
+    from pdfpc_pyqt6.ui.main_window import MainWindow
+
+    app = QApplication.instance()
+    config.CACHE_DIR = Path(tempfile.mkdtemp(dir=work_dir, prefix="cache-"))
+    pdf_path = deck(work_dir, "vector", args.pages)
+
+    window = MainWindow()
+    window.show()
+    window._load_pdf(str(pdf_path))
+    pump_events(app, 30.0, lambda: window.state.is_pdf_loaded)
+    window.state.set_view_mode(config.VIEW_MODE_PRESENTER)
+    window.open_projector()
+    # Let the windows lay out, register their sizes and render page 0
+    pump_events(app, 1.0)
+    latency_monitor.clear()
+
+    def turn(step) -> None:
+        before = latency_monitor.sample_count()
+        step()
+        # Notes, current and next panes, and the projector; the next pane
+        # stays empty on the last page
+        displays = 4
+        if window.state.current_page == window.state.total_pages - 1:
+            displays -= 1
+        pump_events(
+            app, 10.0, lambda: latency_monitor.sample_count() >= before + displays
+        )
+
+    for _ in range(args.pages - 1):
+        turn(window.next_page)
+    for _ in range(args.pages - 1):
+        turn(window.prev_page)
+
+    results = latency_monitor.summary()
+    for kinds in results.values():
+        for stats in kinds.values():
+            del stats["histogram"]
+
+    window.close()
+    app.processEvents()
+    return results
+
+
+def bench_cache_codec(args, work_dir: Path) -> dict:
+    """
+    Disk cache frame formats: write and decode time per frame and bytes per
+    frame for every available codec. Files are read back while still in the
+    OS page cache, so decode time is codec cost, not disk speed.
+    """
+    import fitz
+    from corpus import deck
+
+    from pdfpc_pyqt6.core.frame_codec import CODECS, read_frame
+
+    pdf_path = deck(work_dir, "vector", args.pages)
+    matrix = fitz.Matrix(args.scale, args.scale)
+    with fitz.open(str(pdf_path)) as doc:
+        pixmaps = [page.get_pixmap(matrix=matrix, alpha=False) for page in doc]
+
+    results = {}
+    for name, codec in CODECS.items():
+        if not codec.is_available():
+            continue
+        codec_dir = work_dir / f"codec-{name}"
+        codec_dir.mkdir()
+        paths = [str(codec_dir / f"{i}.{name}") for i in range(len(pixmaps))]
+
+        start = time.perf_counter()
+        for path, pix in zip(paths, pixmaps):
+            codec.write(path, pix)
+        write_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for path in paths:
+            if read_frame(path) is None:
+                raise RuntimeError(f"{name} failed to decode {path}")
+        read_s = time.perf_counter() - start
+
+        total_bytes = sum(os.path.getsize(path) for path in paths)
+        results[name] = {
+            "write_ms": round(write_s * 1000.0 / len(paths), 2),
+            "read_ms": round(read_s * 1000.0 / len(paths), 2),
+            "kib_per_frame": round(total_bytes / 1024 / len(paths), 1),
+        }
+    return results
+
+
+def bench_startup(args, work_dir: Path) -> dict:
+    """
+    Startup milestones of the presenter console from process start to the
+    first slide, with a cold and then a warm disk cache. Every run starts a
+    fresh interpreter, so imports are counted.
+    """
+    from corpus import deck
+
+    pdf_path = deck(work_dir, "vector", args.pages)
+    root = Path(__file__).resolve().parent.parent
+    # A home directory of its own gives the runs an empty cache directory
+    env = dict(os.environ, HOME=str(work_dir), PYTHONPATH=str(root))
+
+    results = {}
+    for run in ("cold", "warm"):
+        report_path = work_dir / f"startup-{run}.json"
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pdfpc_pyqt6",
+                str(pdf_path),
+                f"--startup-report={report_path}",
+            ],
+            env=env,
+            capture_output=True,
+            check=True,
+            timeout=120,
+        )
+        results[run] = json.loads(report_path.read_text())["milestones_ms"]
+    return results
+
+
+def bench_prefetch(args, work_dir: Path) -> dict:
+    """
+    Prefetch window in the presenter view of a large deck, for quick
+    forward paging and for agenda-style navigation (back to the agenda
+    slide, jump to a section, page through it): share of frames already
+    rendered when their page came up, latency of the rest, renders done and
+    slides left decoded in memory (thumbnails aside)
+    """
+    from corpus import deck
+    from PySide6.QtWidgets import QApplication
+
+    from pdfpc_pyqt6.config import config
+    from pdfpc_pyqt6.core.disk_cache import parse_frame_key
+    from pdfpc_pyqt6.core.latency_monitor import latency_monitor
+    from pdfpc_pyqt6.ui.main_window import MainWindow
+
+    app = QApplication.instance()
+    config.CACHE_DIR = Path(tempfile.mkdtemp(dir=work_dir, prefix="cache-"))
+    pages = args.prefetch_pages
+    pdf_path = deck(work_dir, "text", pages)
+
+    window = MainWindow()
+    window.show()
+    window._load_pdf(str(pdf_path))
+    pump_events(app, 30.0, lambda: window.state.is_pdf_loaded)
+    window.state.set_view_mode(config.VIEW_MODE_PRESENTER)
+    pump_events(app, 1.0)
+    pool = window.render_thread_pool
+    renders = []
+    pool.renderFinished.connect(lambda page_idx, _key: renders.append(page_idx))
+
+    def jump(page_idx: int) -> None:
+        latency_monitor.mark_input(page_idx)
+        window.state.set_current_page(page_idx)
+
+    def forward() -> None:
+        for _ in range(min(40, pages - 1)):
+            window.next_page()
+            pump_events(app, args.turn_interval)
+
+    def agenda() -> None:
+        for section in range(1, 6):
+            jump(1)
+            pump_events(app, 1.0)
+            jump(section * pages // 6)
+            pump_events(app, 1.0)
+            for _ in range(3):
+                window.next_page()
+                pump_events(app, 1.0)
+
+    results = {}
+    for name, navigate in (("forward", forward), ("agenda", agenda)):
+        jump(0)
+        pool.predictor.reset()
+        pump_events(app, 1.0)
+        latency_monitor.clear()
+        renders.clear()
+        navigate()
+
+        samples = {"hit": 0, "miss": 0}
+        miss_p95 = 0.0
+        for kinds in latency_monitor.summary().values():
+            for kind, stats in kinds.items():
+                samples[kind] += stats["count"]
+                if kind == "miss":
+                    miss_p95 = max(miss_p95, stats["p95_ms"])
+        image_cache = window.pdf_processor.image_cache
+        thumbnail = "fit{}x{}".format(*pool._thumbnail_size)
+        resident = [
+            parse_frame_key(os.path.basename(key)) for key in image_cache.keys()
+        ]
+        results[name] = {
+            "hit_rate": round(samples["hit"] / max(1, sum(samples.values())), 3),
+            "miss_p95_ms": miss_p95,
+            "renders": len(renders),
+            "pending": pool.scheduler.pending_count(),
+            "resident_slides": len(
+                {page for page, size, _ in filter(None, resident) if size != thumbnail}
+            ),
+            "resident_mb": round(image_cache.stats()["bytes"] / 2**20, 1),
+        }
+
+    window.close()
+    app.processEvents()
+    return results
+
+
+def bench_render_budget(args, work_dir: Path) -> dict:
+    """
+    Latency of the current slide when jumping around a deck right after
+    opening it, while the rest of the deck renders in the background, with
+    foreground/background budgeting and without it (no reserved thread, no
+    pause while navigating)
+    """
+    import random
+
+    from corpus import deck
+    from PySide6.QtWidgets import QApplication
+
+    from pdfpc_pyqt6.config import config
+    from pdfpc_pyqt6.core.latency_monitor import latency_monitor
+    from pdfpc_pyqt6.ui.main_window import MainWindow
+
+    app = QApplication.instance()
+    pdf_path = deck(work_dir, "vector", args.pages)
+    defaults = (config.RENDER_FOREGROUND_THREADS, config.RENDER_BACKGROUND_IDLE_MS)
+
+    results = {}
+    for mode, budget in (("budgeted", defaults), ("unbudgeted", (0, 0))):
+        config.RENDER_FOREGROUND_THREADS, config.RENDER_BACKGROUND_IDLE_MS = budget
+        config.CACHE_DIR = Path(tempfile.mkdtemp(dir=work_dir, prefix="cache-"))
+        window = MainWindow()
+        window.show()
+        window._load_pdf(str(pdf_path))
+        pump_events(app, 30.0, lambda: window.state.is_pdf_loaded)
+        window.state.set_view_mode(config.VIEW_MODE_PRESENTER)
+        pump_events(app, 0.5)
+        latency_monitor.clear()
+
+        # The same jumps in both modes, each followed by two page turns
+        jumps = random.Random(0)
+        for _ in range(8):
+            page_idx = jumps.randrange(args.pages)
+            latency_monitor.mark_input(page_idx)
+            window.state.set_current_page(page_idx)
+            pump_events(app, 0.4)
+            for _ in range(2):
+                window.next_page()
+                pump_events(app, 0.4)
+
+        current = latency_monitor.summary().get("presenter.current", {})
+        for stats in current.values():
+            del stats["histogram"]
+        results[mode] = current
+        window.close()
+        app.processEvents()
+
+    config.RENDER_FOREGROUND_THREADS, config.RENDER_BACKGROUND_IDLE_MS = defaults
+    return results
+
+
+def bench_display_lists(args, work_dir: Path) -> dict:
+    """
+    Rasterization time per frame with and without cached display lists:
+    every page at the sizes of the overview, presenter and projector, then
+    again at new sizes as after a window resize. Frames are rasterized
+    directly, without the image or disk cache.
+    """
+    from corpus import deck
+
+    from pdfpc_pyqt6.config import config
+    from pdfpc_pyqt6.core.pdf_processor import PDFProcessor
+
+    pdf_path = deck(work_dir, "vector", args.pages)
+    targets = (((200, 150), None), ((1034, 424), None), ((1920, 1080), None))
+    resized = (((1188, 488), None), ((300, 800), (0.0, 0.0, 0.5, 1.0)))
+    default_pages = config.DISPLAY_LIST_CACHE_PAGES
+
+    results = {}
+    for mode, cache_pages in (("cached", max(default_pages, 1)), ("uncached", 0)):
+        config.DISPLAY_LIST_CACHE_PAGES = cache_pages
+        config.CACHE_DIR = Path(tempfile.mkdtemp(dir=work_dir, prefix="cache-"))
+        processor = PDFProcessor()
+        processor.load_pdf(str(pdf_path))
+        page_count = processor.get_page_count()
+
+        results[mode] = {}
+        for phase, sizes in (("targets", targets), ("resize", resized)):
+            start = time.perf_counter()
+            for page_idx in range(page_count):
+                for size, clip in sizes:
+                    processor._rasterize(page_idx, processor._scale, size, clip)
+            elapsed = time.perf_counter() - start
+            frames = page_count * len(sizes)
+            results[mode][phase] = {
+                "frames": frames,
+                "ms_per_frame": round(elapsed * 1000 / frames, 2),
+            }
+        processor.close()
+
+    config.DISPLAY_LIST_CACHE_PAGES = default_pages
+    return results
+
+
+def run_one(name: str, args) -> dict:
+    """Run a single benchmark in this process"""
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory(prefix="pdfpc-suite-") as work_dir:
+        start = time.perf_counter()
+        results = globals()[f"bench_{name}"](args, Path(work_dir))
+        return {
+            "results": results,
+            "wall_seconds": round(time.perf_counter() - start, 3),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "qt_platform": app.platformName(),
+        }
+
+
+def environment() -> dict:
+    """Versions and machine details recorded with the results"""
+    import fitz
+    from PySide6 import QtCore
+
+    from pdfpc_pyqt6 import __version__
+
+    return {
+        "pdfpc_version": __version__,
+        "python": platform.python_version(),
+        "pyside6": QtCore.__version__,
+        "qt": QtCore.qVersion(),
+        "pymupdf": fitz.VersionBind,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def print_table(name: str, result: dict) -> None:
+    """Print one benchmark's results"""
+    print(
+        f"\n{name}  ({result['wall_seconds']}s, peak RSS {result['peak_rss_mb']} MiB)"
+    )
+    for key, values in result["results"].items():
+        if all(isinstance(v, dict) for v in values.values()):
+            for sub, stats in values.items():
+                cells = " ".join(f"{k}={v}" for k, v in stats.items())
+                print(f"  {key:<20} {sub:<6} {cells}")
+        else:
+            cells = " ".join(f"{k}={v}" for k, v in values.items())
+            print(f"  {key:<27} {cells}")
+
+
+def parse_list(text: str, cast):
+    return [cast(item) for item in text.split(",") if item]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help="benchmarks")
+    parser.add_argument("--quick", action="store_true", help="small sizes, for CI")
+    parser.add_argument("--pages", type=int, default=30, help="vector deck size")
+    parser.add_argument("--scales", default="1,1.5,2,3", help="render scales")
+    parser.add_argument("--threads", default="1,2,4", help="pool thread counts")
+    parser.add_argument("--scale", type=float, default=2.0, help="pool render scale")
+    parser.add_argument("--backend", choices=("thread", "process"), default="thread")
+    parser.add_argument(
+        "--overview-pages", default="100,1000,5000", help="overview page counts"
+    )
+    parser.add_argument(
+        "--prefetch-pages", type=int, default=400, help="prefetch deck size"
+    )
+    parser.add_argument(
+        "--turn-interval", type=float, default=0.15, help="prefetch seconds per turn"
+    )
+    parser.add_argument("--run", help=argparse.SUPPRESS)  # Child process mode
+    args = parser.parse_args()
+
+    if args.quick:
+        args.pages = 8
+        args.scales = "1,2"
+        args.threads = "1,2"
+        args.overview_pages = "100,1000"
+        args.prefetch_pages = 150
+    args.scales = parse_list(args.scales, float)
+    args.threads = parse_list(args.threads, int)
+    args.overview_pages = parse_list(args.overview_pages, int)
+
+    if args.run:
+        print(json.dumps(run_one(args.run, args)))
+        return 0
+
+    names = parse_list(args.only, str)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    report = {"environment": environment(), "benchmarks": {}}
+    # Children get the resolved sizes, so --quick is applied once here
+    child_args = [
+        f"--pages={args.pages}",
+        f"--scales={','.join(f'{s:g}' for s in args.scales)}",
+        f"--threads={','.join(str(t) for t in args.threads)}",
+        f"--scale={args.scale:g}",
+        f"--backend={args.backend}",
+        f"--overview-pages={','.join(str(p) for p in args.overview_pages)}",
+        f"--prefetch-pages={args.prefetch_pages}",
+        f"--turn-interval={args.turn_interval:g}",
+    ]
+
+    failed = False
+    for name in names:
+        proc = subprocess.run(
+            [sys.executable, __file__, *child_args, "--run", name],
+            capture_output=True,
+            text=True,
+        )
+        lines = proc.stdout.strip().splitlines()
+        if proc.returncode != 0 or not lines:
+            failed = True
+            report["benchmarks"][name] = {"error": proc.stderr.strip()[-2000:]}
+            print(f"\n{name}  FAILED\n{proc.stderr.strip()[-2000:]}")
+            continue
+        result = json.loads(lines[-1])
+        report["benchmarks"][name] = result
+        print_table(name, result)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nResults written to {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Command-line tool to inspect and trim the on-disk page cache.
+
+Usage:
+    pdfpc-pyqt6-cache info [--frames]
+    pdfpc-pyqt6-cache trim [--max-mb MB]
+    pdfpc-pyqt6-cache clear
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from .config import config
+from .core.disk_cache import CacheEntry, DiskCache
+
+MIB = 1024 * 1024
+
+
+def _format_time(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+
+def show_info(cache: DiskCache, frames: bool) -> None:
+    """Print cache usage per document, and optionally every frame"""
+    entries = cache.entries()
+    documents: Dict[str, List[CacheEntry]] = {}
+    for entry in entries:
+        documents.setdefault(entry.document, []).append(entry)
+
+    total = sum(entry.bytes for entry in entries)
+    print(f"Cache directory: {cache.cache_dir}")
+    print(
+        f"Used {total / MIB:.1f} MiB of {config.MAX_DISK_CACHE_BYTES / MIB:.0f} MiB "
+        f"in {len(entries)} frames of {len(documents)} documents"
+    )
+    if not documents:
+        return
+
+    print(f"\n{'document':<12} {'frames':>6} {'MiB':>8}  {'last used':<16}  source")
+    by_recency = sorted(
+        documents.items(),
+        key=lambda item: max(entry.last_access for entry in item[1]),
+        reverse=True,
+    )
+    for document, doc_entries in by_recency:
+        size = sum(entry.bytes for entry in doc_entries)
+        last_used = max(entry.last_access for entry in doc_entries)
+        print(
+            f"{document[:12]:<12} {len(doc_entries):>6} {size / MIB:>8.1f}  "
+            f"{_format_time(last_used):<16}  {doc_entries[0].source}"
+        )
+
+    if frames:
+        print(
+            f"\n{'document':<12} {'page':>5} {'size':<24} {'codec':<5} "
+            f"{'KiB':>8}  last used"
+        )
+        for entry in sorted(entries, key=lambda e: (e.document, e.page, e.size)):
+            print(
+                f"{entry.document[:12]:<12} {entry.page + 1:>5} {entry.size:<24} "
+                f"{entry.codec:<5} {entry.bytes / 1024:>8.1f}  "
+                f"{_format_time(entry.last_access)}"
+            )
+
+
+def main(argv=None) -> int:
+    """Cache tool entry point"""
+    parser = argparse.ArgumentParser(
+        prog="pdfpc-pyqt6-cache", description=__doc__.splitlines()[1]
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=config.CACHE_DIR, help="cache directory"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    info = commands.add_parser("info", help="show cache usage per document")
+    info.add_argument("--frames", action="store_true", help="list every frame")
+    trim = commands.add_parser("trim", help="evict least recently used frames")
+    trim.add_argument(
+        "--max-mb",
+        type=float,
+        default=config.MAX_DISK_CACHE_BYTES / MIB,
+        help="size to trim the cache to (default: the configured budget)",
+    )
+    commands.add_parser("clear", help="delete the whole cache")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    cache = DiskCache(args.cache_dir)
+
+    if args.command == "info":
+        show_info(cache, args.frames)
+    elif args.command == "trim":
+        evicted, freed = cache.trim(int(args.max_mb * MIB))
+        print(f"Evicted {evicted} frames, freed {freed / MIB:.1f} MiB")
+    elif args.command == "clear":
+        cache.clear()
+        print(f"Cleared {cache.cache_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,7 @@ Configuration constants for PDF Presenter Console
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 
 @dataclass
@@ -15,10 +15,52 @@ class Config:
     DEFAULT_SCALE: float = 2.0
     MAX_RENDER_THREADS: int = 4
     ENABLE_RENDER_CACHE: bool = True
+    RENDER_BACKEND: str = "thread"  # "thread" or "process"
+    RENDER_PROCESSES: int = 0  # Worker processes for "process"; 0 = CPU count
+    RENDER_PAGE_TIMEOUT: float = 10.0  # Seconds before a worker process is killed
+    PROGRESSIVE_RENDERING: bool = True  # Show a low-res draft before the frame
+    DRAFT_RENDER_FACTOR: float = 0.25  # Draft size relative to the final frame
+    # Time the first slide of a newly opened PDF gets to itself before the
+    # rest of the document is queued
+    FIRST_PAGE_BUDGET_MS: int = 500
+    # Pages whose MuPDF display list each render thread keeps, so rendering
+    # them again at another size or clip skips interpreting the page (a few
+    # hundred KB each for vector-heavy slides); 0 disables the cache
+    DISPLAY_LIST_CACHE_PAGES: int = 32
+    # Render threads kept free of background work (overview thumbnails and
+    # pages outside the prefetch window), so the slide being navigated to
+    # never waits for a whole batch of it
+    RENDER_FOREGROUND_THREADS: int = 1
+    # Background rendering pauses while pages are being turned and resumes
+    # this long after the last turn; 0 never pauses it
+    RENDER_BACKGROUND_IDLE_MS: int = 750
+    # Prefetch window: pages rendered ahead of the current one in the
+    # direction of travel and behind it; decoded frames of pages outside the
+    # window are evicted from memory
+    PREFETCH_AHEAD: int = 3
+    PREFETCH_BEHIND: int = 1
+    PREFETCH_MAX_AHEAD: int = 12  # Look-ahead when paging through quickly
+    PREFETCH_FAST_TURN_S: float = 1.0  # Page turns this close count as quick
+    PREFETCH_JUMP_TARGETS: int = 3  # Recent jump targets kept in the window
+    # Decks up to this many pages are still rendered completely
+    PREFETCH_WHOLE_DOCUMENT_PAGES: int = 100
 
     # Image Cache
+    # Created on the first cache write, so importing the config stays cheap
     CACHE_DIR: Path = Path.home() / ".cache" / "pdfpc-pyqt6" / "page_cache"
     MAX_MEMORY_CACHE_PAGES: int = 50  # Maximum pages to keep in memory
+    MAX_MEMORY_CACHE_BYTES: int = 512 * 1024 * 1024  # Decoded image budget
+    # On-disk frame format: "raw" (uncompressed, large), "lz4" (compressed
+    # raw frames; needs the optional lz4 package) or "png" (slow to decode)
+    CACHE_CODEC: str = "raw"
+    # Disk cache budget across all documents; least recently used frames
+    # are evicted in the background when it is exceeded
+    MAX_DISK_CACHE_BYTES: int = 2 * 1024 * 1024 * 1024
+
+    # Presenter view: Beamer-style notes pages carry the speaker notes on
+    # one side of the page
+    NOTES_SIDE: str = "left"  # "left" or "right"
+    NOTES_SPLIT_RATIO: float = 0.5  # Fraction of the page width for notes
 
     # UI
     DEFAULT_WINDOW_WIDTH: int = 1600
@@ -31,6 +73,10 @@ class Config:
     VIEW_MODE_OVERVIEW = "OVERVIEW"
     VIEW_MODE_PRESENTER = "PRESENTER"
 
+    # Diagnostics
+    # JSON file the keypress-to-paint latency histogram is written to at exit
+    LATENCY_REPORT_PATH: Optional[Path] = None
+
     # Keyboard Shortcuts
     KEYBOARD_SHORTCUTS: Dict[str, str] = None  # Will be populated at runtime
 
@@ -46,11 +92,9 @@ class Config:
                 "presenter_mode": "P",
                 "toggle_fullscreen": "F",
                 "goto_page": "G",
+                "latency_report": "Ctrl+Shift+L",
             }
 
-        # Ensure cache directory exists
-        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
 
 # Global config instance
 config = Config()
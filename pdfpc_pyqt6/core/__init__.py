@@ -1,7 +1,20 @@
 """Core modules for PDF processing and state management"""
 
-from .pdf_processor import PDFProcessor
-from .state_manager import AppState
-from .threading_manager import RenderThreadPool
+import importlib
 
-__all__ = ["AppState", "PDFProcessor", "RenderThreadPool"]
+# Exported names and their modules, imported on first access so that
+# importing one core module does not import them all
+_EXPORTS = {
+    "AppState": ".state_manager",
+    "ImageCache": ".image_cache",
+    "PDFProcessor": ".pdf_processor",
+    "RenderThreadPool": ".threading_manager",
+}
+
+__all__ = ["AppState", "ImageCache", "PDFProcessor", "RenderThreadPool"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,195 @@
+"""
+The on-disk page cache as a whole: every document's frame pack, with
+usage accounting and LRU eviction against a disk budget
+"""
+
+import logging
+import os
+import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .frame_pack import INDEX_FILENAME, FramePack
+from .frame_pack import record_size
+
+logger = logging.getLogger(__name__)
+
+# Frame keys: page_<index>_<size>_rgb_annots_v<version>.<codec>
+FRAME_KEY_RE = re.compile(r"^page_(\d+)_(.+)_rgb_annots_v\d+\.(\w+)$")
+
+# Document directories are named by the PDF's fingerprint (see
+# document_fingerprint); anything else under the cache directory is left alone
+FINGERPRINT_RE = re.compile(r"^[0-9a-f]{32}$")
+
+# Frames stored one file per frame, before documents had a frame pack
+LEGACY_FRAME_RE = re.compile(r"^page_\d+_.+\.(png|raw|lz4)$")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """One cached frame, as listed by DiskCache.entries()"""
+
+    document: str  # Fingerprint of the PDF
+    source: str  # Path the PDF was opened from
+    key: str
+    page: int
+    size: str  # Render size, e.g. "2x" or "fit1920x1080", plus any clip
+    codec: str
+    bytes: int
+    last_access: float  # Epoch time
+
+
+def parse_frame_key(key: str) -> Optional[Tuple[int, str, str]]:
+    """Split a frame key into (page index, size, codec), or None"""
+    match = FRAME_KEY_RE.match(key)
+    if match is None:
+        return None
+    return int(match.group(1)), match.group(2), match.group(3)
+
+
+class DiskCache:
+    """
+    All frame packs under a cache directory, one per document.
+
+    Each pack's index records every frame's size and last access, so the
+    cache can be listed and trimmed by reading one small index per document,
+    without touching the frames. trim() evicts least recently used frames
+    across all documents until the cache fits a budget; packs are compacted
+    and documents that lose every frame are deleted.
+
+    The loaded document's live FramePack can be passed in, so its in-memory
+    access times count and its frames are compacted through it.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _pack_dirs(self) -> List[Path]:
+        """Document directories under the cache directory"""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.is_dir() and FINGERPRINT_RE.match(entry.name)
+                ]
+        except OSError:
+            return []
+
+    def _packs(self, live_pack: Optional[FramePack] = None) -> List[FramePack]:
+        """Open every document's frame pack, using live_pack for its document"""
+        packs = []
+        for directory in self._pack_dirs():
+            if live_pack is not None and directory == live_pack.directory:
+                packs.append(live_pack)
+            elif (directory / INDEX_FILENAME).exists():
+                packs.append(FramePack(directory))
+        return packs
+
+    def entries(self, live_pack: Optional[FramePack] = None) -> List[CacheEntry]:
+        """List every cached frame"""
+        result = []
+        for pack in self._packs(live_pack):
+            for key, entry in pack.entries().items():
+                parsed = parse_frame_key(key)
+                page, size, codec = parsed if parsed else (-1, "?", "?")
+                result.append(
+                    CacheEntry(
+                        document=pack.directory.name,
+                        source=pack.source or "",
+                        key=key,
+                        page=page,
+                        size=size,
+                        codec=codec,
+                        bytes=record_size(key, entry.length),
+                        last_access=entry.last_access,
+                    )
+                )
+        return result
+
+    def usage(self, live_pack: Optional[FramePack] = None) -> int:
+        """Total bytes of all cached frames"""
+        return sum(pack.total_bytes() for pack in self._packs(live_pack))
+
+    def trim(
+        self, max_bytes: int, live_pack: Optional[FramePack] = None
+    ) -> Tuple[int, int]:
+        """
+        Evict least recently used frames until the cache fits max_bytes.
+        Frames of live_pack used since it was opened are never evicted, so
+        the deck being presented keeps its cache even over budget. Files of
+        older cache layouts are removed too.
+        Returns (frames evicted, bytes freed).
+        """
+        packs = self._packs(live_pack)
+        freed = self._remove_stray_files(packs)
+
+        candidates = []
+        total = 0
+        for pack in packs:
+            protect_since = pack.opened_at if pack is live_pack else None
+            for key, entry in pack.entries().items():
+                size = record_size(key, entry.length)
+                total += size
+                if protect_since is None or entry.last_access < protect_since:
+                    candidates.append((entry.last_access, size, key, pack))
+
+        drops: Dict[FramePack, List[str]] = {}
+        candidates.sort(key=lambda candidate: candidate[0])
+        for _, size, key, pack in candidates:
+            if total <= max_bytes:
+                break
+            drops.setdefault(pack, []).append(key)
+            total -= size
+
+        evicted = 0
+        for pack, keys in drops.items():
+            try:
+                freed += pack.compact(keys)
+                evicted += len(keys)
+            except OSError as e:
+                logger.error(f"Failed to compact frame pack {pack.pack_path}: {e}")
+
+        if total > max_bytes:
+            logger.info(
+                f"Disk cache is {total / 2**20:.0f} MiB after trimming, over its "
+                f"{max_bytes / 2**20:.0f} MiB budget with frames in use"
+            )
+        if evicted:
+            logger.info(
+                f"Evicted {evicted} frames ({freed / 2**20:.1f} MiB) from the disk cache"
+            )
+        return evicted, freed
+
+    def _remove_stray_files(self, packs: List[FramePack]) -> int:
+        """
+        Delete frames an older cache layout stored one file per frame in a
+        document directory. Other files are never touched, and a document
+        directory without a frame pack is removed only if that leaves it
+        empty.
+        """
+        freed = 0
+        for directory in self._pack_dirs():
+            try:
+                with os.scandir(directory) as entries:
+                    stray = [
+                        entry
+                        for entry in entries
+                        if entry.is_file() and LEGACY_FRAME_RE.match(entry.name)
+                    ]
+                for entry in stray:
+                    freed += entry.stat().st_size
+                    os.unlink(entry.path)
+                if not any(pack.directory == directory for pack in packs):
+                    directory.rmdir()  # Only succeeds when nothing is left
+            except OSError:
+                pass
+        return freed
+
+    def clear(self) -> None:
+        """Delete the whole cache"""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,73 @@
+"""
+Cache of MuPDF display lists, so a page is interpreted once and every later
+rasterization at another size or clip only replays it
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class DisplayListCache:
+    """
+    LRU cache of the fitz.DisplayList objects built from one document
+    handle, keyed by page index.
+
+    Rasterizing a page parses and interprets its content stream into a
+    display list and then draws that; this cache keeps the list, so a
+    page rendered again at another size (thumbnail, presenter panes,
+    projector, a resized window) skips straight to drawing. Replaying a
+    list gives exactly the pixels of rendering the page.
+
+    A display list refers to resources of the document it was built from,
+    so a cache belongs to a single document handle: it is only used by the
+    thread holding that handle and is cleared before the handle's document
+    is closed. It is therefore not thread-safe.
+
+    PyMuPDF does not report how much memory a list takes (a few hundred
+    KB for a vector-heavy slide), so the budget is a number of pages.
+    """
+
+    def __init__(self, max_pages: int):
+        self._max_pages = max_pages
+        self._lists: "OrderedDict[int, object]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, page_index: int, build: Callable[[], object]):
+        """Get the display list of a page, building it with build() on a miss"""
+        display_list = self._lists.get(page_index)
+        if display_list is not None:
+            self._lists.move_to_end(page_index)
+            self.hits += 1
+            return display_list
+
+        self.misses += 1
+        display_list = build()
+        if self._max_pages <= 0:
+            return display_list
+
+        self._lists[page_index] = display_list
+        while len(self._lists) > self._max_pages:
+            evicted, _ = self._lists.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"Evicted display list of page {evicted}")
+        return display_list
+
+    def clear(self) -> None:
+        """Drop all display lists"""
+        self._lists.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters and usage"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "pages": len(self._lists),
+            "max_pages": self._max_pages,
+        }
@@ -0,0 +1,106 @@
+"""
+Opening PDF documents off the GUI thread
+"""
+
+import logging
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool
+from PySide6.QtCore import Signal as pyqtSignal
+
+from .pdf_processor import OpenedDocument, PDFProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class _OpenWorker(QRunnable):
+    """Opens one document and reports back through callbacks"""
+
+    def __init__(self, pdf_path: str, ticket: int, on_opened, on_failed):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.ticket = ticket
+        self.on_opened = on_opened
+        self.on_failed = on_failed
+
+    def run(self):
+        try:
+            opened = PDFProcessor.open_document(self.pdf_path)
+        except ImportError:
+            self.on_failed(
+                self.ticket, "PyMuPDF not available. Install: pip install PyMuPDF"
+            )
+        except Exception as e:
+            logger.error(f"Failed to open {self.pdf_path}: {e}")
+            self.on_failed(self.ticket, f"Failed to load PDF: {e}")
+        else:
+            self.on_opened(self.ticket, opened)
+
+
+class DocumentLoader(QObject):
+    """
+    Opens PDFs on a background thread so parsing a large file, or reading
+    it from a slow disk, never freezes the window.
+
+    Only the most recent open() counts: opening another file while one is
+    still loading supersedes it, and the superseded document is closed
+    when it arrives instead of being delivered.
+    """
+
+    opened = pyqtSignal(object)  # OpenedDocument, on the GUI thread
+    failed = pyqtSignal(str)  # error message
+
+    # Worker results, delivered to the GUI thread through queued connections
+    _workerOpened = pyqtSignal(int, object)  # (ticket, OpenedDocument)
+    _workerFailed = pyqtSignal(int, str)  # (ticket, error message)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thread_pool = QThreadPool()
+        self._thread_pool.setMaxThreadCount(1)
+        self._ticket = 0
+        self._loading = False
+
+        self._workerOpened.connect(self._on_worker_opened)
+        self._workerFailed.connect(self._on_worker_failed)
+
+    def open(self, pdf_path: str) -> None:
+        """Start opening a PDF; opened or failed is emitted when done"""
+        self._ticket += 1
+        self._loading = True
+        logger.info(f"Opening {pdf_path} in the background")
+        self._thread_pool.start(
+            _OpenWorker(
+                pdf_path,
+                self._ticket,
+                self._workerOpened.emit,
+                self._workerFailed.emit,
+            )
+        )
+
+    def cancel(self) -> None:
+        """Drop the document being opened, if any"""
+        self._ticket += 1
+        self._loading = False
+
+    def is_loading(self) -> bool:
+        """Whether a document is being opened"""
+        return self._loading
+
+    def shutdown(self, timeout_ms: int = 2000) -> None:
+        """Cancel loading and wait (bounded) for the open in progress"""
+        self.cancel()
+        self._thread_pool.waitForDone(timeout_ms)
+
+    def _on_worker_opened(self, ticket: int, opened: OpenedDocument) -> None:
+        if ticket != self._ticket:
+            logger.debug(f"Discarding superseded document {opened.pdf_path}")
+            opened.close()
+            return
+        self._loading = False
+        self.opened.emit(opened)
+
+    def _on_worker_failed(self, ticket: int, error_msg: str) -> None:
+        if ticket != self._ticket:
+            return
+        self._loading = False
+        self.failed.emit(error_msg)
@@ -0,0 +1,129 @@
+"""
+Per-thread PDF document handles for parallel rendering
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from .display_list_cache import DisplayListCache
+from .mupdf import load_fitz
+
+logger = logging.getLogger(__name__)
+
+
+class _DocumentHandle:
+    """A document opened for a single thread, with its pages' display lists"""
+
+    def __init__(self, document, generation: int, max_display_lists: int):
+        self.document = document
+        self.generation = generation
+        self.display_lists = DisplayListCache(max_display_lists)
+        self.busy = False
+        self.retired = False
+
+    def close(self) -> None:
+        """Drop the display lists, then the document they were built from"""
+        self.display_lists.clear()
+        self.document.close()
+
+
+class DocumentPool:
+    """
+    Hands every render thread its own independently opened fitz.Document.
+
+    MuPDF documents must not be used from several threads at once, and a
+    single shared document serializes all rendering. Handles are opened
+    lazily on a thread's first render and closed when the document changes;
+    a handle that is in use at that moment is closed by its thread as soon
+    as the render finishes.
+
+    Every handle keeps the display lists of the last max_display_lists
+    pages its thread rendered (see DisplayListCache); 0 disables them. Lists
+    are never shared between threads and go away with their handle.
+    """
+
+    def __init__(self, max_display_lists: int = 0):
+        self._lock = threading.Lock()
+        self._handles: Dict[int, _DocumentHandle] = {}  # {thread_id: handle}
+        self._pdf_path: Optional[str] = None
+        self._generation = 0
+        self._max_display_lists = max_display_lists
+
+    def reset(self, pdf_path: Optional[str]) -> None:
+        """Switch to a new document (or none), retiring all open handles"""
+        with self._lock:
+            self._pdf_path = pdf_path
+            self._generation += 1
+            handles, self._handles = self._handles, {}
+            for handle in handles.values():
+                handle.retired = True
+                if not handle.busy:
+                    handle.close()
+
+        logger.debug(f"Document pool reset to {pdf_path}, retired {len(handles)}")
+
+    @contextmanager
+    def acquire(self):
+        """Get the calling thread's document, opening it if needed"""
+        with self._acquire_handle() as handle:
+            yield handle.document
+
+    @contextmanager
+    def _acquire_handle(self):
+        """Get the calling thread's document handle, opening it if needed"""
+        handle = self._get_handle()
+        try:
+            yield handle
+        finally:
+            with self._lock:
+                handle.busy = False
+                if handle.retired:
+                    handle.close()
+
+    @contextmanager
+    def acquire_page(self, page_index: int):
+        """
+        Get something to rasterize a page from: its display list from the
+        calling thread's document handle, interpreted on a miss
+        """
+        with self._acquire_handle() as handle:
+            yield handle.display_lists.get(
+                page_index, lambda: handle.document[page_index].get_displaylist()
+            )
+
+    def _get_handle(self) -> _DocumentHandle:
+        """Get or lazily open the handle for the calling thread, marked busy"""
+        thread_id = threading.get_ident()
+        with self._lock:
+            handle = self._handles.get(thread_id)
+            if handle is not None:
+                handle.busy = True
+                return handle
+            pdf_path = self._pdf_path
+            generation = self._generation
+
+        if pdf_path is None:
+            raise RuntimeError("No PDF document loaded")
+
+        fitz = load_fitz()
+
+        document = fitz.open(pdf_path)
+        handle = _DocumentHandle(document, generation, self._max_display_lists)
+        handle.busy = True
+
+        with self._lock:
+            if generation != self._generation:
+                # The document changed while this one was being opened
+                document.close()
+                raise RuntimeError("PDF document changed while opening")
+            self._handles[thread_id] = handle
+
+        logger.debug(f"Opened document handle for thread {thread_id}: {pdf_path}")
+        return handle
+
+    def handle_count(self) -> int:
+        """Number of currently open handles"""
+        with self._lock:
+            return len(self._handles)
@@ -0,0 +1,179 @@
+"""
+Codecs for page frames stored in the on-disk cache
+"""
+
+import logging
+import struct
+from pathlib import Path
+from typing import Dict, Optional
+
+from PySide6.QtGui import QImage
+
+logger = logging.getLogger(__name__)
+
+# Header of raw frames: magic, width, height, stride, channels
+RAW_MAGIC = b"PDFPCRW1"
+RAW_HEADER = struct.Struct("<8sIIII")
+
+
+def raw_frame_bytes(pix) -> bytes:
+    """Serialize a pixmap (or SharedFrame) as a raw frame: header + samples"""
+    header = RAW_HEADER.pack(RAW_MAGIC, pix.width, pix.height, pix.stride, pix.n)
+    return header + bytes(pix.samples_mv)
+
+
+def decode_raw_frame(buffer) -> Optional[QImage]:
+    """
+    Wrap a raw frame in a QImage without copying the samples.
+    buffer may be bytes, a bytearray or a memoryview (e.g. into an mmap); it
+    is kept alive on the image. Returns None if the frame is malformed.
+    """
+    view = memoryview(buffer)
+    if len(view) < RAW_HEADER.size:
+        return None
+    magic, width, height, stride, channels = RAW_HEADER.unpack_from(view)
+    end = RAW_HEADER.size + stride * height
+    if magic != RAW_MAGIC or len(view) < end or channels not in (3, 4):
+        return None
+
+    if channels == 4:
+        image_format = QImage.Format.Format_RGBA8888
+    else:
+        image_format = QImage.Format.Format_RGB888
+    samples = view[RAW_HEADER.size : end]
+    image = QImage(samples, width, height, stride, image_format)
+    image._frame_buffer = samples
+    return image
+
+
+class FrameCodec:
+    """
+    Encodes rendered pixmaps for the disk cache and decodes them back.
+    The codec name is part of every cache key, so frames written by
+    different codecs never collide.
+    """
+
+    name = ""
+
+    def is_available(self) -> bool:
+        return True
+
+    def encode(self, pix) -> bytes:
+        """Encode a fitz.Pixmap (or SharedFrame)"""
+        raise NotImplementedError
+
+    def decode(self, buffer) -> Optional[QImage]:
+        """
+        Decode an encoded frame from a bytes-like buffer (e.g. a memoryview
+        into a mapped frame pack), or None if it cannot be decoded
+        """
+        raise NotImplementedError
+
+    def write(self, path: str, pix) -> None:
+        """Write an encoded frame to a file"""
+        with open(path, "wb") as f:
+            f.write(self.encode(pix))
+
+    def read(self, path: str) -> Optional[QImage]:
+        """Decode a frame file, or None if it cannot be read"""
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            return None
+        return self.decode(data)
+
+
+class PngCodec(FrameCodec):
+    """Compact, but deflate makes writing and inflate makes reading slow"""
+
+    name = "png"
+
+    def encode(self, pix) -> bytes:
+        return pix.tobytes(output="png")
+
+    def decode(self, buffer) -> Optional[QImage]:
+        image = QImage.fromData(bytes(buffer), "PNG")
+        if image.isNull():
+            return None
+        return image
+
+
+class RawCodec(FrameCodec):
+    """Uncompressed samples behind a small header; decoding copies nothing"""
+
+    name = "raw"
+
+    def encode(self, pix) -> bytes:
+        return raw_frame_bytes(pix)
+
+    def decode(self, buffer) -> Optional[QImage]:
+        return decode_raw_frame(buffer)
+
+    def write(self, path: str, pix) -> None:
+        # Skip the joined copy encode() makes
+        with open(path, "wb") as f:
+            f.write(
+                RAW_HEADER.pack(RAW_MAGIC, pix.width, pix.height, pix.stride, pix.n)
+            )
+            f.write(pix.samples_mv)
+
+
+class Lz4Codec(FrameCodec):
+    """Raw frames compressed with LZ4, which decompresses at memory speed"""
+
+    name = "lz4"
+    _available: Optional[bool] = None
+
+    def is_available(self) -> bool:
+        if self._available is None:
+            try:
+                import lz4.frame  # noqa: F401
+            except ImportError:
+                Lz4Codec._available = False
+            else:
+                Lz4Codec._available = True
+        return self._available
+
+    def encode(self, pix) -> bytes:
+        import lz4.frame
+
+        return lz4.frame.compress(raw_frame_bytes(pix))
+
+    def decode(self, buffer) -> Optional[QImage]:
+        import lz4.frame
+
+        try:
+            data = lz4.frame.decompress(buffer)
+        except RuntimeError:
+            return None
+        return decode_raw_frame(data)
+
+
+CODECS: Dict[str, FrameCodec] = {
+    codec.name: codec for codec in (PngCodec(), RawCodec(), Lz4Codec())
+}
+
+
+def get_codec(name: str) -> FrameCodec:
+    """Get a codec by name, falling back to raw if it is unknown or unavailable"""
+    codec = CODECS.get(name)
+    if codec is None:
+        logger.warning(f"Unknown cache codec {name!r}, using 'raw'")
+        return CODECS["raw"]
+    if not codec.is_available():
+        logger.warning(
+            f"Cache codec {name!r} is not available (is the {name} package "
+            f"installed?), using 'raw'"
+        )
+        return CODECS["raw"]
+    return codec
+
+
+def read_frame(path: str) -> Optional[QImage]:
+    """Decode a cache file with the codec its extension names"""
+    codec = CODECS.get(Path(path).suffix[1:])
+    if codec is None or not codec.is_available():
+        # Not a cache file, e.g. an image given directly
+        image = QImage(path)
+        return None if image.isNull() else image
+    return codec.read(path)
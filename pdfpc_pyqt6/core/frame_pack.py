@@ -0,0 +1,377 @@
+"""
+Per-document frame packs: every cached frame of a document in one file
+"""
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PACK_FILENAME = "frames.pack"
+INDEX_FILENAME = "frames.idx"
+LOCK_FILENAME = "frames.lock"
+
+# Pack record: header (magic, key length, data length), key, padding, data
+RECORD_MAGIC = b"PDFPCFR1"
+RECORD_HEADER = struct.Struct("<8sQQ")
+# Index: header (magic, source length) and the source PDF path, then
+# entries (record offset, data length, last access, key length) and keys
+INDEX_MAGIC = b"PDFPCIX1"
+INDEX_HEADER = struct.Struct("<8sH")
+INDEX_ENTRY = struct.Struct("<QQdH")
+# Records and their data start on this boundary, so mapped frames are aligned
+ALIGNMENT = 8
+
+
+def _padding(length: int) -> int:
+    return -length % ALIGNMENT
+
+
+def record_size(key: str, length: int) -> int:
+    """Bytes a frame of length bytes takes up in a pack, padding included"""
+    key_length = len(key.encode("utf-8"))
+    return (
+        RECORD_HEADER.size
+        + key_length
+        + _padding(key_length)
+        + length
+        + _padding(length)
+    )
+
+
+class FrameEntry(NamedTuple):
+    """Where a frame is in its pack, and when it was last used (epoch time)"""
+
+    offset: int
+    length: int
+    last_access: float
+
+
+class FramePack:
+    """
+    The disk cache of one document: frames are appended to a single pack
+    file and located through an index of {key: FrameEntry}.
+
+    The index file is read once when the pack is opened, so looking a frame
+    up is a dict lookup with no file system access. Frames are read through
+    a read-only mmap of the pack; decode_raw_frame() hands them to Qt as
+    views of the mapped memory, without copying or reading them up front.
+
+    Records are only ever appended, and compact() rewrites the pack into a
+    new file. A frame is written before its index entry, so a crash can
+    leave unreferenced bytes but never an entry pointing at a partial frame,
+    and every record repeats its key, which reads verify. Mappings are never
+    closed while a QImage may use them: a replaced or grown pack is mapped
+    again and the old mapping is released with its last view.
+
+    Access times are kept in memory and written back by save(). Thread-safe;
+    writers in other processes are serialized with a file lock where
+    available, and entries they add are seen when the pack is reopened.
+    """
+
+    def __init__(self, directory: Path, source: Optional[str] = None):
+        self.directory = Path(directory)
+        self.pack_path = self.directory / PACK_FILENAME
+        self.index_path = self.directory / INDEX_FILENAME
+        self.lock_path = self.directory / LOCK_FILENAME
+        self.source = source  # Path of the PDF, for cache listings
+        self.opened_at = time.time()
+        self._entries: Dict[str, FrameEntry] = {}
+        self._map: Optional[mmap.mmap] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        # Serializes writers; taken before _lock, together with the file lock
+        self._write_lock = threading.Lock()
+
+        entries = self._read_index()
+        if entries is not None:
+            self._entries = entries
+
+    def _read_index(self) -> Optional[Dict[str, FrameEntry]]:
+        """
+        Read the index file, skipping entries the pack does not hold.
+        Returns None if there is no index, and drops a pack whose index is
+        unreadable, since its frames can no longer be found.
+        """
+        try:
+            index = self.index_path.read_bytes()
+            pack_size = os.path.getsize(self.pack_path)
+        except OSError:
+            return None
+
+        if len(index) < INDEX_HEADER.size:
+            return {}  # Being created by another process
+        magic, source_length = INDEX_HEADER.unpack_from(index)
+        if magic != INDEX_MAGIC:
+            logger.warning(
+                f"Discarding frame pack with unknown index {self.index_path}"
+            )
+            for path in (self.index_path, self.pack_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            return None
+
+        position = INDEX_HEADER.size + source_length
+        source = index[INDEX_HEADER.size : position].decode("utf-8", "replace")
+        if self.source is None:
+            self.source = source
+
+        entries = {}
+        while position + INDEX_ENTRY.size <= len(index):
+            offset, length, last_access, key_length = INDEX_ENTRY.unpack_from(
+                index, position
+            )
+            position += INDEX_ENTRY.size
+            if position + key_length > len(index):
+                break  # Entry cut short by a crash
+            key = index[position : position + key_length].decode("utf-8", "replace")
+            position += key_length
+            if offset + record_size(key, length) <= pack_size:
+                entries[key] = FrameEntry(offset, length, last_access)
+
+        logger.debug(f"Loaded {len(entries)} frames from {self.index_path}")
+        return entries
+
+    def _index_header(self) -> bytes:
+        source = (self.source or "").encode("utf-8")[:0xFFFF]
+        return INDEX_HEADER.pack(INDEX_MAGIC, len(source)) + source
+
+    @staticmethod
+    def _index_entry(key: str, entry: FrameEntry) -> bytes:
+        key_bytes = key.encode("utf-8")
+        return (
+            INDEX_ENTRY.pack(
+                entry.offset, entry.length, entry.last_access, len(key_bytes)
+            )
+            + key_bytes
+        )
+
+    @contextmanager
+    def _file_lock(self):
+        """
+        Hold the pack's write locks: the in-process one and the lock file,
+        which compaction never replaces
+        """
+        with self._write_lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "ab") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def contains(self, key: str) -> bool:
+        """Check whether a frame is in the pack"""
+        with self._lock:
+            return key in self._entries
+
+    def keys(self) -> List[str]:
+        """Get the keys of all frames in the pack"""
+        with self._lock:
+            return list(self._entries)
+
+    def entries(self) -> Dict[str, FrameEntry]:
+        """Get a snapshot of the index"""
+        with self._lock:
+            return dict(self._entries)
+
+    def total_bytes(self) -> int:
+        """Bytes taken up by the indexed frames"""
+        with self._lock:
+            return sum(
+                record_size(key, entry.length) for key, entry in self._entries.items()
+            )
+
+    def append(self, key: str, data: bytes) -> None:
+        """Add an encoded frame. Raises OSError if it cannot be written."""
+        key_bytes = key.encode("utf-8")
+        with self._file_lock():
+            with open(self.pack_path, "ab") as pack:
+                offset = pack.seek(0, os.SEEK_END)
+                if offset % ALIGNMENT:
+                    # Left unaligned by a crash in another process
+                    offset += pack.write(bytes(_padding(offset)))
+                pack.write(RECORD_HEADER.pack(RECORD_MAGIC, len(key_bytes), len(data)))
+                pack.write(key_bytes + bytes(_padding(len(key_bytes))))
+                pack.write(data)
+                pack.write(bytes(_padding(len(data))))
+
+            entry = FrameEntry(offset, len(data), time.time())
+            with open(self.index_path, "ab") as index:
+                if index.tell() == 0:
+                    index.write(self._index_header())
+                index.write(self._index_entry(key, entry))
+            with self._lock:
+                self._entries[key] = entry
+
+    def read(self, key: str) -> Optional[memoryview]:
+        """
+        Get an encoded frame as a view of the mapped pack, or None if the
+        pack does not hold it. Counts as an access.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            key_bytes = key.encode("utf-8")
+            start = entry.offset + RECORD_HEADER.size + len(key_bytes)
+            start += _padding(len(key_bytes))
+
+            view = self._mapped_locked(start + entry.length)
+            if view is None:
+                return None
+            magic, key_length, length = RECORD_HEADER.unpack_from(view, entry.offset)
+            key_start = entry.offset + RECORD_HEADER.size
+            if (
+                magic != RECORD_MAGIC
+                or length != entry.length
+                or view[key_start : key_start + key_length] != key_bytes
+            ):
+                logger.warning(f"Dropping corrupt frame {key} in {self.pack_path}")
+                del self._entries[key]
+                return None
+
+            self._entries[key] = entry._replace(last_access=time.time())
+            self._dirty = True
+            return view[start : start + entry.length]
+
+    def _mapped_locked(self, end: int) -> Optional[memoryview]:
+        """Get a view of the pack mapping, mapping again if it ends before end"""
+        if self._map is None or len(self._map) < end:
+            try:
+                with open(self.pack_path, "rb") as pack:
+                    self._map = mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to map frame pack {self.pack_path}: {e}")
+                self._map = None
+                return None
+            if len(self._map) < end:
+                return None
+        return memoryview(self._map)
+
+    def _merged_entries_locked(self) -> Dict[str, FrameEntry]:
+        """
+        The index on disk, which has the entries of every process, with the
+        access times recorded in memory. Call with the file lock held.
+        """
+        entries = self._read_index() or {}
+        for key, entry in entries.items():
+            ours = self._entries.get(key)
+            if ours is not None and ours.last_access > entry.last_access:
+                entries[key] = entry._replace(last_access=ours.last_access)
+        return entries
+
+    def save(self) -> None:
+        """Write access times back to the index file"""
+        with self._lock:
+            if not self._dirty:
+                return
+        try:
+            with self._file_lock():
+                with self._lock:
+                    entries = self._merged_entries_locked()
+                    self._dirty = False
+                tmp_path = self.index_path.with_name(
+                    f"{INDEX_FILENAME}.{os.getpid()}.tmp"
+                )
+                with open(tmp_path, "wb") as index:
+                    index.write(self._index_header())
+                    for key, entry in entries.items():
+                        index.write(self._index_entry(key, entry))
+                os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.error(f"Failed to save frame index {self.index_path}: {e}")
+
+    def compact(self, drop: Iterable[str]) -> int:
+        """
+        Remove frames by rewriting the pack without them; the directory is
+        deleted when no frame is left. Frames already handed out stay valid.
+        Returns the number of bytes freed.
+        """
+        drop = set(drop)
+        with self._file_lock():
+            with self._lock:
+                entries = self._merged_entries_locked()
+            kept = {key: entry for key, entry in entries.items() if key not in drop}
+            freed = sum(
+                record_size(key, entry.length)
+                for key, entry in entries.items()
+                if key in drop
+            )
+
+            if not kept:
+                for path in (self.index_path, self.pack_path):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                new_entries = {}
+            else:
+                new_entries = self._rewrite(kept)
+
+        with self._lock:
+            self._entries = new_entries
+            self._map = None
+            self._dirty = False
+        if not new_entries:
+            try:
+                self.lock_path.unlink()
+                self.directory.rmdir()
+            except OSError:
+                pass
+        return freed
+
+    def _rewrite(self, kept: Dict[str, FrameEntry]) -> Dict[str, FrameEntry]:
+        """Copy the kept frames into a new pack and index, then swap them in"""
+        pid = os.getpid()
+        tmp_pack = self.pack_path.with_name(f"{PACK_FILENAME}.{pid}.tmp")
+        tmp_index = self.index_path.with_name(f"{INDEX_FILENAME}.{pid}.tmp")
+        new_entries = {}
+        with open(self.pack_path, "rb") as old_file:
+            old = mmap.mmap(old_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with open(tmp_pack, "wb") as pack, open(tmp_index, "wb") as index:
+                index.write(self._index_header())
+                for key, entry in sorted(kept.items(), key=lambda kv: kv[1].offset):
+                    size = record_size(key, entry.length)
+                    new_entry = entry._replace(offset=pack.tell())
+                    pack.write(old[entry.offset : entry.offset + size])
+                    index.write(self._index_entry(key, new_entry))
+                    new_entries[key] = new_entry
+            # A crash between the two leaves the old index on the new pack,
+            # whose key checks then turn every lookup into a miss
+            os.replace(tmp_pack, self.pack_path)
+            os.replace(tmp_index, self.index_path)
+        finally:
+            old.close()
+        return new_entries
+
+    def close(self) -> None:
+        """
+        Save access times and drop the mapping. Frames still shown keep
+        their part of it alive until they are released.
+        """
+        self.save()
+        with self._lock:
+            self._map = None
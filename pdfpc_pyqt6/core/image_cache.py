@@ -0,0 +1,147 @@
+"""
+Shared in-memory cache of decoded page images
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtGui import QImage
+
+from .frame_codec import read_frame
+
+logger = logging.getLogger(__name__)
+
+
+def load_image_file(image_path: str) -> Optional[QImage]:
+    """Decode an image file from the disk cache"""
+    return read_frame(image_path)
+
+
+class ImageCache:
+    """
+    Thread-safe LRU cache of decoded page images, sitting in front of the
+    on-disk page cache.
+
+    Entries are keyed by image path. A miss decodes the file once with the
+    loader and every consumer afterwards receives the same QImage handle.
+    QImage (unlike QPixmap) may be created and shared across threads, so
+    render workers can fill the cache too.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: Optional[int] = None,
+        loader: Callable[[str], Optional[QImage]] = load_image_file,
+    ):
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._loader = loader
+        self._images: "OrderedDict[str, QImage]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[QImage]:
+        """
+        Get the decoded image for a key, loading it on a miss.
+        Returns None if the image cannot be loaded.
+        """
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+
+        # Decode outside the lock so other pages can be served meanwhile
+        image = self._loader(key)
+        if image is None:
+            logger.warning(f"Failed to load image into cache: {key}")
+            return None
+        return self.put(key, image)
+
+    def peek(self, key: str) -> Optional[QImage]:
+        """Get an image only if it is already in memory, without loading"""
+        with self._lock:
+            return self._images.get(key)
+
+    def contains(self, key: str) -> bool:
+        """Check whether an image is resident in memory"""
+        with self._lock:
+            return key in self._images
+
+    def keys(self) -> List[str]:
+        """Get the keys of all resident images, least recently used first"""
+        with self._lock:
+            return list(self._images)
+
+    def put(self, key: str, image: QImage) -> QImage:
+        """
+        Insert a decoded image.
+        If another thread inserted the same key first, that image is kept and
+        returned so that all consumers share a single handle.
+        """
+        with self._lock:
+            existing = self._images.get(key)
+            if existing is not None:
+                self._images.move_to_end(key)
+                return existing
+
+            self._images[key] = image
+            self._current_bytes += image.sizeInBytes()
+            self._evict_locked()
+            return image
+
+    def discard(self, key: str) -> None:
+        """Remove an image from memory"""
+        with self._lock:
+            image = self._images.pop(key, None)
+            if image is not None:
+                self._current_bytes -= image.sizeInBytes()
+
+    def evict_if(self, predicate: Callable[[str], bool]) -> int:
+        """Remove the images whose key matches predicate. Returns the count."""
+        with self._lock:
+            keys = [key for key in self._images if predicate(key)]
+            for key in keys:
+                self._current_bytes -= self._images.pop(key).sizeInBytes()
+            self.evictions += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all images from memory"""
+        with self._lock:
+            self._images.clear()
+            self._current_bytes = 0
+
+    def _evict_locked(self) -> None:
+        """Evict least recently used images until within budget"""
+        # Always keep the most recently inserted image, even if it alone
+        # exceeds the budget, so the page on screen stays available
+        while len(self._images) > 1 and (
+            self._current_bytes > self._max_bytes
+            or (self._max_entries is not None and len(self._images) > self._max_entries)
+        ):
+            key, image = self._images.popitem(last=False)
+            self._current_bytes -= image.sizeInBytes()
+            self.evictions += 1
+            logger.debug(f"Evicted image from memory cache: {key}")
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters and usage"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._images),
+                "bytes": self._current_bytes,
+                "max_bytes": self._max_bytes,
+            }
@@ -0,0 +1,154 @@
+"""
+Navigation latency instrumentation: time from a page-turn input until the
+new page's frame is painted on each display
+"""
+
+import json
+import logging
+import math
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open
+BUCKET_BOUNDS_MS = (4, 8, 16, 33, 50, 100, 200, 500, 1000, 2000)
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list"""
+    rank = min(max(1, math.ceil(fraction * len(sorted_samples))), len(sorted_samples))
+    return sorted_samples[rank - 1]
+
+
+class LatencyMonitor:
+    """
+    Matches navigation inputs to the paints they cause.
+
+    mark_input() timestamps a page turn; every display then reports the
+    first paint of its new page's frame through mark_painted(), once per
+    input. Samples are kept per display, split by whether the frame was
+    already rendered when the page was shown (cache hit) or had to be
+    rendered first (cache miss). An input no display answers within
+    MAX_PENDING_S is dropped, so a page turn that changed nothing cannot be
+    matched to an unrelated repaint later.
+
+    Used from the GUI thread only.
+    """
+
+    MAX_PENDING_S = 10.0
+    MAX_SAMPLES = 10000  # Per display and hit/miss, oldest dropped first
+
+    def __init__(self):
+        self._input_time: Optional[float] = None
+        self._input_page: Optional[int] = None
+        self._answered: Set[str] = set()
+        # {(display, "hit" | "miss"): latencies in ms}
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+
+    def mark_input(self, page_idx: int) -> None:
+        """Timestamp a navigation input that turns to page_idx"""
+        self._input_time = time.perf_counter()
+        self._input_page = page_idx
+        self._answered.clear()
+
+    def mark_painted(self, display: str, cache_hit: bool) -> None:
+        """Record the latency of a display's first frame paint after an input"""
+        if self._input_time is None or display in self._answered:
+            return
+
+        elapsed = time.perf_counter() - self._input_time
+        if elapsed > self.MAX_PENDING_S:
+            self._input_time = None
+            return
+
+        self._answered.add(display)
+        key = (display, "hit" if cache_hit else "miss")
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.MAX_SAMPLES)
+        samples.append(elapsed * 1000.0)
+        logger.debug(
+            f"{display} painted page {self._input_page} "
+            f"{elapsed * 1000.0:.1f} ms after input ({key[1]})"
+        )
+
+    def sample_count(self) -> int:
+        """Total number of recorded samples"""
+        return sum(len(samples) for samples in self._samples.values())
+
+    def clear(self) -> None:
+        """Drop all samples and any pending input"""
+        self._input_time = None
+        self._answered.clear()
+        self._samples.clear()
+
+    def summary(self) -> Dict[str, Dict[str, dict]]:
+        """
+        Percentiles and histogram per display and hit/miss:
+        {display: {"hit": {...}, "miss": {...}}}
+        """
+        result: Dict[str, Dict[str, dict]] = {}
+        for (display, kind), samples in sorted(self._samples.items()):
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+            for value in ordered:
+                bucket = 0
+                while (
+                    bucket < len(BUCKET_BOUNDS_MS) and value > BUCKET_BOUNDS_MS[bucket]
+                ):
+                    bucket += 1
+                counts[bucket] += 1
+            result.setdefault(display, {})[kind] = {
+                "count": len(ordered),
+                "p50_ms": round(percentile(ordered, 0.50), 2),
+                "p95_ms": round(percentile(ordered, 0.95), 2),
+                "p99_ms": round(percentile(ordered, 0.99), 2),
+                "max_ms": round(ordered[-1], 2),
+                "histogram": {
+                    **{
+                        f"<={bound}ms": count
+                        for bound, count in zip(BUCKET_BOUNDS_MS, counts)
+                    },
+                    f">{BUCKET_BOUNDS_MS[-1]}ms": counts[-1],
+                },
+            }
+        return result
+
+    def format_report(self) -> str:
+        """Human-readable percentile table"""
+        summary = self.summary()
+        if not summary:
+            return "No navigation latency samples yet"
+
+        lines = [
+            f"{'display':<20} {'cache':<5} {'n':>6} {'p50':>8} {'p95':>8} {'p99':>8}"
+        ]
+        for display, kinds in summary.items():
+            for kind, stats in kinds.items():
+                lines.append(
+                    f"{display:<20} {kind:<5} {stats['count']:>6} "
+                    f"{stats['p50_ms']:>6.1f}ms {stats['p95_ms']:>6.1f}ms "
+                    f"{stats['p99_ms']:>6.1f}ms"
+                )
+        return "\n".join(lines)
+
+    def dump(self, path: Path) -> bool:
+        """Write the summary as JSON. Returns False if it cannot be written."""
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.summary(), indent=2))
+            logger.info(f"Wrote navigation latency report to {path}")
+            return True
+        except OSError as e:
+            logger.error(f"Failed to write latency report {path}: {e}")
+            return False
+
+
+# Global monitor shared by the windows
+latency_monitor = LatencyMonitor()
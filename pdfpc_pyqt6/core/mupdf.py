@@ -0,0 +1,18 @@
+"""
+PyMuPDF, imported on first use: it is slow to import and only needed once
+a document is opened
+"""
+
+_fitz = None
+
+
+def load_fitz():
+    """Get the fitz module, importing it on the first call. Raises ImportError."""
+    global _fitz
+    if _fitz is None:
+        try:
+            import fitz  # PyMuPDF
+        except ModuleNotFoundError:
+            import fitz_old as fitz
+        _fitz = fitz
+    return _fitz
@@ -2,18 +2,146 @@
 PDF processing module using PyMuPDF for rendering
 """
 
-import io
+import hashlib
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 from PySide6.QtCore import QObject
 from PySide6.QtCore import Signal as pyqtSignal
+from PySide6.QtGui import QImage
 
 from ..config import config
+from .document_pool import DocumentPool
+from .disk_cache import DiskCache, parse_frame_key
+from .frame_codec import get_codec
+from .frame_pack import FramePack, record_size
+from .image_cache import ImageCache
+from .mupdf import load_fitz
 
 logger = logging.getLogger(__name__)
 
+# Files up to this size are hashed completely; larger files are sampled
+FINGERPRINT_FULL_HASH_LIMIT = 32 * 1024 * 1024
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+FINGERPRINT_SAMPLE_COUNT = 16
+
+# Rendered pixmaps allowed to wait for the background cache writer
+MAX_PENDING_CACHE_WRITES = 8
+
+# A disk cache over budget is trimmed to this fraction of it, so eviction
+# runs once in a while rather than on every write
+DISK_CACHE_TRIM_RATIO = 0.8
+
+# Bump when the rendering parameters or cache file layout change
+CACHE_FORMAT_VERSION = 1
+
+
+def document_fingerprint(pdf_path) -> str:
+    """
+    Compute a fast content fingerprint for a PDF file.
+    Small files are hashed completely; large files hash their size, head,
+    tail and evenly spaced samples, which covers the trailer and xref that
+    change whenever a PDF is rewritten.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    size = os.path.getsize(pdf_path)
+    hasher.update(size.to_bytes(8, "little"))
+
+    with open(pdf_path, "rb") as f:
+        if size <= FINGERPRINT_FULL_HASH_LIMIT:
+            for chunk in iter(lambda: f.read(FINGERPRINT_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        else:
+            step = (size - FINGERPRINT_CHUNK_SIZE) // (FINGERPRINT_SAMPLE_COUNT + 1)
+            offsets = [0, size - FINGERPRINT_CHUNK_SIZE]
+            offsets += [step * (i + 1) for i in range(FINGERPRINT_SAMPLE_COUNT)]
+            for offset in offsets:
+                f.seek(offset)
+                hasher.update(f.read(FINGERPRINT_CHUNK_SIZE))
+
+    return hasher.hexdigest()
+
+
+def fit_zoom(
+    page_width: float,
+    page_height: float,
+    scale: float,
+    size: Optional[Tuple[int, int]] = None,
+) -> float:
+    """
+    Get the zoom factor for rendering a page.
+    With a target size (device pixels) the page is fitted into that box,
+    otherwise the fixed scale is used.
+    """
+    if size is None:
+        return scale
+    width, height = size
+    return min(width / page_width, height / page_height)
+
+
+def rasterize_page(
+    page,
+    scale: float,
+    size: Optional[Tuple[int, int]] = None,
+    clip: Optional[Tuple[float, float, float, float]] = None,
+):
+    """
+    Rasterize a fitz page, or its display list, to a pixmap.
+    clip limits rendering to a region given as (left, top, width, height)
+    ratios of the page; the region (or whole page) is fitted into size, or
+    rendered at scale without one.
+    """
+    fitz = load_fitz()
+
+    rect = page.rect
+    clip_rect = None
+    if clip is not None:
+        left, top, width, height = clip
+        clip_rect = fitz.Rect(
+            rect.x0 + left * rect.width,
+            rect.y0 + top * rect.height,
+            rect.x0 + (left + width) * rect.width,
+            rect.y0 + (top + height) * rect.height,
+        )
+        rect = clip_rect
+
+    zoom = fit_zoom(rect.width, rect.height, scale, size)
+    mat = fitz.Matrix(zoom, zoom)
+    return page.get_pixmap(matrix=mat, clip=clip_rect, alpha=False)
+
+
+def qimage_from_pixmap(pix) -> QImage:
+    """
+    Wrap a MuPDF pixmap in a QImage without copying the sample buffer.
+    The QImage does not own the buffer, so the pixmap is kept alive on it.
+    """
+    if pix.n == 4:
+        image_format = QImage.Format.Format_RGBA8888
+    else:
+        image_format = QImage.Format.Format_RGB888
+    image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, image_format)
+    image._fitz_pixmap = pix
+    return image
+
+
+@dataclass
+class OpenedDocument:
+    """A PDF opened off the GUI thread, ready for PDFProcessor.adopt_document()"""
+
+    pdf_path: str
+    document: object  # fitz.Document
+    page_count: int
+    fingerprint: str
+
+    def close(self) -> None:
+        """Release a document that is not going to be adopted"""
+        self.document.close()
+
 
 class PDFProcessor(QObject):
     """
@@ -30,34 +158,47 @@ class PDFProcessor(QObject):
         self._pdf_document = None
         self._page_count = 0
         self._pdf_path: Optional[str] = None
+        self._fingerprint: Optional[str] = None
         self._cache_dir = config.CACHE_DIR
         self._scale = config.DEFAULT_SCALE
+        # On-disk frame format; its name is part of every cache key
+        self._codec = get_codec(config.CACHE_CODEC)
+        # Disk cache of the loaded document; None with ENABLE_RENDER_CACHE off
+        self._frame_pack: Optional[FramePack] = None
+        self.disk_cache = DiskCache(self._cache_dir)
+        # Disk cache size, measured on the cache writer thread, and the size
+        # at which it is trimmed next
+        self._disk_usage: Optional[int] = None
+        self._next_trim_bytes = config.MAX_DISK_CACHE_BYTES
+        self._trim_queued = False
+
+        # Independently opened documents, one per render thread, each with
+        # the display lists of the pages its thread rendered recently
+        self._documents = DocumentPool(config.DISPLAY_LIST_CACHE_PAGES)
+        # Optional out-of-process rasterizer (see ProcessRenderBackend)
+        self._process_backend = None
+
+        # Decoded images shared by all views
+        self.image_cache = ImageCache(
+            config.MAX_MEMORY_CACHE_BYTES,
+            config.MAX_MEMORY_CACHE_PAGES,
+            loader=self._load_cached_image,
+        )
+
+        # Rendered pages are persisted to disk off the render path
+        self._cache_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pdfpc-cache-writer"
+        )
+        self._pending_writes: Dict[str, object] = {}  # {cache_key: pixmap}
+        self._pending_writes_lock = threading.Lock()
 
     def load_pdf(self, pdf_path: str) -> bool:
         """
-        Load a PDF file.
+        Load a PDF file (blocking).
         Returns True if successful, False otherwise.
         """
         try:
-            try:
-                import fitz  # PyMuPDF
-            except ModuleNotFoundError:
-                import fitz_old as fitz
-
-            pdf_path = Path(pdf_path)
-            if not pdf_path.exists():
-                raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
-            # Close previous document if any
-            if self._pdf_document:
-                self._pdf_document.close()
-
-            # Load new document
-            self._pdf_document = fitz.open(str(pdf_path))
-            self._page_count = self._pdf_document.page_count
-            self._pdf_path = str(pdf_path)
-
-            logger.info(f"Loaded PDF: {pdf_path} with {self._page_count} pages")
+            self.adopt_document(self.open_document(pdf_path))
             return True
 
         except ImportError:
@@ -71,18 +212,207 @@ class PDFProcessor(QObject):
             self.renderError.emit(f"Failed to load PDF: {e}")
             return False
 
+    @staticmethod
+    def open_document(pdf_path: str) -> OpenedDocument:
+        """
+        Do the slow part of loading a PDF: open and parse it and compute
+        its fingerprint. Touches no processor state, so it may run on any
+        thread; adopt_document() then switches to the result.
+        Raises FileNotFoundError, ImportError or the error from MuPDF.
+        """
+        fitz = load_fitz()
+
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        document = fitz.open(str(pdf_path))
+        try:
+            return OpenedDocument(
+                pdf_path=str(pdf_path),
+                document=document,
+                page_count=document.page_count,
+                fingerprint=document_fingerprint(pdf_path),
+            )
+        except Exception:
+            document.close()
+            raise
+
+    def adopt_document(self, opened: OpenedDocument) -> None:
+        """Switch to a document opened by open_document(), closing the previous one"""
+        if self._pdf_document:
+            self._pdf_document.close()
+
+        self._pdf_document = opened.document
+        self._page_count = opened.page_count
+        self._pdf_path = opened.pdf_path
+        self._fingerprint = opened.fingerprint
+        self._documents.reset(self._pdf_path)
+        if self._frame_pack is not None:
+            # Saves its access times
+            self._cache_writer.submit(self._frame_pack.close)
+            self._frame_pack = None
+        if config.ENABLE_RENDER_CACHE:
+            self._frame_pack = FramePack(
+                self._cache_dir / self._fingerprint, source=self._pdf_path
+            )
+            self._queue_disk_trim()
+
+        logger.info(
+            f"Loaded PDF: {opened.pdf_path} with {self._page_count} pages "
+            f"(fingerprint {self._fingerprint})"
+        )
+
     def get_page_count(self) -> int:
         """Get the number of pages in the loaded PDF"""
         return self._page_count
 
+    def get_fingerprint(self) -> Optional[str]:
+        """Get the content fingerprint of the loaded PDF"""
+        return self._fingerprint
+
+    def get_document_cache_dir(self) -> Optional[Path]:
+        """Get the cache directory holding renders of the loaded PDF"""
+        if not self._fingerprint:
+            return None
+        return self._cache_dir / self._fingerprint
+
+    def _render_params_tag(
+        self,
+        scale: float,
+        size: Optional[Tuple[int, int]] = None,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> str:
+        """Encode everything that affects the rendered pixels into a tag"""
+        if size is not None:
+            resolution = f"fit{size[0]}x{size[1]}"
+        else:
+            resolution = f"{scale:g}x"
+        if clip is not None:
+            resolution += "_clip" + "-".join(f"{ratio:g}" for ratio in clip)
+        return f"{resolution}_rgb_annots_v{CACHE_FORMAT_VERSION}"
+
+    def get_cache_path(
+        self,
+        page_index: int,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Optional[Path]:
+        """
+        Get the cache path for a page: the document's cache directory (named
+        by its fingerprint) and the frame's key in the frame pack there.
+        Frames are keyed by page, render parameters and codec, so renders of
+        different documents never collide and a page can be cached at
+        several resolutions and clips. Returns None when no document is
+        open.
+        """
+        if not self._fingerprint:
+            return None
+        if scale is None:
+            scale = self._scale
+        return self._cache_path(self._fingerprint, page_index, scale, size, clip)
+
+    def _cache_path(
+        self,
+        fingerprint: str,
+        page_index: int,
+        scale: float,
+        size: Optional[Tuple[int, int]] = None,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Path:
+        """Cache path of a page render of the document with fingerprint"""
+        params_tag = self._render_params_tag(scale, size, clip)
+        cache_filename = f"page_{page_index:06d}_{params_tag}.{self._codec.name}"
+        return self._cache_dir / fingerprint / cache_filename
+
+    def get_cached_pages(
+        self,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+    ) -> Dict[int, str]:
+        """
+        Find pages of the loaded PDF that are already in the disk cache.
+        Reads only the frame pack index, which is in memory.
+        Returns {page_idx: cache_key}.
+        """
+        frame_pack = self._frame_pack
+        if frame_pack is None:
+            return {}
+
+        if scale is None:
+            scale = self._scale
+        suffix = f"_{self._render_params_tag(scale, size)}.{self._codec.name}"
+
+        cached = {}
+        for name in frame_pack.keys():
+            if not (name.startswith("page_") and name.endswith(suffix)):
+                continue
+            try:
+                page_idx = int(name[len("page_") : -len(suffix)])
+            except ValueError:
+                continue
+            if 0 <= page_idx < self._page_count:
+                cached[page_idx] = str(frame_pack.directory / name)
+
+        logger.info(f"Found {len(cached)} cached pages in {frame_pack.pack_path}")
+        return cached
+
+    def find_cached_frame(
+        self,
+        page_index: int,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Optional[str]:
+        """
+        Get the cache key of a page render if it is available without
+        rasterizing, either in memory or on disk. Returns None otherwise.
+        """
+        if not self._fingerprint:
+            return None
+
+        cache_path = self.get_cache_path(page_index, scale, size, clip)
+        cache_key = str(cache_path)
+
+        # Already in memory or waiting to be written: no file system access
+        if self.image_cache.contains(cache_key) or self._is_write_pending(cache_key):
+            logger.debug(f"Using in-memory page: {cache_key}")
+            return cache_key
+
+        # In the frame pack: an index lookup, no file system access
+        frame_pack = self._frame_pack_for(cache_path)
+        if frame_pack is not None and frame_pack.contains(cache_path.name):
+            logger.debug(f"Using cached page: {cache_path}")
+            return cache_key
+
+        return None
+
     def render_page(
-        self, page_index: int, scale: Optional[float] = None
+        self,
+        page_index: int,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        persist: bool = True,
+        clip: Optional[Tuple[float, float, float, float]] = None,
     ) -> Optional[str]:
         """
-        Render a single page to PNG image.
-        Returns the path to the cached PNG file, or None if rendering failed.
+        Render a single page into the image cache.
+        size is a target box in device pixels the page is fitted into;
+        without it the page is rendered at the given (or default) scale.
+        clip renders only a region of the page, given as (left, top, width,
+        height) ratios, e.g. the notes half of a Beamer notes page.
+        The rasterized page goes straight into the in-memory cache and is
+        written to disk in the background, unless persist is False (e.g.
+        for throwaway draft frames).
+        Returns the cache key (the page's cache path), or None if
+        rendering failed or another document was adopted meanwhile (its
+        pixels could then belong to either document, so they are dropped).
         """
-        logger.debug(f"render_page called with page_index={page_index}, scale={scale}")
+        logger.debug(
+            f"render_page called with page_index={page_index}, "
+            f"scale={scale}, size={size}, clip={clip}"
+        )
 
         if not self._pdf_document:
             logger.error("No PDF document loaded")
@@ -94,94 +424,203 @@ class PDFProcessor(QObject):
             )
             return None
 
+        fingerprint = self._fingerprint
+        if not fingerprint:
+            logger.error("PDF document has no fingerprint")
+            return None
         try:
-            try:
-                import fitz  # PyMuPDF
-            except ModuleNotFoundError:
-                import fitz_old as fitz
-
             # Use provided scale or default
             if scale is None:
                 scale = self._scale
 
-            logger.debug(f"Using scale: {scale}")
-
-            # Generate cache filename
-            cache_filename = f"page_{page_index:06d}_{scale}.png"
-            cache_path = self._cache_dir / cache_filename
+            cached_key = self.find_cached_frame(page_index, scale, size, clip)
+            if cached_key is not None:
+                return cached_key
 
-            logger.debug(f"Cache path: {cache_path}")
-            logger.debug(f"Cache dir exists: {self._cache_dir.exists()}")
-
-            # Return cached file if it exists
-            if cache_path.exists():
-                logger.debug(f"Using cached page: {cache_path}")
-                return str(cache_path)
+            cache_path = self._cache_path(fingerprint, page_index, scale, size, clip)
+            cache_key = str(cache_path)
 
             # Render page
-            logger.debug(f"Rendering page {page_index} from document")
-            page = self._pdf_document[page_index]
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            logger.debug(f"Pixmap created: {pix}")
-
-            # Save to cache
-            logger.debug(f"Creating cache directory: {cache_path.parent}")
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Saving to: {cache_path}")
-            pix.save(str(cache_path))
-            logger.debug(f"File saved successfully")
-
-            # Verify file exists
-            if cache_path.exists():
-                file_size = cache_path.stat().st_size
-                logger.info(
-                    f"Rendered page {page_index} to {cache_path} ({file_size} bytes)"
-                )
-                return str(cache_path)
-            else:
-                logger.error(f"File not created after save: {cache_path}")
+            pix = self._rasterize(page_index, scale, size, clip)
+            if self._fingerprint != fingerprint:
+                logger.debug(f"Document changed while rendering page {page_index}")
                 return None
+            self.image_cache.put(cache_key, qimage_from_pixmap(pix))
+            if persist and self._frame_pack is not None:
+                self._write_cache_file_async(cache_path, pix)
+
+            logger.info(
+                f"Rendered page {page_index} at {pix.width}x{pix.height} ({cache_key})"
+            )
+            return cache_key
 
         except Exception as e:
+            if self._fingerprint != fingerprint:
+                # E.g. the document handle was retired under the render
+                logger.debug(f"Document changed while rendering page {page_index}")
+                return None
             logger.error(f"Failed to render page {page_index}: {e}", exc_info=True)
             self.renderError.emit(f"Failed to render page {page_index}: {e}")
             return None
 
-    def render_page_to_bytes(
-        self, page_index: int, scale: Optional[float] = None
-    ) -> Optional[bytes]:
+    def set_process_backend(self, backend) -> None:
+        """Rasterize in worker processes instead of the calling thread"""
+        self._process_backend = backend
+
+    def _rasterize(
+        self,
+        page_index: int,
+        scale: float,
+        size: Optional[Tuple[int, int]] = None,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ):
         """
-        Render a page directly to PNG bytes without saving to disk.
-        Useful for immediate display without caching.
+        Rasterize a page to a MuPDF pixmap (or a SharedFrame when a process
+        backend is set).
+        Uses the calling thread's own document handle, so render workers
+        never share a fitz.Document, and replays the page's cached display
+        list when it was rendered before.
         """
-        if not self._pdf_document:
-            logger.error("No PDF document loaded")
-            return None
+        if self._process_backend is not None:
+            return self._process_backend.render(
+                self._pdf_path, self._fingerprint, page_index, scale, size, clip
+            )
 
-        if page_index < 0 or page_index >= self._page_count:
-            logger.error(f"Invalid page index: {page_index}")
-            return None
+        logger.debug(f"Rendering page {page_index} from document at {size or scale}")
+        with self._documents.acquire_page(page_index) as display_list:
+            return rasterize_page(display_list, scale, size, clip)
+
+    def _is_write_pending(self, cache_key: str) -> bool:
+        """Check whether a rendered page is still waiting to be written"""
+        with self._pending_writes_lock:
+            return cache_key in self._pending_writes
 
+    def _frame_pack_for(self, cache_path: Path) -> Optional[FramePack]:
+        """Get the frame pack holding a cache path, if it is the loaded document's"""
+        frame_pack = self._frame_pack
+        if frame_pack is None or cache_path.parent != frame_pack.directory:
+            return None
+        return frame_pack
+
+    def _write_cache_file_async(self, cache_path: Path, pix) -> None:
+        """Queue a rendered pixmap to be persisted off the render path"""
+        cache_key = str(cache_path)
+        with self._pending_writes_lock:
+            backlog_full = len(self._pending_writes) >= MAX_PENDING_CACHE_WRITES
+            self._pending_writes[cache_key] = pix
+
+        if backlog_full:
+            # Bulk rendering outpaces the writer: write on the calling worker
+            # thread instead of queueing more pixmaps in memory
+            self._write_cache_file(cache_path, pix)
+        else:
+            self._cache_writer.submit(self._write_cache_file, cache_path, pix)
+
+    def _write_cache_file(self, cache_path: Path, pix) -> None:
+        """Append a rendered pixmap to the frame pack (cache writer thread)"""
+        cache_key = str(cache_path)
         try:
-            try:
-                import fitz  # PyMuPDF
-            except ModuleNotFoundError:
-                import fitz_old as fitz
+            frame_pack = self._frame_pack_for(cache_path)
+            if frame_pack is None:
+                logger.debug(f"Document closed, not caching {cache_path}")
+            elif not frame_pack.contains(cache_path.name):
+                data = self._codec.encode(pix)
+                frame_pack.append(cache_path.name, data)
+                logger.debug(f"Cached frame {cache_path}")
+                self._note_disk_write(record_size(cache_path.name, len(data)))
+        except Exception as e:
+            logger.error(f"Failed to write cache frame {cache_path}: {e}")
+        finally:
+            with self._pending_writes_lock:
+                self._pending_writes.pop(cache_key, None)
+
+    def _note_disk_write(self, size: int) -> None:
+        """Account for a frame added to the disk cache"""
+        with self._pending_writes_lock:
+            if self._disk_usage is None:
+                return
+            self._disk_usage += size
+            over_budget = self._disk_usage > self._next_trim_bytes
+        if over_budget:
+            self._queue_disk_trim()
+
+    def _queue_disk_trim(self) -> None:
+        """Check the disk budget on the cache writer thread"""
+        with self._pending_writes_lock:
+            if self._trim_queued:
+                return
+            self._trim_queued = True
+        self._cache_writer.submit(self._enforce_disk_budget)
+
+    def _enforce_disk_budget(self) -> None:
+        """
+        Measure the disk cache and evict least recently used frames if it
+        is over budget (cache writer thread)
+        """
+        with self._pending_writes_lock:
+            self._trim_queued = False
+        budget = config.MAX_DISK_CACHE_BYTES
+        try:
+            frame_pack = self._frame_pack
+            usage = self._disk_usage
+            if usage is None:
+                usage = self.disk_cache.usage(frame_pack)
+            if usage > budget:
+                self.disk_cache.trim(int(budget * DISK_CACHE_TRIM_RATIO), frame_pack)
+                usage = self.disk_cache.usage(frame_pack)
+        except Exception as e:
+            logger.error(f"Failed to trim the disk cache: {e}")
+            return
 
-            if scale is None:
-                scale = self._scale
+        with self._pending_writes_lock:
+            self._disk_usage = usage
+            # Frames in use may keep the cache over budget; trim again only
+            # once enough has been added since
+            slack = int(budget * (1.0 - DISK_CACHE_TRIM_RATIO))
+            self._next_trim_bytes = max(budget, usage + slack)
 
-            page = self._pdf_document[page_index]
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
+    def _load_cached_image(self, cache_key: str) -> Optional[QImage]:
+        """
+        Image cache loader: serve pages that are still waiting to be written
+        from memory, everything else from the frame pack.
+        """
+        with self._pending_writes_lock:
+            pix = self._pending_writes.get(cache_key)
+        if pix is not None:
+            return qimage_from_pixmap(pix)
+
+        cache_path = Path(cache_key)
+        frame_pack = self._frame_pack_for(cache_path)
+        if frame_pack is None:
+            return None
+        data = frame_pack.read(cache_path.name)
+        if data is None:
+            return None
+        return self._codec.decode(data)
+
+    def retain_pages(
+        self, pages: Iterable[int], keep_sizes: Iterable[Tuple[int, int]] = ()
+    ) -> int:
+        """
+        Evict the decoded images of pages not in pages from memory, except
+        renders at keep_sizes (e.g. thumbnails). Their frames stay in the
+        disk cache. Returns the number of images evicted.
+        """
+        pages = set(pages)
+        kept_tags = {f"fit{width}x{height}" for width, height in keep_sizes}
 
-            # Return PNG bytes
-            return pix.tobytes(output="png")
+        def outside(cache_key: str) -> bool:
+            parsed = parse_frame_key(os.path.basename(cache_key))
+            if parsed is None:
+                return False
+            page_idx, size_tag, _codec = parsed
+            return page_idx not in pages and size_tag not in kept_tags
 
-        except Exception as e:
-            logger.error(f"Failed to render page {page_index} to bytes: {e}")
-            return None
+        return self.image_cache.evict_if(outside)
+
+    def flush_cache_writes(self) -> None:
+        """Block until all queued cache files have been written"""
+        self._cache_writer.submit(lambda: None).result()
 
     def get_pdf_path(self) -> Optional[str]:
         """Get the currently loaded PDF path"""
@@ -191,22 +630,16 @@ class PDFProcessor(QObject):
         """Set the rendering scale factor"""
         self._scale = max(0.5, min(4.0, scale))  # Clamp between 0.5 and 4.0
 
-    def clear_cache(self) -> None:
-        """Clear the image cache"""
-        try:
-            import shutil
-
-            if self._cache_dir.exists():
-                shutil.rmtree(self._cache_dir)
-                self._cache_dir.mkdir(parents=True, exist_ok=True)
-            logger.info("Cache cleared")
-        except Exception as e:
-            logger.error(f"Failed to clear cache: {e}")
-
     def close(self) -> None:
         """Close the PDF document"""
+        self.flush_cache_writes()
+        self._documents.reset(None)
+        if self._frame_pack is not None:
+            self._frame_pack.close()
+            self._frame_pack = None
         if self._pdf_document:
             self._pdf_document.close()
             self._pdf_document = None
             self._page_count = 0
+            self._fingerprint = None
             logger.info("PDF closed")
@@ -0,0 +1,138 @@
+"""
+Prefetch prediction: which pages around the current slide to keep rendered
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+
+class PrefetchPredictor:
+    """
+    Predicts the pages shown next from the page turns so far.
+
+    The prefetch window is the current page and the pages around it,
+    extending `ahead` pages in the direction of travel and `behind` pages
+    the other way. Presentations mostly move forward, so that is the
+    direction until a step back is taken. Consecutive turns in quick
+    succession widen the look-ahead in proportion to their pace, up to
+    `max_ahead` pages, so clicking through slides stays ahead of rendering.
+
+    Jumps (moves of more than one page, e.g. from the overview) are
+    remembered with a score that decays with every later jump. Both ends
+    of the highest scoring jumps are kept in the window: a slide jumped to
+    repeatedly, like an agenda, and the place a detour will return to.
+
+    The next page is always in the window, as the presenter view shows it.
+    Used from the GUI thread only.
+    """
+
+    # Score kept by earlier jumps each time a new one is made
+    JUMP_DECAY = 0.75
+    # Consecutive turn intervals averaged to measure the pace
+    PACE_SAMPLES = 4
+
+    def __init__(
+        self,
+        ahead: int,
+        behind: int,
+        max_ahead: int,
+        fast_turn_s: float,
+        jump_targets: int,
+    ):
+        self.ahead = max(1, ahead)
+        self.behind = max(1, behind)
+        self.max_ahead = max(self.ahead, max_ahead)
+        self.fast_turn_s = fast_turn_s
+        self.jump_targets = jump_targets
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the navigation history, e.g. for a new document"""
+        self._page: Optional[int] = None
+        self._direction = 1
+        self._last_turn: Optional[float] = None
+        self._intervals: Deque[float] = deque(maxlen=self.PACE_SAMPLES)
+        self._jump_scores: Dict[int, float] = {}
+
+    def observe(self, page_idx: int, now: Optional[float] = None) -> None:
+        """Record that page_idx is now the current page"""
+        if now is None:
+            now = time.perf_counter()
+        previous, self._page = self._page, page_idx
+        if previous is None or page_idx == previous:
+            return
+
+        step = page_idx - previous
+        if abs(step) == 1:
+            direction = 1 if step > 0 else -1
+            if (
+                direction == self._direction
+                and self._last_turn is not None
+                and now - self._last_turn <= self.fast_turn_s
+            ):
+                self._intervals.append(now - self._last_turn)
+            else:
+                # A pause or a change of direction starts a new run
+                self._intervals.clear()
+            self._direction = direction
+            self._last_turn = now
+            return
+
+        # A jump: remember where it went and where it came from
+        for page, score in list(self._jump_scores.items()):
+            score *= self.JUMP_DECAY
+            if score < 0.05:
+                del self._jump_scores[page]
+            else:
+                self._jump_scores[page] = score
+        for page in (page_idx, previous):
+            self._jump_scores[page] = self._jump_scores.get(page, 0.0) + 1.0
+        self._intervals.clear()
+        self._last_turn = None
+
+    def look_ahead(self) -> int:
+        """Pages prefetched in the direction of travel at the current pace"""
+        if not self._intervals:
+            return self.ahead
+        pace = sum(self._intervals) / len(self._intervals)
+        widened = round(self.ahead * self.fast_turn_s / max(pace, 1e-3))
+        return min(self.max_ahead, max(self.ahead, widened))
+
+    def window(self, current_page: int, total_pages: int) -> List[int]:
+        """
+        The pages to keep rendered, most likely next first: the current
+        page, the next one in the direction of travel, the remembered jump
+        targets and then the rest of the window by weighted distance
+        """
+        if total_pages <= 0:
+            return []
+        current_page = min(max(current_page, 0), total_pages - 1)
+        ahead = self.look_ahead()
+        direction = self._direction
+
+        # Rank by distance relative to each side's reach, so a wide
+        # look-ahead interleaves with the few pages kept behind; the
+        # direction of travel wins ties
+        ranked = []
+        for distance in range(1, ahead + 1):
+            ranked.append((distance / ahead, 0, current_page + direction * distance))
+        for distance in range(1, self.behind + 1):
+            ranked.append(
+                (distance / self.behind, 1, current_page - direction * distance)
+            )
+        ranked.sort()
+        pages = [page for _, _, page in ranked if 0 <= page < total_pages]
+
+        window = [current_page]
+        if pages:
+            window.append(pages.pop(0))
+        targets = sorted(self._jump_scores, key=self._jump_scores.get, reverse=True)
+        window.extend(
+            page for page in targets[: self.jump_targets] if 0 <= page < total_pages
+        )
+        # The next page is always kept, even when moving backwards
+        if current_page + 1 < total_pages:
+            window.append(current_page + 1)
+        window.extend(pages)
+        return list(dict.fromkeys(window))
@@ -0,0 +1,266 @@
+"""
+Process-pool rendering backend with shared-memory frame delivery
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QBuffer, QIODevice
+
+from ..config import config
+from .display_list_cache import DisplayListCache
+from .mupdf import load_fitz
+from .pdf_processor import qimage_from_pixmap, rasterize_page
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_main(conn) -> None:
+    """
+    Render loop of a worker process.
+    Requests are (pdf_path, fingerprint, page_index, scale, size, clip)
+    tuples. The document is opened again, and its display lists dropped,
+    whenever the path or fingerprint changes, so a file rewritten in place
+    is never rendered from the old copy. Every frame is copied into a new shared memory block whose name is sent back.
+    The block is kept open until the next request so the parent can always
+    attach to it. Pages this process rendered before are replayed from
+    their display lists.
+    """
+    fitz = load_fitz()
+
+    document = None
+    document_key = None  # (pdf_path, fingerprint) of the open document
+    display_lists = DisplayListCache(config.DISPLAY_LIST_CACHE_PAGES)
+    previous_shm = None
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        if previous_shm is not None:
+            previous_shm.close()
+            previous_shm = None
+
+        if request is None:
+            break
+
+        pdf_path, fingerprint, page_index, scale, size, clip = request
+        try:
+            if (pdf_path, fingerprint) != document_key:
+                if document is not None:
+                    display_lists.clear()
+                    document.close()
+                    document, document_key = None, None
+                document = fitz.open(pdf_path)
+                document_key = (pdf_path, fingerprint)
+
+            display_list = display_lists.get(
+                page_index, lambda: document[page_index].get_displaylist()
+            )
+            pix = rasterize_page(display_list, scale, size, clip)
+
+            samples = pix.samples_mv
+            shm = shared_memory.SharedMemory(create=True, size=max(1, len(samples)))
+            shm.buf[: len(samples)] = samples
+            previous_shm = shm
+
+            conn.send(("ok", shm.name, pix.width, pix.height, pix.stride, pix.n))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+    if document is not None:
+        display_lists.clear()
+        document.close()
+
+
+class _SharedBlock(shared_memory.SharedMemory):
+    """Shared memory block that stays mapped while a QImage still uses it"""
+
+    def __del__(self):
+        try:
+            self.close()
+        except BufferError:
+            # A view exported to a QImage keeps the mapping alive; it is
+            # unmapped when that view is released
+            pass
+
+
+class SharedFrame:
+    """
+    A rendered frame that lives in a shared memory block.
+    Mirrors the parts of the fitz.Pixmap interface used by PDFProcessor, so
+    it can be wrapped in a QImage and written to the cache the same way.
+    """
+
+    def __init__(
+        self,
+        shm: _SharedBlock,
+        width: int,
+        height: int,
+        stride: int,
+        n: int,
+    ):
+        self._shm = shm
+        self.width = width
+        self.height = height
+        self.stride = stride
+        self.n = n
+
+    @property
+    def samples_mv(self) -> memoryview:
+        return self._shm.buf[: self.stride * self.height]
+
+    def save(self, path: str, output: str = "png") -> None:
+        """Encode the frame to an image file"""
+        if not qimage_from_pixmap(self).save(path, output.upper()):
+            raise OSError(f"Failed to write {path}")
+
+    def tobytes(self, output: str = "png") -> bytes:
+        """Encode the frame to image file data"""
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        if not qimage_from_pixmap(self).save(buffer, output.upper()):
+            raise OSError(f"Failed to encode frame as {output}")
+        return bytes(buffer.data())
+
+
+class _WorkerProcess:
+    """One render worker process and the pipe used to drive it"""
+
+    def __init__(self, context, index: int):
+        self._context = context
+        self.index = index
+        self.process = None
+        self.conn = None
+
+    def ensure_started(self) -> None:
+        """Start the process if it is not running"""
+        if self.process is not None and self.process.is_alive():
+            return
+        parent_conn, child_conn = self._context.Pipe()
+        self.process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            name=f"pdfpc-render-{self.index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        logger.info(f"Started render process {self.process.pid}")
+
+    def kill(self) -> None:
+        """Terminate the process, e.g. after a page timed out"""
+        if self.process is not None:
+            self.process.kill()
+            self.process.join()
+            logger.warning(f"Killed render process {self.process.pid}")
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def stop(self) -> None:
+        """Ask the process to exit, killing it if it does not"""
+        if self.process is None:
+            return
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+            self.process = None
+            self.conn = None
+
+
+class ProcessRenderBackend:
+    """
+    Renders pages in worker processes instead of threads, so rasterization
+    is not serialized by the GIL.
+
+    Each render thread of RenderThreadPool borrows an idle worker process
+    for one page and blocks (without holding the GIL) until the frame is
+    ready. Frames come back through shared memory: the parent maps the
+    block and wraps it in a QImage without copying. A page that takes
+    longer than the timeout gets its worker killed and restarted, so one
+    pathological page cannot stall the pool.
+    """
+
+    def __init__(self, workers: int, page_timeout: float):
+        self._context = multiprocessing.get_context("spawn")
+        self._page_timeout = page_timeout
+        self._workers: List[_WorkerProcess] = [
+            _WorkerProcess(self._context, i) for i in range(workers)
+        ]
+        self._idle: "queue.Queue[_WorkerProcess]" = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._closed = threading.Event()
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._workers)
+
+    def render(
+        self,
+        pdf_path: str,
+        fingerprint: str,
+        page_index: int,
+        scale: float,
+        size: Optional[Tuple[int, int]] = None,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> SharedFrame:
+        """
+        Render a page of the document with the given content fingerprint in
+        a worker process (blocking).
+        Raises TimeoutError if the page exceeds the per-page timeout and
+        RuntimeError if the worker fails to render it.
+        """
+        if self._closed.is_set():
+            raise RuntimeError("Render backend is closed")
+
+        worker = self._idle.get()
+        try:
+            worker.ensure_started()
+            worker.conn.send((pdf_path, fingerprint, page_index, scale, size, clip))
+
+            if not worker.conn.poll(self._page_timeout):
+                worker.kill()
+                raise TimeoutError(
+                    f"Page {page_index} exceeded {self._page_timeout:.1f}s render timeout"
+                )
+
+            try:
+                reply = worker.conn.recv()
+            except (EOFError, OSError):
+                worker.kill()
+                raise RuntimeError(f"Render process died on page {page_index}")
+
+            if reply[0] == "error":
+                raise RuntimeError(reply[1])
+
+            _, shm_name, width, height, stride, n = reply
+            shm = _SharedBlock(name=shm_name)
+            # The mapping stays valid after unlinking; the block is freed
+            # once the last frame referencing it is garbage collected
+            shm.unlink()
+            return SharedFrame(shm, width, height, stride, n)
+        finally:
+            self._idle.put(worker)
+
+    def close(self) -> None:
+        """Stop all worker processes"""
+        self._closed.set()
+        for worker in self._workers:
+            worker.stop()
+        logger.info("Process render backend closed")
@@ -0,0 +1,127 @@
+"""
+Startup instrumentation: time from process start to the first window paint
+and the first slide on screen
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Milestones in the order they are reached
+IMPORTS = "imports"  # Qt and the main window imported
+APPLICATION = "application"  # QApplication created
+WINDOW = "window"  # Main window built and shown
+FIRST_PAINT = "first paint"  # Main window painted for the first time
+DOCUMENT_OPENED = "document opened"  # First PDF opened and adopted
+FIRST_SLIDE = "first slide"  # First page frame painted by any view
+
+
+def process_age() -> Optional[float]:
+    """
+    Seconds since this process was started, where the OS tells (Linux),
+    so interpreter start-up and module imports are counted too
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the command name, which may contain spaces
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return max(0.0, uptime - started)
+
+
+class StartupTimer:
+    """
+    Timestamps startup milestones.
+
+    Times are measured from process start where the OS reports it, else
+    from when this module was imported, which main imports first. Each
+    milestone is recorded once, the first time it is marked, so views can
+    mark FIRST_SLIDE on every paint at no cost. Reaching FIRST_SLIDE logs
+    the report and runs the on_complete() callbacks.
+
+    Used from the GUI thread only.
+    """
+
+    def __init__(self):
+        now = time.perf_counter()
+        age = process_age()
+        self.from_process_start = age is not None
+        self._origin = now - (age or 0.0)
+        self._marks: Dict[str, float] = {}
+        self._callbacks: List[Callable[[], None]] = []
+
+    def mark(self, milestone: str) -> None:
+        """Record the first time a milestone is reached"""
+        if milestone in self._marks:
+            return
+        self._marks[milestone] = time.perf_counter()
+        logger.debug(f"Startup: {milestone} at {self.elapsed_ms(milestone):.1f} ms")
+        if milestone == FIRST_SLIDE:
+            logger.info(f"Startup time:\n{self.format_report()}")
+            callbacks, self._callbacks = self._callbacks, []
+            for callback in callbacks:
+                callback()
+
+    def on_complete(self, callback: Callable[[], None]) -> None:
+        """Call callback once the first slide is painted"""
+        if FIRST_SLIDE in self._marks:
+            callback()
+        else:
+            self._callbacks.append(callback)
+
+    def elapsed_ms(self, milestone: str) -> Optional[float]:
+        """Time from start to a milestone, or None if not reached yet"""
+        timestamp = self._marks.get(milestone)
+        if timestamp is None:
+            return None
+        return (timestamp - self._origin) * 1000.0
+
+    def summary(self) -> Dict[str, object]:
+        """Milestones in the order reached: {"origin": ..., "milestones_ms": {...}}"""
+        return {
+            "origin": "process start" if self.from_process_start else "import",
+            "milestones_ms": {
+                milestone: round(self.elapsed_ms(milestone), 1)
+                for milestone in sorted(self._marks, key=self._marks.get)
+            },
+        }
+
+    def format_report(self) -> str:
+        """Human-readable milestone table with the time each phase took"""
+        summary = self.summary()
+        if not summary["milestones_ms"]:
+            return "No startup milestones yet"
+
+        lines = [f"{'milestone':<16} {'since ' + summary['origin']:>20} {'phase':>10}"]
+        previous = 0.0
+        for milestone, elapsed in summary["milestones_ms"].items():
+            lines.append(
+                f"{milestone:<16} {elapsed:>18.1f}ms {elapsed - previous:>8.1f}ms"
+            )
+            previous = elapsed
+        return "\n".join(lines)
+
+    def dump(self, path: Path) -> bool:
+        """Write the summary as JSON. Returns False if it cannot be written."""
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.summary(), indent=2))
+            logger.info(f"Wrote startup report to {path}")
+            return True
+        except OSError as e:
+            logger.error(f"Failed to write startup report {path}: {e}")
+            return False
+
+
+# Global timer, started when main imports it
+startup_timer = StartupTimer()
@@ -2,72 +2,442 @@
 Threading and background rendering management
 """
 
+import heapq
+import itertools
 import logging
-from collections import deque
-from typing import List, Optional
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from PySide6.QtCore import QObject, QRunnable, QThreadPool
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer
 from PySide6.QtCore import Signal as pyqtSignal
 
 from ..config import config
 from .pdf_processor import PDFProcessor
+from .prefetch import PrefetchPredictor
 from .state_manager import AppState
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class RenderRequest:
+    """
+    A page to render, either fitted into a target box in device pixels or,
+    without a size, at the default render scale. clip restricts it to a
+    region of the page, as (left, top, width, height) ratios. Drafts are
+    low-resolution previews kept in memory only; thumbnails are small
+    renders for the overview grid.
+    """
+
+    page_index: int
+    size: Optional[Tuple[int, int]] = None
+    draft: bool = False
+    thumbnail: bool = False
+    clip: Optional[Tuple[float, float, float, float]] = None
+
+    @property
+    def is_frame(self) -> bool:
+        """Whether this renders a full display frame of the whole page"""
+        return not (self.draft or self.thumbnail or self.clip)
+
+
+class RenderScheduler:
+    """
+    Thread-safe priority scheduler for page renders.
+
+    Owns a heap of pending render requests ranked around the current page
+    and its prefetch window (see PrefetchPredictor), and tracks which
+    requests are in flight or already rendered, so a request is never
+    queued twice. Changing the current page re-ranks the pending requests
+    in place instead of queueing them again, and drops queued prefetch
+    requests for pages that left the window.
+
+    Ranking:
+    0. Urgent requests from displays waiting for a frame
+    1. Current page and the page most likely shown next
+    2. The rest of the prefetch window, in the window's order
+    3. Overview thumbnails, nearest first (they are cheap, so the grid
+       fills in long before the whole deck is rendered)
+    4. All other pages, nearest first
+    Forward pages win ties, since presentations mostly move forward, and
+    drafts win ties against full frames.
+
+    Tiers 0-2 are foreground work, what the presenter sees now or next;
+    tiers 3-4 are background work. Background renders never occupy more
+    than max_background workers, so a foreground request always finds a
+    free thread instead of waiting behind bulk rendering, and none are
+    started while the background is paused (during navigation, see
+    pause_background()). Renders are not preempted: one already running
+    finishes first.
+
+    Every reset() (a new document) starts a new generation. Requests are
+    handed out together with the generation they were queued in, so work
+    finished for an earlier generation can be recognized and dropped;
+    queued requests of an old generation are never started.
+    """
+
+    # First tier of background work
+    BACKGROUND_TIER = 3
+
+    def __init__(self, max_workers: int, max_background: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        if max_background is None:
+            max_background = max_workers
+        # At least one, or background work would never run
+        self._max_background = max(1, min(max_workers, max_background))
+        self._background_paused = False
+        self._active_workers = 0
+        self._current_page = 0
+        self._window_rank: Dict[int, int] = {}  # {page_idx: position in window}
+        # Heap entries are (rank, sequence, request); the sequence keeps
+        # equally ranked requests in FIFO order
+        self._heap: List[Tuple[Tuple[int, int, bool, bool], int, RenderRequest]] = []
+        self._sequence = itertools.count()
+        self._pending: Set[RenderRequest] = set()
+        self._urgent: Set[RenderRequest] = set()
+        self._prefetch: Set[RenderRequest] = set()  # Pending for the window only
+        self._in_flight: Set[RenderRequest] = set()
+        self._in_flight_background: Set[RenderRequest] = set()
+        self._rendered: Set[RenderRequest] = set()
+        self._failed: Set[RenderRequest] = set()
+        self._rendered_pages: Set[int] = set()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Generation of the current document"""
+        with self._lock:
+            return self._generation
+
+    def _rank(self, request: RenderRequest) -> Tuple[int, int, bool, bool]:
+        """Sort key of a request, lower renders first"""
+        offset = request.page_index - self._current_page
+        position = self._window_rank.get(request.page_index)
+        if request in self._urgent:
+            tier = 0
+        elif request.thumbnail:
+            tier = 3
+        elif position is not None:
+            tier = 1 if position < 2 else 2
+        else:
+            tier = 4
+        distance = position if tier in (1, 2) else abs(offset)
+        return (tier, distance, offset < 0, not request.draft)
+
+    def _rebuild_heap(self) -> None:
+        """Re-rank all pending requests (lock held)"""
+        self._heap = [(self._rank(r), next(self._sequence), r) for r in self._pending]
+        heapq.heapify(self._heap)
+
+    def set_current_page(
+        self, page_idx: int, window: Optional[Sequence[int]] = None
+    ) -> None:
+        """
+        Re-rank pending requests around a new current page and, if given,
+        a new prefetch window (its pages, most likely next first). Prefetch
+        requests for pages outside the window are dropped, and urgent
+        requests made for the previous page lose their urgency.
+        """
+        with self._lock:
+            if window is None:
+                window_rank = self._window_rank
+            else:
+                window_rank = {page: position for position, page in enumerate(window)}
+            if page_idx == self._current_page and window_rank == self._window_rank:
+                return
+            if page_idx != self._current_page:
+                self._urgent.clear()
+            self._current_page = page_idx
+            self._window_rank = window_rank
+
+            stale = [r for r in self._prefetch if r.page_index not in window_rank]
+            self._pending.difference_update(stale)
+            self._prefetch.difference_update(stale)
+            self._rebuild_heap()
+
+    def enqueue(
+        self,
+        requests: Iterable[RenderRequest],
+        urgent: bool = False,
+        prefetch: bool = False,
+    ) -> int:
+        """
+        Queue requests that are not already pending, in flight or rendered.
+        Urgent requests jump ahead of everything else; an urgent request
+        that is already pending is promoted. Prefetch requests are dropped
+        again when their page leaves the prefetch window, unless they are
+        also queued without prefetch.
+        Returns the number of new workers the caller should start.
+        """
+        with self._lock:
+            promoted = False
+            for request in requests:
+                if request in self._pending:
+                    if not prefetch:
+                        self._prefetch.discard(request)
+                    if urgent and request not in self._urgent:
+                        self._urgent.add(request)
+                        promoted = True
+                    continue
+                if (
+                    request in self._in_flight
+                    or request in self._rendered
+                    or request in self._failed
+                ):
+                    continue
+                if urgent:
+                    self._urgent.add(request)
+                if prefetch:
+                    self._prefetch.add(request)
+                self._pending.add(request)
+                heapq.heappush(
+                    self._heap, (self._rank(request), next(self._sequence), request)
+                )
+
+            if promoted:
+                self._rebuild_heap()
+            return self._start_workers_locked()
+
+    def _start_workers_locked(self) -> int:
+        """Count the workers the pending work needs as started (lock held)"""
+        new_workers = min(self._max_workers - self._active_workers, len(self._pending))
+        new_workers = max(0, new_workers)
+        self._active_workers += new_workers
+        return new_workers
+
+    def pause_background(self) -> None:
+        """Start no background renders until resume_background()"""
+        with self._lock:
+            self._background_paused = True
+
+    def resume_background(self) -> int:
+        """
+        Let background renders start again.
+        Returns the number of new workers the caller should start.
+        """
+        with self._lock:
+            self._background_paused = False
+            return self._start_workers_locked()
+
+    def _background_allowed_locked(self) -> bool:
+        return (
+            not self._background_paused
+            and len(self._in_flight_background) < self._max_background
+        )
+
+    def take(self) -> Optional[Tuple[int, RenderRequest]]:
+        """
+        Pop the most urgent pending request and mark it in flight.
+        Returns (generation, request), or None when there is no work left;
+        the calling worker must then exit, as it is no longer counted as
+        active.
+        """
+        with self._lock:
+            while self._heap:
+                rank, _, request = self._heap[0]
+                if request not in self._pending:
+                    heapq.heappop(self._heap)
+                    continue
+                background = rank[0] >= self.BACKGROUND_TIER
+                if background and not self._background_allowed_locked():
+                    # Everything left is background work; a worker is
+                    # started for it once capacity frees up or it resumes
+                    break
+                heapq.heappop(self._heap)
+                self._pending.discard(request)
+                self._urgent.discard(request)
+                self._prefetch.discard(request)
+                self._in_flight.add(request)
+                if background:
+                    self._in_flight_background.add(request)
+                return self._generation, request
+            self._active_workers -= 1
+            return None
+
+    def finish(self, request: RenderRequest, success: bool, generation: int) -> None:
+        """Mark an in-flight request as done; results of old generations are ignored"""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._in_flight.discard(request)
+            self._in_flight_background.discard(request)
+            if success:
+                self._rendered.add(request)
+                if request.is_frame:
+                    self._rendered_pages.add(request.page_index)
+            else:
+                self._failed.add(request)
+
+    def mark_rendered(self, requests: Iterable[RenderRequest]) -> None:
+        """Record requests served outside the scheduler (e.g. from disk cache)"""
+        with self._lock:
+            for request in requests:
+                self._pending.discard(request)
+                self._urgent.discard(request)
+                self._prefetch.discard(request)
+                self._rendered.add(request)
+                if request.is_frame:
+                    self._rendered_pages.add(request.page_index)
+
+    def forget(self, requests: Iterable[RenderRequest]) -> None:
+        """
+        Allow rendered requests to be queued again, e.g. frames that were
+        evicted from memory and are not in the disk cache
+        """
+        with self._lock:
+            self._rendered.difference_update(requests)
+
+    def is_rendered(self, page_idx: int) -> bool:
+        """Check whether any frame of a page has been rendered"""
+        with self._lock:
+            return page_idx in self._rendered_pages
+
+    def rendered_count(self) -> int:
+        """Number of pages with at least one rendered frame"""
+        with self._lock:
+            return len(self._rendered_pages)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def discard_pending(self, predicate: Callable[[RenderRequest], bool]) -> int:
+        """Drop the queued requests predicate matches. Returns the count."""
+        with self._lock:
+            stale = [request for request in self._pending if predicate(request)]
+            if stale:
+                self._pending.difference_update(stale)
+                self._urgent.difference_update(stale)
+                self._prefetch.difference_update(stale)
+                self._rebuild_heap()
+            return len(stale)
+
+    def clear_pending(self) -> None:
+        """Drop all queued requests; in-flight requests still finish"""
+        with self._lock:
+            self._heap = []
+            self._pending.clear()
+            self._urgent.clear()
+            self._prefetch.clear()
+
+    def reset(self) -> None:
+        """
+        Forget all requests and start a new generation, e.g. when a new
+        document is loaded. Requests in flight finish, but their results
+        belong to the old generation.
+        """
+        with self._lock:
+            self._generation += 1
+            self._heap = []
+            self._pending.clear()
+            self._urgent.clear()
+            self._prefetch.clear()
+            self._in_flight.clear()
+            self._in_flight_background.clear()
+            self._rendered.clear()
+            self._failed.clear()
+            self._rendered_pages.clear()
+            self._current_page = 0
+            self._window_rank = {}
+
+
 class PDFRenderWorker(QRunnable):
     """
     Worker that runs in QThreadPool to render PDF pages.
+    Pulls pages from the scheduler one at a time until none are left that
+    it may take (see RenderScheduler for the background budget), so the
+    most urgent page is always picked at the moment a thread is free.
     Uses callbacks instead of signals to avoid QObject thread affinity issues.
+    The finished callback receives the generation the request was queued
+    in, the RenderRequest and the cache key; the error callback the
+    generation, the page index and the message.
     """
 
     def __init__(
         self,
         pdf_processor: PDFProcessor,
-        page_indices: List[int],
+        scheduler: RenderScheduler,
         on_finished_callback=None,
         on_error_callback=None,
     ):
         super().__init__()
         self.pdf_processor = pdf_processor
-        self.page_indices = page_indices
+        self.scheduler = scheduler
         self.on_finished_callback = on_finished_callback
         self.on_error_callback = on_error_callback
 
     def run(self):
         """Render pages in the thread pool"""
-        logger.info(f"PDFRenderWorker.run() started for pages: {self.page_indices}")
-        for page_idx in self.page_indices:
+        logger.debug("PDFRenderWorker.run() started")
+        while True:
+            job = self.scheduler.take()
+            if job is None:
+                break
+
+            generation, request = job
+            page_idx = request.page_index
+            if generation != self.scheduler.generation:
+                # The document changed since this request was taken
+                continue
             try:
-                logger.debug(f"Worker rendering page {page_idx}")
-                image_path = self.pdf_processor.render_page(page_idx)
-                logger.debug(f"render_page({page_idx}) returned: {image_path}")
+                logger.debug(f"Worker rendering {request}")
+                image_path = self.pdf_processor.render_page(
+                    page_idx,
+                    size=request.size,
+                    persist=not request.draft,
+                    clip=request.clip,
+                )
+                logger.debug(f"render_page({request}) returned: {image_path}")
+                if generation != self.scheduler.generation:
+                    logger.debug(f"Dropping {request}, the document changed")
+                    continue
+                self.scheduler.finish(request, image_path is not None, generation)
                 if image_path:
-                    logger.info(f"Worker completed page {page_idx}: {image_path}")
                     if self.on_finished_callback:
-                        self.on_finished_callback(page_idx, image_path)
+                        self.on_finished_callback(generation, request, image_path)
                 else:
                     logger.warning(f"render_page({page_idx}) returned None")
                     if self.on_error_callback:
-                        self.on_error_callback(page_idx, "Failed to render page")
+                        self.on_error_callback(
+                            generation, page_idx, "Failed to render page"
+                        )
             except Exception as e:
                 logger.error(
                     f"Worker error rendering page {page_idx}: {e}", exc_info=True
                 )
+                self.scheduler.finish(request, False, generation)
                 if self.on_error_callback:
-                    self.on_error_callback(page_idx, str(e))
-        logger.info(f"PDFRenderWorker.run() completed for pages: {self.page_indices}")
+                    self.on_error_callback(generation, page_idx, str(e))
+        logger.debug("PDFRenderWorker.run() completed")
 
 
 class RenderThreadPool(QObject):
     """
-    Manages PDF page rendering using QThreadPool with priority queue
+    Manages PDF page rendering using QThreadPool with priority queue.
+
+    Pages are rendered ahead within a prefetch window predicted from the
+    navigation so far, and decoded frames of pages outside it are evicted
+    from memory on every page turn. Only decks of up to
+    PREFETCH_WHOLE_DOCUMENT_PAGES pages are rendered completely, so the
+    work and memory of a page turn do not grow with the document.
+
+    Page turns pause background rendering until navigation has been idle
+    for RENDER_BACKGROUND_IDLE_MS.
     """
 
     renderFinished = pyqtSignal(int, str)  # (page_idx, image_path)
     renderError = pyqtSignal(int, str)  # (page_idx, error_message)
     renderProgress = pyqtSignal(int, int)  # (completed, total)
+    draftFinished = pyqtSignal(int, str)  # (page_idx, draft_image_path)
+    thumbnailFinished = pyqtSignal(int, str)  # (page_idx, thumbnail_path)
+
+    # Worker results, delivered to the GUI thread through queued connections
+    # (generation, RenderRequest, image_path)
+    _workerFinished = pyqtSignal(int, object, str)
+    _workerError = pyqtSignal(int, int, str)  # (generation, page_idx, message)
 
     def __init__(
         self, pdf_processor: PDFProcessor, state: AppState, max_threads: int = 4
@@ -75,142 +445,444 @@ class RenderThreadPool(QObject):
         super().__init__()
         self.pdf_processor = pdf_processor
         self.state = state
+
+        self.process_backend = None  # ProcessRenderBackend, if rendering in processes
+        if config.RENDER_BACKEND == "process":
+            # Imported here: multiprocessing is not needed by the thread backend
+            from .process_renderer import ProcessRenderBackend
+
+            # Each pool thread drives one worker process
+            max_threads = config.RENDER_PROCESSES or os.cpu_count() or max_threads
+            self.process_backend = ProcessRenderBackend(
+                max_threads, config.RENDER_PAGE_TIMEOUT
+            )
+            self.pdf_processor.set_process_backend(self.process_backend)
+            logger.info(f"Rendering with {max_threads} worker processes")
+
         self.thread_pool = QThreadPool()
         self.thread_pool.setMaxThreadCount(max_threads)
+        # Keep threads alive: each one holds its own open document handle
+        self.thread_pool.setExpiryTimeout(-1)
         self.max_threads = max_threads
 
-        self.priority_queue = deque()  # Priority rendering queue
-        self.rendered_pages = set()  # Track which pages are rendered
+        # Threads beyond the reserved ones may render background work
+        self.scheduler = RenderScheduler(
+            max_threads, max_threads - config.RENDER_FOREGROUND_THREADS
+        )
+        self.predictor = PrefetchPredictor(
+            config.PREFETCH_AHEAD,
+            config.PREFETCH_BEHIND,
+            config.PREFETCH_MAX_AHEAD,
+            config.PREFETCH_FAST_TURN_S,
+            config.PREFETCH_JUMP_TARGETS,
+        )
         self.total_pages = 0
-
-        # Connect state signals
+        # {display: (size, clip)}
+        self._targets: Dict[
+            str, Tuple[Tuple[int, int], Optional[Tuple[float, float, float, float]]]
+        ] = {}
+        self._thumbnail_size: Optional[Tuple[int, int]] = None
+
+        # While a document is being opened only its start page is rendered;
+        # document-wide work starts once that page is up or the budget ends
+        self._start_page: Optional[int] = None
+        self._start_timer = QTimer(self)
+        self._start_timer.setSingleShot(True)
+        self._start_timer.timeout.connect(self._begin_document_work)
+
+        # Background rendering pauses while the presenter is navigating and
+        # resumes once no page has been turned for RENDER_BACKGROUND_IDLE_MS
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._resume_background)
+
+        self._workerFinished.connect(self._on_render_finished)
+        self._workerError.connect(self._on_render_error)
+
+        # Connect state signals. The pool connects before any view, so the
+        # scheduler re-ranks before views request frames for the new page.
         self.state.totalPagesChanged.connect(self._on_total_pages_changed)
+        self.state.currentPageChanged.connect(self._on_current_page_changed)
+
+    def _on_current_page_changed(self, page_idx: int) -> None:
+        """
+        Predict the prefetch window from the page turn, re-rank the queue
+        around it, queue the window's pages and evict decoded frames of
+        pages outside it
+        """
+        self.predictor.observe(page_idx)
+        if config.RENDER_BACKGROUND_IDLE_MS > 0:
+            self.scheduler.pause_background()
+            self._idle_timer.start(config.RENDER_BACKGROUND_IDLE_MS)
+        window = self.predictor.window(page_idx, self.total_pages)
+        self.scheduler.set_current_page(page_idx, window)
+        if window and self._start_page is None:
+            self._enqueue(self._window_requests(window), prefetch=True)
+        if window:
+            # Thumbnails stay: the overview shows every page at once
+            thumbnails = [self._thumbnail_size] if self._thumbnail_size else []
+            evicted = self.pdf_processor.retain_pages(window, thumbnails)
+            if evicted:
+                logger.debug(f"Evicted {evicted} frames outside pages {window}")
 
     def render_priority_pages(self, current_page: int) -> None:
         """
-        Start rendering pages with priority queue strategy:
-        1. Current page (highest priority)
-        2. Adjacent pages (+/- 3 pages)
-        3. All other pages (lowest priority)
+        Make sure the prefetch window around the current page is queued
+        (and, for small decks, every other page) and rank the queue around
+        it. Pages already pending or in flight are re-ranked, never queued
+        twice.
         """
-        logger.info(f"render_priority_pages called with current_page={current_page}")
-        logger.debug(
-            f"total_pages={self.total_pages}, already_rendered={len(self.rendered_pages)}"
-        )
+        logger.debug(f"render_priority_pages called with current_page={current_page}")
 
         if self.total_pages <= 0:
             logger.warning("total_pages <= 0, skipping render")
             return
 
-        # Build priority queue
-        priority_queue = []
-
-        # High priority: current and next pages
-        for offset in [0, 1]:
-            page_idx = current_page + offset
-            if 0 <= page_idx < self.total_pages and page_idx not in self.rendered_pages:
-                priority_queue.append(page_idx)
-
-        # Medium priority: adjacent pages
-        for offset in [-3, -2, -1, 2, 3]:
-            page_idx = current_page + offset
-            if (
-                0 <= page_idx < self.total_pages
-                and page_idx not in priority_queue
-                and page_idx not in self.rendered_pages
-            ):
-                priority_queue.append(page_idx)
-
-        # Low priority: remaining pages
-        for page_idx in range(self.total_pages):
-            if page_idx not in priority_queue and page_idx not in self.rendered_pages:
-                priority_queue.append(page_idx)
-
-        logger.info(
-            f"Priority queue built with {len(priority_queue)} pages: {priority_queue[:10]}..."
-        )
-        # Submit render tasks
-        self._submit_render_tasks(priority_queue)
+        window = self.predictor.window(current_page, self.total_pages)
+        self.scheduler.set_current_page(current_page, window)
+        if self._start_page is not None:
+            # Still opening: only the page on screen, see start_document()
+            self._enqueue(self._page_requests(current_page), urgent=True)
+            return
+        self._enqueue(self._window_requests(window), prefetch=True)
+        if self.total_pages <= config.PREFETCH_WHOLE_DOCUMENT_PAGES:
+            # Small decks are rendered completely, into the disk cache
+            self._enqueue(self._document_requests())
 
-    def render_all_pages(self) -> None:
-        """Render all pages in priority order"""
+    def start_document(self, start_page: int, budget_ms: int) -> None:
+        """
+        Begin rendering a newly opened document at start_page.
+        The start page's frames are rendered before anything else, and the
+        document-wide work (adopting cached pages, queueing every page and
+        thumbnail), which grows with the page count, is held back until
+        that page is rendered or budget_ms has passed. The first slide thus
+        appears in about the same time whatever the document size.
+        """
         if self.total_pages <= 0:
             return
+        self._start_page = start_page
+        self._start_timer.start(budget_ms)
+        self.render_priority_pages(start_page)
+
+    def _begin_document_work(self) -> None:
+        """Queue the whole document once the start page is up"""
+        if self._start_page is None:
+            return
+        logger.debug(f"Start page {self._start_page} up, queueing the document")
+        self._start_page = None
+        self._start_timer.stop()
+        self.adopt_cached_pages()
+        self.render_priority_pages(self.state.current_page)
 
-        page_indices = [
-            i for i in range(self.total_pages) if i not in self.rendered_pages
+    def set_target(
+        self,
+        name: str,
+        size: Optional[Tuple[int, int]],
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> None:
+        """
+        Register the pixel size (device pixels) a display shows pages at,
+        and the page region it shows, or unregister it with None. Pages in
+        the prefetch window are rendered ahead for every registered target,
+        all others (in small decks) for the largest whole-page one.
+        """
+        old = self._targets.get(name)
+        if size is None:
+            self._targets.pop(name, None)
+        else:
+            self._targets[name] = (size, clip)
+        changed = self._targets.get(name) != old
+
+        if changed and self.total_pages > 0:
+            logger.debug(f"Render target {name} changed to {size}")
+            # Queued frames at the old size are no longer useful, unless
+            # another display shows pages at it; thumbnails are kept
+            if old is not None and old not in self._targets.values():
+                dropped = self.scheduler.discard_pending(
+                    lambda request: (
+                        not request.thumbnail and (request.size, request.clip) == old
+                    )
+                )
+                logger.debug(f"Dropped {dropped} queued renders at {old}")
+            self.render_priority_pages(self.state.current_page)
+
+    def _primary_size(self) -> Optional[Tuple[int, int]]:
+        """The largest registered whole-page target, rendered for every page"""
+        sizes = [size for size, clip in self._targets.values() if clip is None]
+        if not sizes:
+            return None
+        return max(sizes, key=lambda size: size[0] * size[1])
+
+    def _page_requests(self, page_idx: int) -> List[RenderRequest]:
+        """Requests for a page's frame at every registered target"""
+        targets = set(self._targets.values()) or {(None, None)}
+        return [RenderRequest(page_idx, size, clip=clip) for size, clip in targets]
+
+    def _window_requests(self, window: Sequence[int]) -> List[RenderRequest]:
+        """Requests for the prefetch window: every target and the thumbnail"""
+        requests = []
+        for page_idx in window:
+            requests.extend(self._page_requests(page_idx))
+        if self._thumbnail_size is not None:
+            requests.extend(
+                RenderRequest(page_idx, self._thumbnail_size, thumbnail=True)
+                for page_idx in window
+            )
+        return requests
+
+    def _document_requests(self) -> List[RenderRequest]:
+        """Requests for every page at the primary size, and every thumbnail"""
+        primary = self._primary_size()
+        requests = [
+            RenderRequest(page_idx, primary) for page_idx in range(self.total_pages)
         ]
-        self._submit_render_tasks(page_indices)
+        if self._thumbnail_size is not None:
+            requests.extend(
+                RenderRequest(page_idx, self._thumbnail_size, thumbnail=True)
+                for page_idx in range(self.total_pages)
+            )
+        return requests
 
-    def _submit_render_tasks(self, page_indices: List[int]) -> None:
-        """Submit render tasks to thread pool"""
-        if not page_indices:
-            logger.info("No pages to render")
+    def set_thumbnail_size(self, size: Optional[Tuple[int, int]]) -> None:
+        """
+        Set the box (device pixels) overview thumbnails are rendered into,
+        or None to stop rendering thumbnails
+        """
+        if size == self._thumbnail_size:
             return
+        self._thumbnail_size = size
+        if self.total_pages > 0:
+            self.render_priority_pages(self.state.current_page)
 
-        logger.info(
-            f"_submit_render_tasks called with {len(page_indices)} pages: {page_indices}"
+    def request_thumbnail(self, page_idx: int) -> Tuple[Optional[str], bool]:
+        """
+        Get the overview thumbnail of a page. Returns (cache_key, ready);
+        thumbnails that are not cached yet are queued at thumbnail priority
+        and delivered by thumbnailFinished.
+        """
+        size = self._thumbnail_size
+        if size is None or self.total_pages <= 0:
+            return None, False
+        if not 0 <= page_idx < self.total_pages:
+            return None, False
+        if self.pdf_processor.get_fingerprint() is None:
+            # Closed (or never opened): there is no cache directory to key by
+            return None, False
+
+        request = RenderRequest(page_idx, size, thumbnail=True)
+        cache_key = self.pdf_processor.find_cached_frame(page_idx, size=size)
+        if cache_key is not None:
+            self.scheduler.mark_rendered([request])
+            return cache_key, True
+
+        # Rendered before, but evicted from memory and not on disk
+        self.scheduler.forget([request])
+        self._enqueue([request])
+        return str(self.pdf_processor.get_cache_path(page_idx, size=size)), False
+
+    def request_frame(
+        self,
+        page_idx: int,
+        size: Optional[Tuple[int, int]],
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Get a page frame (or a clipped region of it) fitted to a target size
+        for a display.
+        Returns (cache_key, ready). When the frame is not cached yet it is
+        queued ahead of all other work, and renderFinished delivers the same
+        cache key once it is ready.
+        """
+        if self.total_pages <= 0 or not 0 <= page_idx < self.total_pages:
+            return None, False
+        if self.pdf_processor.get_fingerprint() is None:
+            return None, False
+
+        request = RenderRequest(page_idx, size, clip=clip)
+        cache_key = self.pdf_processor.find_cached_frame(page_idx, size=size, clip=clip)
+        if cache_key is not None:
+            self.scheduler.mark_rendered([request])
+            return cache_key, True
+
+        self.scheduler.forget([request])
+        self._enqueue([request], urgent=True)
+        cache_path = self.pdf_processor.get_cache_path(page_idx, size=size, clip=clip)
+        return str(cache_path), False
+
+    def request_draft(
+        self,
+        page_idx: int,
+        size: Optional[Tuple[int, int]],
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Get a low-resolution preview of a page for a display that is
+        waiting for its frame. Returns (cache_key, ready) like
+        request_frame(); pending drafts are delivered by draftFinished and
+        rank ahead of the full frame. Returns (None, False) when drafts are
+        disabled or the display size is unknown.
+        """
+        if not config.PROGRESSIVE_RENDERING or size is None:
+            return None, False
+        if self.total_pages <= 0 or not 0 <= page_idx < self.total_pages:
+            return None, False
+        if self.pdf_processor.get_fingerprint() is None:
+            return None, False
+
+        factor = config.DRAFT_RENDER_FACTOR
+        draft_size = (max(1, round(size[0] * factor)), max(1, round(size[1] * factor)))
+        cache_path = self.pdf_processor.get_cache_path(
+            page_idx, size=draft_size, clip=clip
         )
+        cache_key = str(cache_path)
+        if self.pdf_processor.image_cache.contains(cache_key):
+            return cache_key, True
 
-        # Split into batches to avoid too many workers
-        batch_size = max(1, len(page_indices) // self.max_threads)
-        batches = [
-            page_indices[i : i + batch_size]
-            for i in range(0, len(page_indices), batch_size)
-        ]
+        request = RenderRequest(page_idx, draft_size, draft=True, clip=clip)
+        self.scheduler.forget([request])
+        self._enqueue([request], urgent=True)
+        return cache_key, False
+
+    def adopt_cached_pages(self) -> int:
+        """
+        Register pages that are already in the disk cache as rendered,
+        so reopening a deck shows them without rasterizing again.
+        Returns the number of adopted pages.
+        """
+        size = self._primary_size()
+        cached = self.pdf_processor.get_cached_pages(size=size)
+        self.scheduler.mark_rendered(RenderRequest(p, size) for p in cached)
+        for page_idx in sorted(cached):
+            self.state.set_page_image(page_idx, cached[page_idx])
 
-        logger.info(f"Split into {len(batches)} batches (batch_size={batch_size})")
+        if cached:
+            self.renderProgress.emit(self.scheduler.rendered_count(), self.total_pages)
+        return len(cached)
 
-        for batch_idx, batch in enumerate(batches):
-            logger.info(f"Creating worker for batch {batch_idx}: {batch}")
+    def render_all_pages(self) -> None:
+        """Render all pages in priority order, whatever the deck size"""
+        if self.total_pages <= 0:
+            return
+
+        window = self.predictor.window(self.state.current_page, self.total_pages)
+        self._enqueue(self._window_requests(window))
+        self._enqueue(self._document_requests())
+
+    def render_requests(self, requests: Iterable[RenderRequest]) -> None:
+        """
+        Queue explicit renders, e.g. every page at a set of sizes to warm
+        the disk cache. Results arrive through the usual signals.
+        """
+        if self.total_pages <= 0:
+            return
+
+        self._enqueue(requests)
+
+    def _enqueue(
+        self,
+        requests: Iterable[RenderRequest],
+        urgent: bool = False,
+        prefetch: bool = False,
+    ) -> None:
+        """Queue requests with the scheduler and start workers as needed"""
+        self._start_workers(self.scheduler.enqueue(requests, urgent, prefetch))
+
+    def _resume_background(self) -> None:
+        """Navigation has stopped: let background rendering continue"""
+        self._start_workers(self.scheduler.resume_background())
+
+    def _start_workers(self, new_workers: int) -> None:
+        """Start workers counted as started by the scheduler"""
+        for _ in range(new_workers):
             worker = PDFRenderWorker(
                 self.pdf_processor,
-                batch,
-                on_finished_callback=self._on_render_finished,
-                on_error_callback=self._on_render_error,
+                self.scheduler,
+                on_finished_callback=self._workerFinished.emit,
+                on_error_callback=self._workerError.emit,
             )
-            logger.info(f"Callbacks registered, starting worker for batch {batch_idx}")
             self.thread_pool.start(worker)
 
-        logger.info(f"All {len(batches)} workers submitted to thread pool")
+        if new_workers:
+            logger.debug(
+                f"Started {new_workers} render workers, "
+                f"{self.scheduler.pending_count()} requests pending"
+            )
 
-    def _on_render_finished(self, page_idx: int, image_path: str) -> None:
-        """Handle successful render"""
-        logger.info(
-            f"_on_render_finished called: page_idx={page_idx}, image_path={image_path}"
-        )
-        self.rendered_pages.add(page_idx)
+    def _on_render_finished(
+        self, generation: int, request: RenderRequest, image_path: str
+    ) -> None:
+        """Handle successful render (GUI thread)"""
         logger.debug(
-            f"Added page {page_idx} to rendered_pages, now: {self.rendered_pages}"
+            f"_on_render_finished called: request={request}, image_path={image_path}"
         )
-        self.state.set_page_image(page_idx, image_path)
+        if generation != self.scheduler.generation:
+            # Rendered for a document that has been replaced since
+            logger.debug(f"Dropping stale render of {request}")
+            return
+
+        page_idx = request.page_index
+        if request.draft:
+            self.draftFinished.emit(page_idx, image_path)
+            return
+        if request.thumbnail:
+            self.thumbnailFinished.emit(page_idx, image_path)
+            return
+
+        # AppState tracks whole-page frames only; clipped regions are
+        # delivered to the displays that asked for them
+        if request.clip is None:
+            self.state.set_page_image(page_idx, image_path)
         self.renderFinished.emit(page_idx, image_path)
 
+        if page_idx == self._start_page:
+            self._begin_document_work()
+
         # Emit progress
-        progress = len(self.rendered_pages)
+        progress = self.scheduler.rendered_count()
         logger.debug(f"Rendering progress: {progress}/{self.total_pages}")
         self.renderProgress.emit(progress, self.total_pages)
 
-    def _on_render_error(self, page_idx: int, error_msg: str) -> None:
-        """Handle render error"""
+    def _on_render_error(self, generation: int, page_idx: int, error_msg: str) -> None:
+        """Handle render error (GUI thread)"""
+        if generation != self.scheduler.generation:
+            return
         logger.error(f"Render error for page {page_idx}: {error_msg}")
         self.renderError.emit(page_idx, error_msg)
 
     def _on_total_pages_changed(self, total: int) -> None:
         """Reset when PDF changes"""
         self.total_pages = total
-        self.rendered_pages = set()
+        self.scheduler.reset()
+        self.predictor.reset()
+        self._start_page = None
+        self._start_timer.stop()
 
     def wait_for_all(self) -> None:
         """Wait for all threads to complete (blocking)"""
         self.thread_pool.waitForDone()
 
+    def shutdown(self) -> None:
+        """
+        Drop queued work and stop the backend. Only the renders already
+        running are waited for (at most one page per thread), however many
+        pages were queued; their results are discarded.
+        """
+        self.clear()
+        self.thread_pool.waitForDone()
+        if self.process_backend is not None:
+            self.pdf_processor.set_process_backend(None)
+            self.process_backend.close()
+            self.process_backend = None
+
     def clear(self) -> None:
-        """Clear the render queue and reset"""
-        self.thread_pool.clear()
-        self.rendered_pages = set()
-        self.priority_queue.clear()
+        """
+        Clear the render queue and reset, starting a new generation: queued
+        renders never start and results of running ones are dropped
+        """
+        self.scheduler.reset()
+        self._start_page = None
+        self._start_timer.stop()
 
     def is_page_rendered(self, page_idx: int) -> bool:
         """Check if a page has been rendered"""
-        return page_idx in self.rendered_pages
+        return self.scheduler.is_rendered(page_idx)
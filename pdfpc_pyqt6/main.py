@@ -2,12 +2,15 @@
 Main entry point for PDF Presenter Console application
 """
 
+import argparse
 import logging
+import multiprocessing
+import os
 import sys
 
-from PySide6.QtWidgets import QApplication
-
-from .ui.main_window import MainWindow
+from .config import config
+from .core.startup_timer import APPLICATION, IMPORTS, WINDOW, startup_timer
+from .prerender import TARGET_NAMES
 
 # Configure logging
 logging.basicConfig(
@@ -17,13 +20,128 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def parse_args(argv):
+    """Parse the command line; unknown options are left for Qt"""
+    parser = argparse.ArgumentParser(
+        prog="pdfpc-pyqt6", description="PDF Presenter Console"
+    )
+    parser.add_argument("pdf", nargs="?", help="PDF to open")
+    parser.add_argument(
+        "--startup-report",
+        metavar="FILE",
+        help="quit once the first slide is painted and write the startup "
+        "timings to FILE as JSON, or print them with -",
+    )
+    parser.add_argument(
+        "--prerender",
+        metavar="PDF",
+        help="render the deck into the disk cache without opening a window, then exit",
+    )
+    parser.add_argument(
+        "--targets",
+        default="thumbnail,presenter",
+        help="comma-separated render targets for --prerender: WxH sizes in "
+        f"device pixels (e.g. the projector's 1920x1080) or {', '.join(TARGET_NAMES)} "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="render processes for --prerender (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--window",
+        default=f"{config.DEFAULT_WINDOW_WIDTH}x{config.DEFAULT_WINDOW_HEIGHT}",
+        help="presenter window size the notes and presenter targets are laid "
+        "out for (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--pixel-ratio",
+        type=float,
+        default=1.0,
+        help="device pixel ratio of the presenter screen (default: %(default)s)",
+    )
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def run_prerender(args) -> int:
+    """Pre-render a deck headlessly; returns the exit code"""
+    from PySide6.QtWidgets import QApplication
+
+    from .prerender import parse_size, prerender
+
+    # Only warnings from the pipeline; progress is printed
+    logging.getLogger().setLevel(logging.WARNING)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _app = QApplication(sys.argv[:1])  # Widgets need an application instance
+    try:
+        window_size = parse_size(args.window)
+    except ValueError as e:
+        print(f"Invalid --window: {e}", file=sys.stderr)
+        return 2
+    targets = [target.strip() for target in args.targets.split(",") if target.strip()]
+    return prerender(args.prerender, targets, args.jobs, window_size, args.pixel_ratio)
+
+
 def main():
     """Application entry point"""
+    # Render worker processes re-enter here in frozen builds
+    multiprocessing.freeze_support()
+
+    args = parse_args(sys.argv[1:])
+    if args.prerender:
+        sys.exit(run_prerender(args))
+    sys.exit(run_gui())
+
+
+def run_gui() -> int:
+    """Run the presenter console; returns the exit code"""
+    from PySide6.QtWidgets import QApplication
+
+    from .ui.main_window import MainWindow
+
+    startup_timer.mark(IMPORTS)
     app = QApplication(sys.argv)
+    startup_timer.mark(APPLICATION)
+    # Parsed again without the options Qt has taken, e.g. -platform offscreen
+    args = parse_args(app.arguments()[1:])
 
-    # Create and show main window
+    # Create and show main window; a PDF given is opened in the background
+    # while the window comes up
     window = MainWindow()
+    if args.pdf:
+        window._load_pdf(args.pdf)
     window.show()
+    startup_timer.mark(WINDOW)
+
+    if args.startup_report:
+        install_startup_report(app, window, args.startup_report)
 
     logger.info("Application started")
-    sys.exit(app.exec())
+    return app.exec()
+
+
+def install_startup_report(app, window, path: str) -> None:
+    """Quit with the startup report once the first slide is up"""
+    from PySide6.QtCore import QTimer
+
+    def report() -> None:
+        if path == "-":
+            print(startup_timer.format_report(), flush=True)
+            exit_code = 0
+        else:
+            exit_code = 0 if startup_timer.dump(path) else 1
+        # The first slide is marked from within a paint, so exit once it is
+        # over rather than closing the window in the middle of it
+        QTimer.singleShot(0, lambda: app.exit(exit_code))
+
+    def failed(message: str) -> None:
+        print(f"No slide shown: {message}", file=sys.stderr)
+        app.exit(1)
+
+    startup_timer.on_complete(report)
+    # A modal dialog would keep the event loop from exiting
+    window.show_error_dialogs = False
+    window.state.pdfLoadingError.connect(failed)
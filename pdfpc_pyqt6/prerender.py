@@ -0,0 +1,228 @@
+"""
+Headless pre-rendering: fill the disk cache for a deck ahead of a talk
+"""
+
+import logging
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from .config import config
+
+logger = logging.getLogger(__name__)
+
+# Named targets; anything else must be a WxH size in device pixels
+TARGET_NAMES = ("thumbnail", "notes", "presenter")
+
+# (size, clip, thumbnail) of one render per page
+Target = Tuple[Tuple[int, int], Optional[Tuple[float, float, float, float]], bool]
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    """Parse a WxH size. Raises ValueError."""
+    width, sep, height = text.lower().partition("x")
+    if not sep or int(width) <= 0 or int(height) <= 0:
+        raise ValueError(f"invalid size {text!r}, expected WxH")
+    return int(width), int(height)
+
+
+def presenter_pane_sizes(
+    window_size: Tuple[int, int], pixel_ratio: float
+) -> Dict[str, Tuple[Tuple[int, int], Optional[Tuple[float, float, float, float]]]]:
+    """
+    Lay out a presenter view offscreen at window_size and get the
+    {pane: (render size, clip)} its displays would request, so the frames
+    rendered here have the cache keys the GUI looks up
+    """
+    from .core.pdf_processor import PDFProcessor
+    from .core.state_manager import AppState
+    from .core.threading_manager import RenderThreadPool
+    from .ui.presenter_view import PresenterView
+
+    app = QApplication.instance()
+    state = AppState()
+    processor = PDFProcessor()
+    pool = RenderThreadPool(processor, state, max_threads=1)
+    view = PresenterView(state, processor, pool)
+    view.resize(*window_size)
+    view.show()
+    app.processEvents()
+
+    panes = {}
+    for name, display, clip in view._displays():
+        # Laid out at a pixel ratio of 1, so this is the size in logical pixels
+        width, height = display.render_size() or (0, 0)
+        if width > 0 and height > 0:
+            size = (round(width * pixel_ratio), round(height * pixel_ratio))
+            panes[name] = (size, clip)
+
+    view.close()
+    view.deleteLater()
+    pool.shutdown()
+    app.processEvents()
+    return panes
+
+
+def resolve_targets(
+    names: List[str], window_size: Tuple[int, int], pixel_ratio: float
+) -> List[Target]:
+    """Turn target names and sizes into renders. Raises ValueError."""
+    targets: List[Target] = []
+    panes = None
+    for name in names:
+        if name == "thumbnail":
+            size = (
+                round(config.THUMBNAIL_SIZE_WIDTH * pixel_ratio),
+                round(config.THUMBNAIL_SIZE_HEIGHT * pixel_ratio),
+            )
+            targets.append((size, None, True))
+        elif name in ("notes", "presenter"):
+            if panes is None:
+                panes = presenter_pane_sizes(window_size, pixel_ratio)
+            for pane, (size, clip) in panes.items():
+                if name == "presenter" or pane == "presenter.notes":
+                    targets.append((size, clip, False))
+        else:
+            targets.append((parse_size(name), None, False))
+
+    # The same render may be asked for by several targets
+    return list(dict.fromkeys(targets))
+
+
+def prerender(
+    pdf_path: str,
+    target_names: List[str],
+    jobs: int = 0,
+    window_size: Optional[Tuple[int, int]] = None,
+    pixel_ratio: float = 1.0,
+) -> int:
+    """
+    Render every page of a PDF for every target into the disk cache,
+    reporting progress on stdout. Needs a QApplication.
+    jobs is the number of render processes (0 = one per CPU).
+    Returns a process exit code: 0 on success, 1 if any page failed and
+    2 if the document could not be rendered at all.
+    """
+    # The pipeline is imported here, so the GUI's command line parsing does
+    # not import it
+    from .core.pdf_processor import PDFProcessor
+    from .core.state_manager import AppState
+    from .core.threading_manager import RenderRequest, RenderThreadPool
+
+    if not config.ENABLE_RENDER_CACHE:
+        print("The render cache is disabled (ENABLE_RENDER_CACHE)", file=sys.stderr)
+        return 2
+    if window_size is None:
+        window_size = (config.DEFAULT_WINDOW_WIDTH, config.DEFAULT_WINDOW_HEIGHT)
+    try:
+        targets = resolve_targets(target_names, window_size, pixel_ratio)
+    except ValueError as e:
+        print(f"Invalid target: {e}", file=sys.stderr)
+        return 2
+    if not targets:
+        print("No render targets", file=sys.stderr)
+        return 2
+
+    # One render process per core; the pool runs a thread to drive each.
+    # Nobody is presenting, so none is held back for foreground renders.
+    config.RENDER_BACKEND = "process"
+    config.RENDER_PROCESSES = jobs
+    config.RENDER_FOREGROUND_THREADS = 0
+    state = AppState()
+    processor = PDFProcessor()
+    if not processor.load_pdf(pdf_path):
+        print(f"Failed to open {pdf_path}", file=sys.stderr)
+        return 2
+    page_count = processor.get_page_count()
+    if page_count == 0:
+        print(f"{pdf_path} has no pages", file=sys.stderr)
+        processor.close()
+        return 2
+    pool = RenderThreadPool(processor, state, max_threads=config.MAX_RENDER_THREADS)
+    state.set_total_pages(page_count)
+
+    requests = []
+    cached = 0
+    for page_idx in range(page_count):
+        for size, clip, thumbnail in targets:
+            if processor.find_cached_frame(page_idx, size=size, clip=clip):
+                cached += 1
+            else:
+                requests.append(
+                    RenderRequest(page_idx, size, thumbnail=thumbnail, clip=clip)
+                )
+
+    labels = ", ".join(
+        f"{size[0]}x{size[1]}{' notes' if clip else ''}{' thumbnail' if thumb else ''}"
+        for size, clip, thumb in targets
+    )
+    print(
+        f"Pre-rendering {pdf_path}: {page_count} pages at {labels} "
+        f"with {pool.max_threads} processes ({cached} frames already cached)"
+    )
+
+    # Frames to render per page, for reporting in pages
+    frames_per_page = max(len(requests), 1) / page_count
+    done = 0
+    failed: List[int] = []
+    loop = QEventLoop()
+    start = time.perf_counter()
+
+    interactive = sys.stdout.isatty()
+
+    def report(final: bool = False) -> None:
+        elapsed = time.perf_counter() - start
+        rate = done / frames_per_page / elapsed if elapsed > 0 else 0.0
+        width = len(str(len(requests)))
+        line = (
+            f"[{done + len(failed):>{width}}/{len(requests)}] "
+            f"{rate:.1f} pages/s, {len(failed)} failed"
+        )
+        if interactive:
+            # Redraw one status line
+            print(f"\r{line}", end="\n" if final else "", flush=True)
+        else:
+            print(line, flush=True)
+
+    def on_finished(page_idx: int, _path: str) -> None:
+        nonlocal done
+        done += 1
+        check_done()
+
+    def on_error(page_idx: int, message: str) -> None:
+        failed.append(page_idx)
+        check_done()
+
+    def check_done() -> None:
+        if done + len(failed) >= len(requests):
+            loop.quit()
+
+    pool.renderFinished.connect(on_finished)
+    pool.thumbnailFinished.connect(on_finished)
+    pool.renderError.connect(on_error)
+    progress_timer = QTimer()
+    progress_timer.timeout.connect(report)
+
+    if requests:
+        pool.render_requests(requests)
+        progress_timer.start(500 if interactive else 5000)
+        loop.exec()
+        progress_timer.stop()
+        report(final=True)
+
+    pool.shutdown()
+    processor.close()  # Waits for the cache writes
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Rendered {done} frames in {elapsed:.1f}s "
+        f"({done / frames_per_page / max(elapsed, 1e-9):.1f} pages/s)"
+    )
+    if failed:
+        pages = ", ".join(str(page_idx + 1) for page_idx in sorted(set(failed)))
+        print(f"Failed to render pages: {pages}", file=sys.stderr)
+        return 1
+    return 0
@@ -1,5 +1,13 @@
 """UI components and windows"""
 
-from .main_window import MainWindow
+import importlib
 
 __all__ = ["MainWindow"]
+
+
+def __getattr__(name):
+    # Imported on first access, so that importing one UI module does not
+    # import every window and view
+    if name != "MainWindow":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(".main_window", __name__).MainWindow
@@ -2,6 +2,7 @@
 Main application window
 """
 
+import html
 import logging
 from pathlib import Path
 
@@ -19,20 +20,22 @@ from PySide6.QtWidgets import (
 )
 
 from ..config import config
-from ..core.pdf_processor import PDFProcessor
+from ..core.document_loader import DocumentLoader
+from ..core.latency_monitor import latency_monitor
+from ..core.pdf_processor import OpenedDocument, PDFProcessor
+from ..core.startup_timer import DOCUMENT_OPENED, FIRST_PAINT, startup_timer
 from ..core.state_manager import AppState
-from ..core.threading_manager import RenderThreadPool
-from .overview_view import OverviewView
-from .presenter_view import PresenterView
-from .projector_window import ProjectorWindow
-from .widgets.page_display import PageDisplay
 
 logger = logging.getLogger(__name__)
 
 
 class MainWindow(QMainWindow):
     """
-    Main application window with PDF viewing and navigation
+    Main application window with PDF viewing and navigation.
+
+    The render pool and the views are built on first use: the pool when
+    the first PDF starts loading, each view when it is first shown. Until
+    then the window is just the welcome screen, so it comes up quickly.
     """
 
     def __init__(self):
@@ -45,9 +48,12 @@ class MainWindow(QMainWindow):
         # Core components
         self.state = AppState()
         self.pdf_processor = PDFProcessor()
-        self.render_thread_pool = RenderThreadPool(
-            self.pdf_processor, self.state, max_threads=config.MAX_RENDER_THREADS
-        )
+        self._render_thread_pool = None
+        self.document_loader = DocumentLoader(self)
+        self._loading_path = None
+        # Load and render errors open modal dialogs, which block until
+        # dismissed; unattended runs (--startup-report) turn them off
+        self.show_error_dialogs = True
 
         # UI setup
         self._setup_ui()
@@ -85,23 +91,62 @@ class MainWindow(QMainWindow):
             }
         """)
 
-        # Create views
-        self.overview_view = OverviewView(self.state, self.pdf_processor)
-        self.presenter_view = PresenterView(self.state, self.pdf_processor)
-
-        # Add all to stacked widget
+        # Views are added when first shown
+        self._overview_view = None
+        self._presenter_view = None
         self.stacked_widget.addWidget(self.welcome_label)
-        self.stacked_widget.addWidget(self.overview_view)
-        self.stacked_widget.addWidget(self.presenter_view)
 
         layout.addWidget(self.stacked_widget)
         central_widget.setLayout(layout)
 
+    @property
+    def render_thread_pool(self):
+        """The RenderThreadPool, created on first use"""
+        return self._start_render_pool()
+
+    def _start_render_pool(self):
+        """Create the render pool unless it is running"""
+        if self._render_thread_pool is None:
+            from ..core.threading_manager import RenderThreadPool
+
+            self._render_thread_pool = RenderThreadPool(
+                self.pdf_processor, self.state, max_threads=config.MAX_RENDER_THREADS
+            )
+        return self._render_thread_pool
+
+    @property
+    def overview_view(self):
+        """The OverviewView, built on first use"""
+        if self._overview_view is None:
+            from .overview_view import OverviewView
+
+            self._overview_view = OverviewView(
+                self.state, self.pdf_processor, self.render_thread_pool
+            )
+            self.stacked_widget.addWidget(self._overview_view)
+        return self._overview_view
+
+    @property
+    def presenter_view(self):
+        """The PresenterView, built on first use"""
+        if self._presenter_view is None:
+            from .presenter_view import PresenterView
+
+            self._presenter_view = PresenterView(
+                self.state, self.pdf_processor, self.render_thread_pool
+            )
+            self.stacked_widget.addWidget(self._presenter_view)
+        return self._presenter_view
+
     def _connect_signals(self) -> None:
         """Connect signals and slots"""
         # PDF processor signals
         self.pdf_processor.renderError.connect(self._on_render_error)
 
+        # Background document opening
+        self.document_loader.opened.connect(self._on_document_opened)
+        self.document_loader.failed.connect(self.state.pdfLoadingError.emit)
+
         # State signals
         self.state.pdfLoadingStarted.connect(self._on_pdf_loading_started)
         self.state.pdfLoadingFinished.connect(self._on_pdf_loading_finished)
@@ -127,6 +172,9 @@ class MainWindow(QMainWindow):
         # Projector control
         QShortcut(Qt.Key.Key_F, self, self.toggle_projector)
 
+        # Diagnostics
+        QShortcut(QKeySequence("Ctrl+Shift+L"), self, self.show_latency_report)
+
     def open_pdf(self) -> None:
         """Open a PDF file dialog"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -139,42 +187,53 @@ class MainWindow(QMainWindow):
         self._load_pdf(file_path)
 
     def _load_pdf(self, pdf_path: str) -> None:
-        """Load a PDF file"""
+        """
+        Start loading a PDF file. It is opened in the background; the
+        current deck stays usable until the new one is ready.
+        """
+        logger.info(f"_load_pdf called with {pdf_path}")
+        self._loading_path = pdf_path
+        self.document_loader.open(pdf_path)
+        # Start the render pool (and any worker processes) while the
+        # document is opened in the background
+        self._start_render_pool()
+        self.state.pdfLoadingStarted.emit()
+
+    def _on_document_opened(self, opened: OpenedDocument) -> None:
+        """Switch to a document opened in the background"""
         try:
-            logger.info(f"_load_pdf called with {pdf_path}")
-            self.state.pdfLoadingStarted.emit()
-
-            # Wait for old rendering tasks to complete
-            logger.debug("Waiting for old render tasks to complete")
-            self.render_thread_pool.wait_for_all()
-
-            # Clear old cache and state before loading new PDF
-            logger.debug("Clearing old PDF cache and state")
-            self.pdf_processor.clear_cache()
-            self.state.clear_page_images()
-            self.state.set_current_page(0)
+            # Reopening the same file keeps the presenter on the same slide
+            start_page = 0
+            if opened.pdf_path == self.state.pdf_path:
+                start_page = self.state.current_page
+
+            # Drop the previous deck's queued renders without waiting: the
+            # results of renders still running are discarded when they land
+            logger.debug("Stopping render tasks of the previous document")
             self.render_thread_pool.clear()
 
-            # Load PDF
-            logger.debug("Calling pdf_processor.load_pdf()")
-            if not self.pdf_processor.load_pdf(pdf_path):
-                logger.error("pdf_processor.load_pdf returned False")
-                self.state.pdfLoadingError.emit("Failed to load PDF")
-                return
+            # Clear old state before switching, so the page count below is
+            # announced even when it equals the old one. The disk cache is
+            # keyed by document fingerprint, so other decks' renders are kept.
+            self.state.set_total_pages(0)
+            self.pdf_processor.adopt_document(opened)
 
             # Update state
             page_count = self.pdf_processor.get_page_count()
             logger.debug(f"Page count: {page_count}")
             self.state.set_total_pages(page_count)
-            self.state.set_pdf_path(pdf_path)
+            self.state.set_pdf_path(opened.pdf_path)
             self.state.set_pdf_loaded(True)
+            self.state.set_current_page(min(start_page, page_count - 1))
 
-            logger.info(f"Loaded PDF: {pdf_path} with {page_count} pages")
+            logger.info(f"Loaded PDF: {opened.pdf_path} with {page_count} pages")
+            startup_timer.mark(DOCUMENT_OPENED)
 
-            # Start rendering
-            logger.info("Calling render_thread_pool.render_priority_pages(0)")
-            self.render_thread_pool.render_priority_pages(0)
-            logger.info("render_priority_pages call completed")
+            # The start slide is rendered first; the rest of the document is
+            # queued once it is up, or after the budget
+            self.render_thread_pool.start_document(
+                self.state.current_page, config.FIRST_PAGE_BUDGET_MS
+            )
 
             self.state.pdfLoadingFinished.emit()
             logger.info("pdfLoadingFinished signal emitted")
@@ -189,6 +248,7 @@ class MainWindow(QMainWindow):
             self.state.is_pdf_loaded
             and self.state.current_page < self.state.total_pages - 1
         ):
+            latency_monitor.mark_input(self.state.current_page + 1)
             self.state.next_page()
             # Prioritize rendering nearby pages
             self.render_thread_pool.render_priority_pages(self.state.current_page)
@@ -196,6 +256,7 @@ class MainWindow(QMainWindow):
     def prev_page(self) -> None:
         """Move to previous page"""
         if self.state.is_pdf_loaded and self.state.current_page > 0:
+            latency_monitor.mark_input(self.state.current_page - 1)
             self.state.prev_page()
             # Prioritize rendering nearby pages
             self.render_thread_pool.render_priority_pages(self.state.current_page)
@@ -203,16 +264,21 @@ class MainWindow(QMainWindow):
     def _on_render_error(self, error_msg: str) -> None:
         """Handle render errors"""
         logger.error(f"Render error: {error_msg}")
-        QMessageBox.warning(self, "Render Error", error_msg)
+        if self.show_error_dialogs:
+            QMessageBox.warning(self, "Render Error", error_msg)
 
     def _on_pdf_loading_started(self) -> None:
         """Handle PDF loading start"""
-        self.welcome_label.setText("Loading PDF...")
+        self.welcome_label.setText(f"Loading {Path(self._loading_path).name}...")
+        self._update_window_title()
 
     def _on_pdf_loading_finished(self) -> None:
         """Handle PDF loading completion"""
-        # Switch to overview mode automatically
+        self._update_window_title()
+        # Switch to overview mode automatically. The first deck starts in it,
+        # so no mode change is signalled and the view is shown here.
         self.set_view_mode("OVERVIEW")
+        self._on_view_mode_changed(self.state.view_mode)
 
         self.welcome_label.setText(
             f"Loaded: {Path(self.state.pdf_path).name}\n\n"
@@ -221,11 +287,22 @@ class MainWindow(QMainWindow):
             "Phase 1: Basic functionality working!"
         )
 
+    def _update_window_title(self) -> None:
+        """Name the open deck, and the one being loaded, in the title"""
+        title = "PDF Presenter Console"
+        if self.state.is_pdf_loaded:
+            title += f" - {Path(self.state.pdf_path).name}"
+        if self.document_loader.is_loading():
+            title += f" (loading {Path(self._loading_path).name})"
+        self.setWindowTitle(title)
+
     def _on_pdf_loading_error(self, error_msg: str) -> None:
         """Handle PDF loading errors"""
         logger.error(f"PDF loading error: {error_msg}")
+        self._update_window_title()
         self.welcome_label.setText(f"Error: {error_msg}")
-        QMessageBox.critical(self, "PDF Loading Error", error_msg)
+        if self.show_error_dialogs:
+            QMessageBox.critical(self, "PDF Loading Error", error_msg)
 
     def _on_page_image_updated(self, page_idx: int, image_path: str) -> None:
         """Handle page image update"""
@@ -270,7 +347,11 @@ class MainWindow(QMainWindow):
         try:
             from PySide6.QtWidgets import QApplication
 
-            projector = ProjectorWindow(self.state, self.pdf_processor, self)
+            from .projector_window import ProjectorWindow
+
+            projector = ProjectorWindow(
+                self.state, self.pdf_processor, self.render_thread_pool, self
+            )
             self.state.set_projector_window(projector)
 
             # Try to show on secondary screen
@@ -303,8 +384,34 @@ class MainWindow(QMainWindow):
         self.state.set_projector_window(None)
         logger.info("Projector window closed by user")
 
+    def show_latency_report(self) -> None:
+        """Show the keypress-to-paint latency percentiles and startup times"""
+        report = (
+            f"{latency_monitor.format_report()}\n\n"
+            f"Startup:\n{startup_timer.format_report()}"
+        )
+        logger.info(f"Navigation latency:\n{report}")
+        box = QMessageBox(self)
+        box.setWindowTitle("Navigation Latency")
+        box.setText("<pre>" + html.escape(report) + "</pre>")
+        box.show()
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        startup_timer.mark(FIRST_PAINT)
+
     def closeEvent(self, event) -> None:
         """Handle window close"""
+        self.document_loader.shutdown()
+        if latency_monitor.sample_count():
+            logger.info(f"Navigation latency:\n{latency_monitor.format_report()}")
+            if config.LATENCY_REPORT_PATH is not None:
+                latency_monitor.dump(config.LATENCY_REPORT_PATH)
+        if self._render_thread_pool is not None:
+            self._render_thread_pool.shutdown()
+        # Empty the views before the document goes away, so a paint or
+        # thumbnail request arriving during teardown asks for no pages
+        self.state.set_pdf_loaded(False)
+        self.state.set_total_pages(0)
         self.pdf_processor.close()
-        self.render_thread_pool.wait_for_all()
         super().closeEvent(event)
@@ -3,198 +3,308 @@ Overview view with thumbnail grid for quick navigation
 """
 
 import logging
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
-from PySide6.QtCore import QSize, Qt
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt
 from PySide6.QtCore import Signal as pyqtSignal
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QColor, QImage, QPen
 from PySide6.QtWidgets import (
-    QFrame,
-    QGridLayout,
-    QLabel,
-    QScrollArea,
+    QAbstractItemView,
+    QListView,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
 )
 
 from ..config import config
 from ..core.pdf_processor import PDFProcessor
+from ..core.startup_timer import FIRST_SLIDE, startup_timer
 from ..core.state_manager import AppState
+from ..core.threading_manager import RenderThreadPool
 
 logger = logging.getLogger(__name__)
 
+# Item data role carrying a page's thumbnail QImage (None until rendered)
+ThumbnailRole = Qt.ItemDataRole.UserRole + 1
 
-class ThumbnailWidget(QFrame):
+
+class ThumbnailModel(QAbstractListModel):
     """
-    Individual thumbnail widget showing a single PDF page
+    List model with one row per page.
+
+    Thumbnails are requested and decoded lazily, only when the view asks
+    for a row it is painting. A row that is not rendered yet, or whose
+    thumbnail was evicted from the image cache, is requested again on every
+    paint, so it is queued anew if the render thread pool dropped its
+    request meanwhile (requests are never queued twice).
+    Decoded images are kept in a small LRU sized
+    to the visible grid, so rows scrolled out of view are released and
+    memory does not grow with the page count.
     """
 
-    clicked = pyqtSignal(int)  # Emitted with page index when clicked
-
-    def __init__(self, page_idx: int, state: AppState, parent=None):
+    def __init__(self, render_thread_pool: RenderThreadPool, parent=None):
         super().__init__(parent)
-        self.page_idx = page_idx
-        self.state = state
-        self.is_current = False
-
-        # Create image label
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setMinimumSize(
-            config.THUMBNAIL_SIZE_WIDTH, config.THUMBNAIL_SIZE_HEIGHT
-        )
-        self.image_label.setText(f"Page {page_idx + 1}")
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #1a1a1a;
-                color: #666;
-                font-size: 12px;
-            }
-        """)
-
-        # Layout
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.image_label)
-        self.setLayout(layout)
+        self.render_thread_pool = render_thread_pool
+        self.image_cache = render_thread_pool.pdf_processor.image_cache
+        self._page_count = 0
+        self._keys: Dict[int, str] = {}  # {page_idx: thumbnail cache key}
+        self._ready: Dict[int, bool] = {}  # {page_idx: thumbnail rendered}
+        self._images: "OrderedDict[int, QImage]" = OrderedDict()
+        self._max_images = 64
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._page_count
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self._page_count:
+            return None
+        page_idx = index.row()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"Page {page_idx + 1}"
+        if role == ThumbnailRole:
+            return self._thumbnail(page_idx)
+        return None
+
+    def _thumbnail(self, page_idx: int) -> Optional[QImage]:
+        """Get a page's decoded thumbnail, requesting it until it is rendered"""
+        image = self._images.get(page_idx)
+        if image is not None:
+            self._images.move_to_end(page_idx)
+            return image
+
+        if self._ready.get(page_idx, False):
+            image = self.image_cache.get(self._keys[page_idx])
+            if image is None:
+                # Evicted from memory, and lost if there is no disk cache
+                del self._ready[page_idx]
+                del self._keys[page_idx]
+
+        if image is None:
+            key, ready = self.render_thread_pool.request_thumbnail(page_idx)
+            if key is None:
+                return None
+            self._keys[page_idx] = key
+            self._ready[page_idx] = ready
+            if not ready:
+                return None
+            image = self.image_cache.get(key)
+            if image is None:
+                return None
+        self._images[page_idx] = image
+        while len(self._images) > self._max_images:
+            self._images.popitem(last=False)
+        return image
+
+    def set_page_count(self, total: int) -> None:
+        """Reset the model for a newly loaded document"""
+        self.beginResetModel()
+        self._page_count = total
+        self._keys.clear()
+        self._ready.clear()
+        self._images.clear()
+        self.endResetModel()
+
+    def set_max_images(self, max_images: int) -> None:
+        """Set how many decoded thumbnails are kept, e.g. after a resize"""
+        self._max_images = max(1, max_images)
+        while len(self._images) > self._max_images:
+            self._images.popitem(last=False)
+
+    def on_thumbnail_finished(self, page_idx: int, image_path: str) -> None:
+        """Record a rendered thumbnail and repaint its cell"""
+        if not 0 <= page_idx < self._page_count:
+            return
+        self._keys[page_idx] = image_path
+        self._ready[page_idx] = True
+        self._images.pop(page_idx, None)
+        index = self.index(page_idx)
+        self.dataChanged.emit(index, index, [ThumbnailRole])
 
-        # Initial style
-        self.setStyleSheet("""
-            ThumbnailWidget {
-                border: 2px solid #444;
-                border-radius: 4px;
-            }
-        """)
+    def loaded_count(self) -> int:
+        """Number of decoded thumbnails currently held"""
+        return len(self._images)
 
-        # Connect to state changes
-        self.state.currentPageChanged.connect(self._on_current_page_changed)
 
-    def set_image(self, image_path: str) -> None:
-        """Load and display thumbnail image"""
-        if not image_path:
-            return
+class ThumbnailDelegate(QStyledItemDelegate):
+    """
+    Paints a thumbnail cell: the page image centered in the thumbnail box
+    with a border that is highlighted for the highlighted page
+    """
 
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-            self.image_label.setText(f"Failed to load")
-            return
+    BACKGROUND = QColor("#1a1a1a")
+    BORDER = QColor("#444")
+    CURRENT_BORDER = QColor("#00a8ff")
+    TEXT = QColor("#666")
 
-        # Scale to thumbnail size
-        scaled = pixmap.scaledToWidth(
-            config.THUMBNAIL_SIZE_WIDTH, Qt.TransformationMode.SmoothTransformation
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.highlighted_page = 0
+        self.cell_size = QSize(
+            config.THUMBNAIL_SIZE_WIDTH + 20, config.THUMBNAIL_SIZE_HEIGHT + 20
         )
-        self.image_label.setPixmap(scaled)
 
-    def mousePressEvent(self, event) -> None:
-        """Handle click on thumbnail"""
-        self.clicked.emit(self.page_idx)
-
-    def _on_current_page_changed(self, current_page: int) -> None:
-        """Update highlighting when current page changes"""
-        is_current = current_page == self.page_idx
-        if is_current != self.is_current:
-            self.is_current = is_current
+    def sizeHint(self, option, index) -> QSize:
+        return self.cell_size
+
+    def paint(self, painter, option, index) -> None:
+        cell = option.rect.adjusted(5, 5, -5, -5)
+        is_current = index.row() == self.highlighted_page
+
+        painter.save()
+        painter.fillRect(cell, self.BACKGROUND)
+
+        image = index.data(ThumbnailRole)
+        if image is not None:
+            # Thumbnails are rendered for the thumbnail box in device pixels
+            ratio = painter.device().devicePixelRatioF()
+            size = QSize(round(image.width() / ratio), round(image.height() / ratio))
+            size = size.scaled(cell.size(), Qt.AspectRatioMode.KeepAspectRatio)
+            target = QRect(0, 0, size.width(), size.height())
+            target.moveCenter(cell.center())
+            painter.drawImage(target, image)
             if is_current:
-                self.setStyleSheet("""
-                    ThumbnailWidget {
-                        border: 4px solid #00a8ff;
-                        border-radius: 4px;
-                    }
-                """)
-            else:
-                self.setStyleSheet("""
-                    ThumbnailWidget {
-                        border: 2px solid #444;
-                        border-radius: 4px;
-                    }
-                """)
+                startup_timer.mark(FIRST_SLIDE)
+        else:
+            painter.setPen(self.TEXT)
+            painter.drawText(
+                cell,
+                Qt.AlignmentFlag.AlignCenter,
+                index.data(Qt.ItemDataRole.DisplayRole),
+            )
+
+        width = 4 if is_current else 2
+        painter.setPen(QPen(self.CURRENT_BORDER if is_current else self.BORDER, width))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        half = width // 2
+        painter.drawRoundedRect(cell.adjusted(half, half, -half, -half), 4, 4)
+        painter.restore()
+
+
+class ThumbnailGridView(QListView):
+    """Icon-mode list view that spreads a fixed number of columns"""
+
+    def __init__(self, model: ThumbnailModel, delegate: ThumbnailDelegate):
+        super().__init__()
+        self.cell_size = delegate.cell_size
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setGridSize(self.cell_size)
+        self.setItemDelegate(delegate)
+        self.setModel(model)
+        self.setStyleSheet("QListView { border: none; }")
+
+    def resizeEvent(self, event) -> None:
+        """Keep the configured columns and size the thumbnail LRU"""
+        cols = config.THUMBNAIL_GRID_COLUMNS
+        viewport = self.viewport().size()
+        # Leave a pixel spare: a row that fills the viewport exactly wraps
+        width = max(self.cell_size.width(), (viewport.width() - 1) // cols)
+        self.setGridSize(QSize(width, self.cell_size.height()))
+
+        # Keep decoded thumbnails for about two screens of cells
+        rows = viewport.height() // self.cell_size.height() + 2
+        self.model().set_max_images(2 * rows * max(1, viewport.width() // width))
+        super().resizeEvent(event)
 
 
 class OverviewView(QWidget):
     """
-    Overview view showing a grid of thumbnail images for all pages
+    Overview view showing a grid of thumbnail images for all pages.
+
+    Built on QListView, so only the visible cells are laid out and
+    painted, however many pages the document has.
     """
 
     pageSelected = pyqtSignal(int)  # Emitted when user selects a page
 
-    def __init__(self, state: AppState, pdf_processor: PDFProcessor, parent=None):
+    def __init__(
+        self,
+        state: AppState,
+        pdf_processor: PDFProcessor,
+        render_thread_pool: RenderThreadPool,
+        parent=None,
+    ):
         super().__init__(parent)
         self.state = state
         self.pdf_processor = pdf_processor
-        self.thumbnails: Dict[int, ThumbnailWidget] = {}
+        self.render_thread_pool = render_thread_pool
+
+        # Thumbnails are rasterized straight at thumbnail resolution
+        self.render_thread_pool.set_thumbnail_size(self._thumbnail_size())
 
         self._setup_ui()
         self._connect_signals()
 
+        # The view is built on first use, possibly with a document open
+        if self.state.total_pages > 0:
+            self._on_total_pages_changed(self.state.total_pages)
+
     def _setup_ui(self) -> None:
-        """Setup scrollable thumbnail grid"""
+        """Setup the virtualized thumbnail grid"""
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 10, 10, 10)
 
-        # Create scroll area for grid
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-
-        # Create grid widget
-        self.grid_widget = QWidget()
-        self.grid_layout = QGridLayout()
-        self.grid_layout.setSpacing(10)
-        self.grid_layout.setContentsMargins(5, 5, 5, 5)
+        self.model = ThumbnailModel(self.render_thread_pool, self)
+        self.delegate = ThumbnailDelegate(self)
+        self.delegate.highlighted_page = self.state.current_page
 
-        # Create thumbnails for all pages
-        self._create_thumbnails()
+        self.list_view = ThumbnailGridView(self.model, self.delegate)
 
-        self.grid_widget.setLayout(self.grid_layout)
-        scroll_area.setWidget(self.grid_widget)
-
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.list_view)
         self.setLayout(layout)
 
-    def _create_thumbnails(self) -> None:
-        """Create thumbnail widgets for all pages"""
-        cols = config.THUMBNAIL_GRID_COLUMNS
-        total = self.state.total_pages
-
-        for page_idx in range(total):
-            row = page_idx // cols
-            col = page_idx % cols
-
-            # Create thumbnail
-            thumbnail = ThumbnailWidget(page_idx, self.state)
-            thumbnail.clicked.connect(self._on_thumbnail_clicked)
-
-            self.grid_layout.addWidget(thumbnail, row, col)
-            self.thumbnails[page_idx] = thumbnail
+    def _thumbnail_size(self) -> Tuple[int, int]:
+        """Thumbnail box in device pixels"""
+        ratio = self.devicePixelRatioF()
+        return (
+            round(config.THUMBNAIL_SIZE_WIDTH * ratio),
+            round(config.THUMBNAIL_SIZE_HEIGHT * ratio),
+        )
 
-    def _on_thumbnail_clicked(self, page_idx: int) -> None:
+    def _on_thumbnail_pressed(self, index: QModelIndex) -> None:
         """Handle thumbnail click"""
+        page_idx = index.row()
         self.state.set_current_page(page_idx)
         self.pageSelected.emit(page_idx)
 
     def _connect_signals(self) -> None:
         """Connect state signals"""
-        self.state.pageImagesUpdated.connect(self._on_page_image_updated)
+        self.list_view.pressed.connect(self._on_thumbnail_pressed)
+        self.render_thread_pool.thumbnailFinished.connect(
+            self.model.on_thumbnail_finished
+        )
         self.state.totalPagesChanged.connect(self._on_total_pages_changed)
+        self.state.currentPageChanged.connect(self._on_current_page_changed)
 
-    def _on_page_image_updated(self, page_idx: int, image_path: str) -> None:
-        """Update thumbnail when page image is rendered"""
-        if page_idx in self.thumbnails:
-            self.thumbnails[page_idx].set_image(image_path)
+    def _on_current_page_changed(self, current_page: int) -> None:
+        """
+        Move the highlight by repainting just the previous and new cells,
+        and scroll the new one into view
+        """
+        previous = self.delegate.highlighted_page
+        self.delegate.highlighted_page = current_page
+
+        rows = self.model.rowCount()
+        for page_idx in {previous, current_page}:
+            if 0 <= page_idx < rows:
+                self.list_view.update(self.model.index(page_idx))
+
+        if 0 <= current_page < rows:
+            self.list_view.scrollTo(
+                self.model.index(current_page),
+                QAbstractItemView.ScrollHint.EnsureVisible,
+            )
 
     def _on_total_pages_changed(self, total: int) -> None:
-        """Recreate grid when PDF is loaded"""
-        # Clear old thumbnails
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-        self.thumbnails.clear()
-
-        # Create new thumbnails
-        if total > 0:
-            self._create_thumbnails()
-
-    def get_thumbnail(self, page_idx: int) -> Optional[ThumbnailWidget]:
-        """Get a specific thumbnail widget"""
-        return self.thumbnails.get(page_idx)
+        """Reset the grid when a PDF is loaded"""
+        self.delegate.highlighted_page = self.state.current_page
+        self.model.set_page_count(total)
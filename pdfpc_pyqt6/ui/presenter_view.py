@@ -4,33 +4,61 @@ Left: Speaker notes | Center: Current slide | Right: Next slide
 """
 
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Signal as pyqtSignal
 from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
 
+from ..config import config
+from ..core.latency_monitor import latency_monitor
 from ..core.pdf_processor import PDFProcessor
+from ..core.startup_timer import FIRST_SLIDE, startup_timer
 from ..core.state_manager import AppState
+from ..core.threading_manager import RenderThreadPool
 from .widgets.page_display import PageDisplay
 
 logger = logging.getLogger(__name__)
 
 
+def notes_clip_rect() -> Tuple[float, float, float, float]:
+    """
+    Page region holding the speaker notes, as (left, top, width, height)
+    ratios, from NOTES_SIDE and NOTES_SPLIT_RATIO
+    """
+    ratio = min(max(config.NOTES_SPLIT_RATIO, 0.05), 1.0)
+    if config.NOTES_SIDE == "right":
+        return (1.0 - ratio, 0.0, ratio, 1.0)
+    if config.NOTES_SIDE != "left":
+        logger.warning(f"Unknown NOTES_SIDE {config.NOTES_SIDE!r}, using 'left'")
+    return (0.0, 0.0, ratio, 1.0)
+
+
 class PresenterView(QWidget):
     """
     3-column presenter view showing:
-    - Left: Speaker notes (left half of PDF)
+    - Left: Speaker notes (notes region of PDF, left half by default)
     - Center: Current slide (full page)
-    - Right: Next slide preview (left half of PDF)
+    - Right: Next slide preview (notes region of PDF)
+
+    The notes panes render only their region of the page, fitted to the
+    pane, instead of cropping a whole-page frame.
     """
 
     pageClicked = pyqtSignal(int)  # Emitted when user clicks on a page area
 
-    def __init__(self, state: AppState, pdf_processor: PDFProcessor, parent=None):
+    def __init__(
+        self,
+        state: AppState,
+        pdf_processor: PDFProcessor,
+        render_thread_pool: RenderThreadPool,
+        parent=None,
+    ):
         super().__init__(parent)
         self.state = state
         self.pdf_processor = pdf_processor
+        self.render_thread_pool = render_thread_pool
+        self.notes_clip = notes_clip_rect()
 
         self._setup_ui()
         self._connect_signals()
@@ -42,7 +70,7 @@ class PresenterView(QWidget):
         main_layout.setSpacing(10)
 
         # Left column: Speaker notes (1/3 width)
-        self.notes_display = PageDisplay()
+        self.notes_display = PageDisplay(image_cache=self.pdf_processor.image_cache)
         self.notes_display.setStyleSheet("""
             PageDisplay {
                 border: 2px solid #444;
@@ -55,7 +83,7 @@ class PresenterView(QWidget):
         center_right_layout.setSpacing(10)
 
         # Center: Current slide (1/3 width)
-        self.current_display = PageDisplay()
+        self.current_display = PageDisplay(image_cache=self.pdf_processor.image_cache)
         self.current_display.setStyleSheet("""
             PageDisplay {
                 border: 2px solid #00a8ff;
@@ -64,7 +92,7 @@ class PresenterView(QWidget):
         """)
 
         # Right: Next slide (1/3 width)
-        self.next_display = PageDisplay()
+        self.next_display = PageDisplay(image_cache=self.pdf_processor.image_cache)
         self.next_display.setStyleSheet("""
             PageDisplay {
                 border: 2px solid #444;
@@ -90,49 +118,89 @@ class PresenterView(QWidget):
     def _connect_signals(self) -> None:
         """Connect state signals to update displays"""
         self.state.currentPageChanged.connect(self._update_displays)
-        self.state.pageImagesUpdated.connect(self._on_page_image_updated)
         self.state.totalPagesChanged.connect(self._on_total_pages_changed)
+        self.render_thread_pool.renderFinished.connect(self._on_frame_rendered)
+        self.render_thread_pool.draftFinished.connect(self._on_draft_finished)
+
+        for name, display, _ in self._displays():
+            # Re-render for a display whenever its pixel size changes
+            display.renderSizeChanged.connect(self._on_render_size_changed)
+            display.framePainted.connect(
+                lambda _, hit, name=name: latency_monitor.mark_painted(name, hit)
+            )
+        self.current_display.framePainted.connect(
+            lambda *_: startup_timer.mark(FIRST_SLIDE)
+        )
+
+    def _displays(self):
+        """(target name, display, clip) for every page display"""
+        return (
+            ("presenter.notes", self.notes_display, self.notes_clip),
+            ("presenter.current", self.current_display, None),
+            ("presenter.next", self.next_display, self.notes_clip),
+        )
+
+    def _on_render_size_changed(self) -> None:
+        """Register the new display sizes and re-request visible frames"""
+        for name, display, clip in self._displays():
+            self.render_thread_pool.set_target(name, display.render_size(), clip)
+        if self.state.total_pages > 0:
+            self._update_displays(self.state.current_page)
+
+    def _show_page(self, display: PageDisplay, page_idx: int, clip) -> None:
+        """Show a page at the display's size, any rendered frame meanwhile"""
+        display.show_page(
+            page_idx,
+            self.render_thread_pool,
+            clip,
+            fallback_path=self.state.get_page_image(page_idx),
+        )
 
     def _update_displays(self, current_page: int) -> None:
         """Update all three displays when current page changes"""
-        # Update notes display (left half of current page)
-        if self.state.has_page_image(current_page):
-            image_path = self.state.get_page_image(current_page)
-            self.notes_display.set_image_crop(image_path, (0, 0, 0.5, 1.0))
+        # Notes display (notes region of current page)
+        self._show_page(self.notes_display, current_page, self.notes_clip)
 
-        # Update current display (full current page)
-        if self.state.has_page_image(current_page):
-            image_path = self.state.get_page_image(current_page)
-            self.current_display.set_image(image_path)
+        # Current display (full current page)
+        self._show_page(self.current_display, current_page, None)
 
-        # Update next display (left half of next page)
+        # Next display (notes region of next page)
         next_page = current_page + 1
         if next_page < self.state.total_pages:
-            if self.state.has_page_image(next_page):
-                image_path = self.state.get_page_image(next_page)
-                self.next_display.set_image_crop(image_path, (0, 0, 0.5, 1.0))
-            else:
-                self.next_display.clear()
+            self._show_page(self.next_display, next_page, self.notes_clip)
         else:
             self.next_display.clear()
 
         logger.debug(f"Updated displays for page {current_page}")
 
-    def _on_page_image_updated(self, page_idx: int, image_path: str) -> None:
-        """Handle when a page image is rendered"""
+    def _on_frame_rendered(self, page_idx: int, image_path: str) -> None:
+        """Handle when a page frame (or a clipped region) is rendered"""
         current = self.state.current_page
-        # Only update if this page is currently visible
-        if page_idx == current:
-            self._update_displays(current)
-        elif page_idx == current + 1:
-            # Update next slide if its image just became available
-            self.next_display.set_image_crop(image_path, (0, 0, 0.5, 1.0))
+        # Only frames of visible pages matter
+        if page_idx not in (current, current + 1):
+            return
+
+        is_whole_page = self.state.get_page_image(page_idx) == image_path
+        for _, display, _ in self._displays():
+            if display.offer_frame(image_path) or not is_whole_page:
+                continue
+            # Show a frame rendered for another size until ours arrives
+            shown_page = current + 1 if display is self.next_display else current
+            if page_idx == shown_page and display.current_pixmap is None:
+                display.show_fallback(image_path)
+
+    def _on_draft_finished(self, page_idx: int, image_path: str) -> None:
+        """Show a draft in the displays still waiting for their frame"""
+        for _, display, _ in self._displays():
+            display.offer_frame(image_path)
 
     def _on_total_pages_changed(self, total: int) -> None:
         """Handle when total page count changes (PDF opened)"""
         self.current_display.clear()
         self.next_display.clear()
         self.notes_display.clear()
+        if total > 0:
+            self._update_displays(self.state.current_page)
 
     def get_current_display(self) -> PageDisplay:
         """Get the current slide display widget"""
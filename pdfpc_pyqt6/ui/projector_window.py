@@ -6,11 +6,13 @@ import logging
 
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtCore import Signal as pyqtSignal
-from PySide6.QtGui import QKeySequence, QShortcut
-from PySide6.QtWidgets import QLabel, QMainWindow, QVBoxLayout, QWidget
+from PySide6.QtGui import QColor, QKeySequence, QShortcut
+from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget
 
+from ..core.latency_monitor import latency_monitor
 from ..core.pdf_processor import PDFProcessor
 from ..core.state_manager import AppState
+from ..core.threading_manager import RenderThreadPool
 from .widgets.page_display import PageDisplay
 
 logger = logging.getLogger(__name__)
@@ -24,10 +26,19 @@ class ProjectorWindow(QMainWindow):
 
     closed = pyqtSignal()  # Emitted when window is closed
 
-    def __init__(self, state: AppState, pdf_processor: PDFProcessor, parent=None):
+    RENDER_TARGET = "projector"
+
+    def __init__(
+        self,
+        state: AppState,
+        pdf_processor: PDFProcessor,
+        render_thread_pool: RenderThreadPool,
+        parent=None,
+    ):
         super().__init__(parent)
         self.state = state
         self.pdf_processor = pdf_processor
+        self.render_thread_pool = render_thread_pool
         self.setWindowTitle("PDF Presenter - Projector")
 
         # Setup UI first (before window flags)
@@ -54,13 +65,8 @@ class ProjectorWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
 
         # Page display (full screen)
-        self.page_display = PageDisplay()
-        self.page_display.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #000000;
-                border: none;
-            }
-        """)
+        self.page_display = PageDisplay(image_cache=self.pdf_processor.image_cache)
+        self.page_display.set_background(QColor("#000000"))
 
         layout.addWidget(self.page_display)
         central_widget.setLayout(layout)
@@ -68,12 +74,20 @@ class ProjectorWindow(QMainWindow):
     def _connect_signals(self) -> None:
         """Connect to state signals"""
         self.state.currentPageChanged.connect(self._on_page_changed)
+        self.state.totalPagesChanged.connect(self._on_total_pages_changed)
         self.state.pageImagesUpdated.connect(self._on_page_image_updated)
+        self.render_thread_pool.draftFinished.connect(self.page_display.offer_frame)
 
         # Connect mouse click signals from page display
         self.page_display.leftClicked.connect(self.prev_page)
         self.page_display.rightClicked.connect(self.next_page)
 
+        # Render slides for the projector's own resolution
+        self.page_display.renderSizeChanged.connect(self._on_render_size_changed)
+        self.page_display.framePainted.connect(
+            lambda _, hit: latency_monitor.mark_painted(self.RENDER_TARGET, hit)
+        )
+
     def _setup_keyboard_shortcuts(self) -> None:
         """Setup keyboard shortcuts for projector control"""
         # Note: We use keyPressEvent instead of QShortcut for better compatibility
@@ -84,19 +98,38 @@ class ProjectorWindow(QMainWindow):
         """Handle page change from main window"""
         self._update_display(page_idx)
 
+    def _on_total_pages_changed(self, total: int) -> None:
+        """Show the first slide of a newly opened PDF"""
+        self.page_display.clear()
+        if total > 0:
+            self._update_display(self.state.current_page)
+
     def _on_page_image_updated(self, page_idx: int, image_path: str) -> None:
         """Handle page image update"""
-        if page_idx == self.state.current_page:
-            self.page_display.set_image(image_path)
+        if page_idx != self.state.current_page:
+            return
+        if not self.page_display.offer_frame(image_path):
+            # Show a frame rendered for another size until ours arrives
+            if self.page_display.current_pixmap is None:
+                self.page_display.show_fallback(image_path)
+
+    def _on_render_size_changed(self) -> None:
+        """Register the projector's new pixel size and re-request the slide"""
+        self.render_thread_pool.set_target(
+            self.RENDER_TARGET, self.page_display.render_size()
+        )
+        if self.state.total_pages > 0:
+            self._update_display(self.state.current_page)
 
     def _update_display(self, page_idx: int) -> None:
         """Update the displayed page"""
-        if self.state.has_page_image(page_idx):
-            image_path = self.state.get_page_image(page_idx)
-            self.page_display.set_image(image_path)
-        else:
-            # Page not yet rendered, show black screen
-            self.page_display.clear()
+        # Until the frame for this screen is ready, show any rendered frame
+        # of the page, or a low-resolution draft if there is none yet
+        self.page_display.show_page(
+            page_idx,
+            self.render_thread_pool,
+            fallback_path=self.state.get_page_image(page_idx),
+        )
 
     def next_page(self) -> None:
         """Move to next page"""
@@ -163,6 +196,13 @@ class ProjectorWindow(QMainWindow):
         key = event.key()
         logger.debug(f"Projector window received key: {key}")
 
+        # Timestamp page turns for the keypress-to-paint latency report
+        if key in (Qt.Key.Key_Right, Qt.Key.Key_Space):
+            if self.state.current_page < self.state.total_pages - 1:
+                latency_monitor.mark_input(self.state.current_page + 1)
+        elif key == Qt.Key.Key_Left and self.state.current_page > 0:
+            latency_monitor.mark_input(self.state.current_page - 1)
+
         if key == Qt.Key.Key_Right:
             logger.info("Right arrow pressed - next page")
             self.next_page()
@@ -185,6 +225,7 @@ class ProjectorWindow(QMainWindow):
     def closeEvent(self, event) -> None:
         """Handle window close"""
         logger.info("Projector window closed")
+        self.render_thread_pool.set_target(self.RENDER_TARGET, None)
         self.state.set_projector_window(None)
         self.closed.emit()
         super().closeEvent(event)
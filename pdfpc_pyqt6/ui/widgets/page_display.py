@@ -2,69 +2,214 @@
 Page display widget for showing PDF pages
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtCore import QRect, QSize, Qt, QTimer
 from PySide6.QtCore import Signal as pyqtSignal
-from PySide6.QtGui import QPixmap
-from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtWidgets import QWidget
+
+from ...core.image_cache import ImageCache, load_image_file
+from ...core.threading_manager import RenderThreadPool
 
 
 class PageDisplay(QWidget):
     """
-    Widget for displaying a single PDF page image with proper scaling
+    Widget for displaying a single PDF page image with proper scaling.
+
+    Paints the frame itself instead of going through a QLabel. Frames
+    rendered for the display's size are drawn 1:1; any other frame is
+    scaled once per display size and the result cached. While a resize is
+    in progress frames are scaled with the fast transformation by the
+    painter, and refined to a smooth scale once resizing settles.
     """
 
     # Signals for mouse clicks (left half = previous page, right half = next page)
     leftClicked = pyqtSignal()  # Left half clicked
     rightClicked = pyqtSignal()  # Right half clicked
+    # Emitted once resizing settles, when the pixel size pages should be
+    # rendered at has changed
+    renderSizeChanged = pyqtSignal()
+    # Emitted on the first paint of the frame requested by show_page(), with
+    # the page index and whether the frame was already rendered (cache hit)
+    framePainted = pyqtSignal(int, bool)
 
-    def __init__(self, parent=None):
+    # Delay before a resize is reported, so a drag does not re-render
+    # every intermediate size
+    RESIZE_SETTLE_MS = 150
+    # Smoothly scaled frames kept, one per display size
+    MAX_SCALED_FRAMES = 2
+
+    def __init__(self, parent=None, image_cache: Optional[ImageCache] = None):
         super().__init__(parent)
         self.image_path: Optional[str] = None
         self.current_pixmap: Optional[QPixmap] = None
+        self.image_cache = image_cache
+        self.clip_rect: Optional[tuple] = None
+        self._pending_path: Optional[str] = None  # Frame awaited from the renderer
+        self._draft_path: Optional[str] = None  # Preview shown until it arrives
+        self._reported_size: Optional[Tuple[int, int]] = None
+        self._message: Optional[str] = None  # Shown instead of an image
+        self._page_idx: Optional[int] = None  # Page requested by show_page()
+        self._frame_hit = False  # Its frame was rendered when requested
+        self._report_paint = False  # Emit framePainted on the next paint
+        self._frame_reported = True  # framePainted sent for the page shown
+        # {(frame cache key, device size): smoothly scaled frame}
+        self._scaled: "OrderedDict[Tuple[int, int, int], QPixmap]" = OrderedDict()
+
+        self.background_color = QColor("#2a2a2a")
+        self.border_color: Optional[QColor] = QColor("#444")
+
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+
+        # Every pixel is painted in paintEvent
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setMinimumSize(200, 150)
+
+    def set_background(
+        self, color: QColor, border_color: Optional[QColor] = None
+    ) -> None:
+        """Set the color around the page and the border (None for no border)"""
+        self.background_color = color
+        self.border_color = border_color
+        self.update()
+
+    def _show_message(self, message: str) -> None:
+        """Show a text message instead of an image"""
+        self._message = message
+        self.current_pixmap = None
+        self.update()
+
+    def _load_pixmap(self, image_path: str) -> Optional[QPixmap]:
+        """
+        Get a pixmap for an image path, going through the shared image cache
+        so the file is decoded once for all displays.
+        """
+        if self.image_cache is not None:
+            image = self.image_cache.get(image_path)
+        else:
+            image = load_image_file(image_path)
+
+        if image is None:
+            if not Path(image_path).exists():
+                self._show_message(f"Image not found: {image_path}")
+            else:
+                self._show_message(f"Failed to load image: {image_path}")
+            return None
+
+        return QPixmap.fromImage(image)
+
+    def render_size(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the box in device pixels a frame must fit to fill this display
+        1:1 on the current screen.
+        Returns None while the display is not laid out yet.
+        """
+        box = self._frame_box().size()
+        if not self.isVisible() or box.width() <= 0 or box.height() <= 0:
+            return None
+
+        ratio = self.devicePixelRatioF()
+        return (round(box.width() * ratio), round(box.height() * ratio))
+
+    def _frame_box(self) -> QRect:
+        """The area frames are fitted into, inside the border"""
+        if self.border_color is None:
+            return self.rect()
+        return self.rect().adjusted(1, 1, -1, -1)
 
-        # Create label for image display
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #2a2a2a;
-                border: 1px solid #444;
-            }
-        """)
-        self.image_label.setMinimumSize(200, 150)
-
-        # Layout
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.image_label)
-        self.setLayout(layout)
+    def show_page(
+        self,
+        page_idx: int,
+        render_pool: RenderThreadPool,
+        clip_rect: Optional[tuple] = None,
+        fallback_path: Optional[str] = None,
+    ) -> None:
+        """
+        Show a page, or only its clip_rect region, rendered for this
+        display's pixel size.
+        If that frame is not rendered yet it is requested, and the fallback
+        (a whole-page frame at another size) or else a low-resolution draft
+        is shown meanwhile. The frame is displayed once it arrives through
+        offer_frame().
+        """
+        self.clip_rect = clip_rect
+        self._report_paint = False
+        size = self.render_size()
+        image_path, ready = render_pool.request_frame(page_idx, size, clip_rect)
+        self._draft_path = None
+        # Showing the same page again (e.g. after a resize) before its frame
+        # was painted keeps the original cache hit/miss
+        if page_idx != self._page_idx or self._frame_reported:
+            self._frame_hit = ready
+        self._page_idx = page_idx
+        self._frame_reported = False
+        if ready:
+            self._pending_path = None
+            self.set_image(image_path)
+            self._report_paint = True
+            return
+
+        if fallback_path:
+            self.show_fallback(fallback_path)
+        else:
+            self.clear()
+            draft_path, draft_ready = render_pool.request_draft(
+                page_idx, size, clip_rect
+            )
+            if draft_ready:
+                self.set_image(draft_path)
+            else:
+                self._draft_path = draft_path
+        self._pending_path = image_path
+
+    def offer_frame(self, image_path: str) -> bool:
+        """
+        Display a freshly rendered frame or draft if it is the one this
+        display is waiting for. A draft arriving after its frame is ignored.
+        Returns True if the image was taken.
+        """
+        if not image_path:
+            return False
+        if image_path == self._pending_path:
+            self._pending_path = None
+            self._draft_path = None
+            self.set_image(image_path)
+            self._report_paint = True
+            return True
+        if image_path == self._draft_path:
+            self._draft_path = None
+            self.set_image(image_path)
+            return True
+        return False
+
+    def show_fallback(self, image_path: str) -> None:
+        """Show a whole-page frame, cropped to the region of the page shown"""
+        if self.clip_rect is not None:
+            self.set_image_crop(image_path, self.clip_rect)
+        else:
+            self.set_image(image_path)
 
     def set_image(self, image_path: str) -> None:
         """Load and display an image from file path"""
         if not image_path:
-            self.image_label.clear()
-            return
-
-        path = Path(image_path)
-        if not path.exists():
-            self.image_label.setText(f"Image not found: {image_path}")
+            self.clear()
             return
 
         try:
-            pixmap = QPixmap(str(path))
-            if pixmap.isNull():
-                self.image_label.setText(f"Failed to load image: {image_path}")
+            pixmap = self._load_pixmap(image_path)
+            if pixmap is None:
                 return
 
-            self.image_path = image_path
-            self.current_pixmap = pixmap
-            self._update_display()
+            self._set_pixmap(image_path, pixmap)
 
         except Exception as e:
-            self.image_label.setText(f"Error loading image: {e}")
+            self._show_message(f"Error loading image: {e}")
 
     def set_image_crop(self, image_path: str, crop_rect: tuple) -> None:
         """
@@ -73,18 +218,12 @@ class PageDisplay(QWidget):
                    where values are in range [0, 1]
         """
         if not image_path:
-            self.image_label.clear()
-            return
-
-        path = Path(image_path)
-        if not path.exists():
-            self.image_label.setText(f"Image not found: {image_path}")
+            self.clear()
             return
 
         try:
-            pixmap = QPixmap(str(path))
-            if pixmap.isNull():
-                self.image_label.setText(f"Failed to load image: {image_path}")
+            pixmap = self._load_pixmap(image_path)
+            if pixmap is None:
                 return
 
             # Apply crop
@@ -99,31 +238,106 @@ class PageDisplay(QWidget):
                 int(height_ratio * h),
             )
 
-            cropped = pixmap.copy(rect)
-            self.image_path = image_path
-            self.current_pixmap = cropped
-            self._update_display()
+            self._set_pixmap(image_path, pixmap.copy(rect))
 
         except Exception as e:
-            self.image_label.setText(f"Error loading image: {e}")
+            self._show_message(f"Error loading image: {e}")
 
-    def _update_display(self) -> None:
-        """Update the displayed image with proper scaling"""
-        if not self.current_pixmap or self.current_pixmap.isNull():
-            return
+    def _set_pixmap(self, image_path: str, pixmap: QPixmap) -> None:
+        """Make a pixmap the displayed frame"""
+        self.image_path = image_path
+        self.current_pixmap = pixmap
+        self._message = None
+        self._scaled.clear()
+        self.update()
+
+    def _scaled_frame(self, box: QSize) -> Optional[QPixmap]:
+        """
+        Get the current frame smoothly scaled to fit a box (device pixels),
+        or None when it is drawn as is because it already fits 1:1
+        """
+        pixmap = self.current_pixmap
+        fitted = pixmap.size().scaled(box, Qt.AspectRatioMode.KeepAspectRatio)
+        if (
+            abs(fitted.width() - pixmap.width()) <= 1
+            and abs(fitted.height() - pixmap.height()) <= 1
+        ):
+            return None
 
-        # Scale to fit the label while maintaining aspect ratio
-        label_size = self.image_label.size()
-        if label_size.width() > 0 and label_size.height() > 0:
-            scaled = self.current_pixmap.scaledToWidth(
-                label_size.width(), Qt.TransformationMode.SmoothTransformation
+        key = (pixmap.cacheKey(), box.width(), box.height())
+        scaled = self._scaled.get(key)
+        if scaled is None:
+            scaled = pixmap.scaled(
+                box,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
             )
-            self.image_label.setPixmap(scaled)
+            self._scaled[key] = scaled
+            while len(self._scaled) > self.MAX_SCALED_FRAMES:
+                self._scaled.popitem(last=False)
+        return scaled
+
+    def paintEvent(self, event) -> None:
+        """Paint the background, then the frame centered in the box"""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.background_color)
+        if self.border_color is not None:
+            painter.setPen(self.border_color)
+            painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+
+        box = self._frame_box()
+        pixmap = self.current_pixmap
+        if pixmap is not None and not pixmap.isNull() and not box.isEmpty():
+            ratio = self.devicePixelRatioF()
+            device_box = QSize(round(box.width() * ratio), round(box.height() * ratio))
+            fitted = pixmap.size().scaled(
+                device_box, Qt.AspectRatioMode.KeepAspectRatio
+            )
+            target = QRect(
+                0, 0, round(fitted.width() / ratio), round(fitted.height() / ratio)
+            )
+            target.moveCenter(box.center())
+
+            if self._resize_timer.isActive():
+                # Live resize: let the painter scale with the fast transformation
+                painter.drawPixmap(target, pixmap)
+            else:
+                scaled = self._scaled_frame(device_box)
+                painter.drawPixmap(target, scaled if scaled is not None else pixmap)
+        elif self._message:
+            painter.setPen(QColor("#aaa"))
+            painter.drawText(
+                box,
+                Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
+                self._message,
+            )
+        painter.end()
+
+        if self._report_paint and pixmap is not None:
+            self._report_paint = False
+            self._frame_reported = True
+            self.framePainted.emit(self._page_idx, self._frame_hit)
 
     def resizeEvent(self, event) -> None:
-        """Update image when widget is resized"""
+        """Repaint cheaply while resizing, refine once resizing settles"""
         super().resizeEvent(event)
-        self._update_display()
+        self._resize_timer.start()
+
+    def showEvent(self, event) -> None:
+        """Report the render size once the display becomes visible"""
+        super().showEvent(event)
+        self._resize_timer.start()
+
+    def _on_resize_settled(self) -> None:
+        """
+        Repaint with a smoothly scaled frame and emit renderSizeChanged if
+        the device pixel size changed
+        """
+        self.update()
+        size = self.render_size()
+        if size is not None and size != self._reported_size:
+            self._reported_size = size
+            self.renderSizeChanged.emit()
 
     def mousePressEvent(self, event) -> None:
         """Handle mouse clicks on the page display"""
@@ -139,9 +353,14 @@ class PageDisplay(QWidget):
 
     def clear(self) -> None:
         """Clear the displayed image"""
-        self.image_label.clear()
         self.image_path = None
         self.current_pixmap = None
+        self._message = None
+        self._scaled.clear()
+        self.update()
+        self._pending_path = None
+        self._draft_path = None
+        self._report_paint = False
 
     def get_image_path(self) -> Optional[str]:
         """Get the currently displayed image path"""
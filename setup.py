@@ -23,9 +23,14 @@ setup(
         "PyMuPDF>=1.23.0",
         "Pillow>=10.0.0",
     ],
+    extras_require={
+        # Compressed disk cache frames (CACHE_CODEC = "lz4")
+        "lz4": ["lz4>=4.0"],
+    },
     entry_points={
         "console_scripts": [
             "pdfpc-pyqt6=pdfpc_pyqt6.main:main",
+            "pdfpc-pyqt6-cache=pdfpc_pyqt6.cache_tool:main",
         ],
     },
     classifiers=[
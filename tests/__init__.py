@@ -0,0 +1 @@
+"""Unit tests for PDF Presenter Console"""
@@ -0,0 +1,98 @@
+"""
+Tests for DiskCache: LRU trimming across documents and old cache files
+"""
+
+import pytest
+
+from pdfpc_pyqt6.core import frame_pack
+from pdfpc_pyqt6.core.disk_cache import DiskCache, parse_frame_key
+from pdfpc_pyqt6.core.frame_pack import FramePack, record_size
+
+KEY = "page_{:06d}_fit200x150_rgb_annots_v2.raw"
+FRAME = b"x" * 1000
+FRAME_BYTES = record_size(KEY.format(0), len(FRAME))
+
+
+class Clock:
+    """Stands in for the time module in frame_pack, one second per call"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        self.now += 1
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(frame_pack, "time", clock)
+    return clock
+
+
+def make_pack(cache_dir, fingerprint, pages):
+    pack = FramePack(cache_dir / fingerprint)
+    for page in pages:
+        pack.append(KEY.format(page), FRAME)
+    return pack
+
+
+def test_parse_frame_key():
+    assert parse_frame_key(KEY.format(12)) == (12, "fit200x150", "raw")
+    assert parse_frame_key("frames.idx") is None
+
+
+def test_trim_evicts_least_recently_used_first(tmp_path, clock):
+    older = make_pack(tmp_path, "a" * 32, range(3))
+    make_pack(tmp_path, "b" * 32, range(3))
+    older.read(KEY.format(2))
+    older.save()
+    cache = DiskCache(tmp_path)
+    assert cache.usage() == 6 * FRAME_BYTES
+
+    evicted, freed = cache.trim(4 * FRAME_BYTES)
+    assert (evicted, freed) == (2, 2 * FRAME_BYTES)
+    remaining = {(entry.document[0], entry.page) for entry in cache.entries()}
+    assert remaining == {("a", 2), ("b", 0), ("b", 1), ("b", 2)}
+
+
+def test_trim_keeps_frames_of_the_live_document_used_since_it_opened(tmp_path, clock):
+    make_pack(tmp_path, "a" * 32, range(2))
+    make_pack(tmp_path, "b" * 32, range(2))
+    live = FramePack(tmp_path / ("b" * 32))
+    live.read(KEY.format(1))  # Used in this session
+    live.append(KEY.format(2), FRAME)  # Rendered in this session
+
+    evicted, _ = DiskCache(tmp_path).trim(0, live_pack=live)
+    assert evicted == 3
+    assert sorted(live.keys()) == [KEY.format(1), KEY.format(2)]
+    assert not (tmp_path / ("a" * 32)).exists()
+    assert sorted(FramePack(tmp_path / ("b" * 32)).keys()) == sorted(live.keys())
+
+
+def test_trim_removes_only_old_per_frame_files(tmp_path):
+    document = tmp_path / ("c" * 32)
+    document.mkdir()
+    (document / "page_000001_fit200x150_rgb_annots_v2.png").write_bytes(FRAME)
+    (document / "page_000002_2.0_rgb_annots_v1.lz4").write_bytes(FRAME)
+    (document / "notes.txt").write_text("not ours")
+    other = tmp_path / "exports"
+    other.mkdir()
+    (other / "page_000001_slide.png").write_bytes(FRAME)
+    (tmp_path / "page_000001_2.0.png").write_bytes(FRAME)
+
+    _, freed = DiskCache(tmp_path).trim(0)
+    assert freed == 2 * len(FRAME)
+    assert sorted(path.name for path in document.iterdir()) == ["notes.txt"]
+    assert (other / "page_000001_slide.png").exists()
+    assert (tmp_path / "page_000001_2.0.png").exists()
+
+
+def test_trim_removes_emptied_document_directories(tmp_path):
+    document = tmp_path / ("d" * 32)
+    document.mkdir()
+    (document / "page_000001_fit200x150_rgb_annots_v2.raw").write_bytes(FRAME)
+
+    DiskCache(tmp_path).trim(0)
+    assert not document.exists()
@@ -0,0 +1,92 @@
+"""
+Tests for the disk cache frame codecs: encode/decode round trips
+"""
+
+import pytest
+
+from pdfpc_pyqt6.core.frame_codec import (
+    CODECS,
+    RAW_HEADER,
+    Lz4Codec,
+    decode_raw_frame,
+    get_codec,
+    read_frame,
+)
+from pdfpc_pyqt6.core.mupdf import load_fitz
+
+
+def make_pixmap(width=7, height=5, alpha=False):
+    """
+    A pixmap whose every pixel differs from its neighbours. Its alpha is
+    opaque: MuPDF premultiplies samples by alpha and PNG does not, so only
+    opaque pixels compare equal.
+    """
+    fitz = load_fitz()
+    samples = bytearray()
+    for y in range(height):
+        for x in range(width):
+            samples += bytes((x * 31 + y * 17 + c * 71) % 256 for c in range(3))
+            if alpha:
+                samples.append(255)
+    return fitz.Pixmap(fitz.csRGB, width, height, bytes(samples), alpha)
+
+
+def assert_same_pixels(image, pix):
+    assert (image.width(), image.height()) == (pix.width, pix.height)
+    for y in range(pix.height):
+        for x in range(pix.width):
+            color = image.pixelColor(x, y)
+            expected = pix.pixel(x, y)
+            actual = (color.red(), color.green(), color.blue(), color.alpha())
+            assert actual[: len(expected)] == tuple(expected)
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+@pytest.mark.parametrize("alpha", [False, True])
+def test_round_trip(name, alpha):
+    codec = CODECS[name]
+    if not codec.is_available():
+        pytest.skip(f"{name} is not available")
+    pix = make_pixmap(alpha=alpha)
+
+    image = codec.decode(codec.encode(pix))
+    assert image is not None
+    assert_same_pixels(image, pix)
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_read_frame_picks_the_codec_from_the_extension(tmp_path, name):
+    codec = CODECS[name]
+    if not codec.is_available():
+        pytest.skip(f"{name} is not available")
+    pix = make_pixmap()
+    path = tmp_path / f"page_000000_fit7x5_rgb_annots_v2.{name}"
+    codec.write(str(path), pix)
+
+    assert_same_pixels(read_frame(str(path)), pix)
+
+
+def test_raw_decode_reads_from_a_memoryview():
+    pix = make_pixmap()
+    data = bytearray(b"\0" * 16) + CODECS["raw"].encode(pix)
+
+    assert_same_pixels(decode_raw_frame(memoryview(data)[16:]), pix)
+
+
+def test_malformed_frames_are_not_decoded():
+    frame = CODECS["raw"].encode(make_pixmap())
+
+    assert decode_raw_frame(frame[: RAW_HEADER.size - 1]) is None
+    assert decode_raw_frame(frame[:-1]) is None
+    assert decode_raw_frame(b"NOTAFRAM" + frame[8:]) is None
+    assert CODECS["png"].decode(b"not a png") is None
+    if CODECS["lz4"].is_available():
+        assert CODECS["lz4"].decode(b"not lz4 data") is None
+
+
+def test_get_codec_falls_back_to_raw(monkeypatch):
+    assert get_codec("png") is CODECS["png"]
+    assert get_codec("bmp") is CODECS["raw"]
+
+    monkeypatch.setattr(Lz4Codec, "_available", False)
+    assert get_codec("lz4") is CODECS["raw"]
@@ -0,0 +1,82 @@
+"""
+Tests for FramePack: round trips, reopening and damaged indexes
+"""
+
+from pdfpc_pyqt6.core.frame_pack import INDEX_ENTRY, FramePack, record_size
+
+KEY = "page_{:06d}_fit200x150_rgb_annots_v2.raw"
+
+
+def test_round_trip(tmp_path):
+    pack = FramePack(tmp_path / "doc", source="/decks/talk.pdf")
+    frames = {KEY.format(page): bytes([page]) * (100 + page) for page in range(5)}
+    for key, data in frames.items():
+        pack.append(key, data)
+
+    assert sorted(pack.keys()) == sorted(frames)
+    for key, data in frames.items():
+        assert bytes(pack.read(key)) == data
+    assert pack.read(KEY.format(99)) is None
+    assert pack.total_bytes() == sum(
+        record_size(key, len(data)) for key, data in frames.items()
+    )
+
+    reopened = FramePack(tmp_path / "doc")
+    assert reopened.source == "/decks/talk.pdf"
+    for key, data in frames.items():
+        assert bytes(reopened.read(key)) == data
+
+
+def test_index_cut_short_keeps_complete_entries(tmp_path):
+    pack = FramePack(tmp_path / "doc")
+    for page in range(3):
+        pack.append(KEY.format(page), b"x" * 64)
+
+    # A crash while the last index entry was being written
+    index = pack.index_path.read_bytes()
+    pack.index_path.write_bytes(index[: -(len(KEY.format(2)) // 2)])
+    reopened = FramePack(tmp_path / "doc")
+    assert sorted(reopened.keys()) == [KEY.format(0), KEY.format(1)]
+    assert bytes(reopened.read(KEY.format(1))) == b"x" * 64
+
+    # Only part of the entry header made it
+    pack.index_path.write_bytes(index[: -(len(KEY.format(2)) + INDEX_ENTRY.size // 2)])
+    assert sorted(FramePack(tmp_path / "doc").keys()) == [KEY.format(0), KEY.format(1)]
+
+
+def test_entries_past_the_end_of_the_pack_are_skipped(tmp_path):
+    pack = FramePack(tmp_path / "doc")
+    pack.append(KEY.format(0), b"a" * 64)
+    pack.append(KEY.format(1), b"b" * 64)
+
+    # A crash before the last frame reached the disk
+    size = pack.pack_path.stat().st_size
+    with open(pack.pack_path, "r+b") as f:
+        f.truncate(size - 10)
+    reopened = FramePack(tmp_path / "doc")
+    assert reopened.keys() == [KEY.format(0)]
+    assert bytes(reopened.read(KEY.format(0))) == b"a" * 64
+
+
+def test_unknown_index_drops_the_pack(tmp_path):
+    pack = FramePack(tmp_path / "doc")
+    pack.append(KEY.format(0), b"a" * 64)
+    pack.index_path.write_bytes(b"NOTANIDX" + bytes(16))
+
+    assert len(FramePack(tmp_path / "doc")) == 0
+    assert not pack.pack_path.exists()
+
+
+def test_compact_keeps_the_other_frames(tmp_path):
+    pack = FramePack(tmp_path / "doc")
+    for page in range(4):
+        pack.append(KEY.format(page), bytes([page]) * 50)
+
+    freed = pack.compact([KEY.format(1), KEY.format(2)])
+    assert freed == 2 * record_size(KEY.format(1), 50)
+    assert sorted(pack.keys()) == [KEY.format(0), KEY.format(3)]
+    assert bytes(pack.read(KEY.format(3))) == bytes([3]) * 50
+    assert sorted(FramePack(tmp_path / "doc").keys()) == sorted(pack.keys())
+
+    pack.compact(pack.keys())
+    assert not (tmp_path / "doc").exists()
@@ -0,0 +1,122 @@
+"""
+Tests for ImageCache: LRU eviction by bytes and entries, handle sharing
+and counters
+"""
+
+from PySide6.QtGui import QImage
+
+from pdfpc_pyqt6.core.image_cache import ImageCache
+
+
+def make_image(width=10, height=10):
+    """An image of width * height * 4 bytes"""
+    return QImage(width, height, QImage.Format.Format_RGB32)
+
+
+IMAGE_BYTES = make_image().sizeInBytes()
+
+
+class Loader:
+    """Loader that makes a fresh image per call and records the keys"""
+
+    def __init__(self, missing=()):
+        self.loaded = []
+        self.missing = set(missing)
+
+    def __call__(self, key):
+        self.loaded.append(key)
+        if key in self.missing:
+            return None
+        return make_image()
+
+
+def test_get_loads_once_and_shares_the_handle():
+    loader = Loader()
+    cache = ImageCache(10 * IMAGE_BYTES, loader=loader)
+
+    first = cache.get("a")
+    assert cache.get("a") is first
+    assert loader.loaded == ["a"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_failed_loads_are_not_cached():
+    loader = Loader(missing={"gone"})
+    cache = ImageCache(10 * IMAGE_BYTES, loader=loader)
+
+    assert cache.get("gone") is None
+    assert cache.get("gone") is None
+    assert loader.loaded == ["gone", "gone"]
+    assert not cache.contains("gone")
+    assert cache.stats()["misses"] == 2
+
+
+def test_put_keeps_the_first_image_of_a_key():
+    cache = ImageCache(10 * IMAGE_BYTES, loader=Loader())
+    first, second = make_image(), make_image()
+
+    assert cache.put("a", first) is first
+    # A second writer, e.g. another render thread, gets the first handle
+    assert cache.put("a", second) is first
+    assert cache.get("a") is first
+    assert cache.stats()["bytes"] == IMAGE_BYTES
+
+
+def test_byte_budget_evicts_least_recently_used():
+    cache = ImageCache(3 * IMAGE_BYTES, loader=Loader())
+    for key in "abc":
+        cache.get(key)
+    cache.get("a")  # Now the most recently used
+    cache.get("d")
+
+    assert cache.keys() == ["c", "a", "d"]
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 3 * IMAGE_BYTES
+    assert stats["entries"] == 3
+
+
+def test_entry_limit_evicts_least_recently_used():
+    cache = ImageCache(100 * IMAGE_BYTES, max_entries=2, loader=Loader())
+    for key in "abc":
+        cache.put(key, make_image())
+
+    assert cache.keys() == ["b", "c"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_newest_image_is_kept_even_over_budget():
+    cache = ImageCache(IMAGE_BYTES, loader=Loader())
+    cache.put("small", make_image())
+    large = make_image(100, 100)
+
+    assert cache.put("large", large) is large
+    assert cache.keys() == ["large"]
+    assert cache.peek("large") is large
+    assert cache.stats()["bytes"] == large.sizeInBytes()
+
+
+def test_discard_evict_if_and_clear_release_bytes():
+    cache = ImageCache(10 * IMAGE_BYTES, loader=Loader())
+    for key in ("page_1_a", "page_1_b", "page_2_a"):
+        cache.put(key, make_image())
+
+    cache.discard("page_1_b")
+    assert cache.stats()["bytes"] == 2 * IMAGE_BYTES
+    assert cache.evict_if(lambda key: key.startswith("page_1")) == 1
+    assert cache.keys() == ["page_2_a"]
+    assert cache.stats()["bytes"] == IMAGE_BYTES
+
+    cache.clear()
+    assert cache.keys() == []
+    assert cache.stats()["bytes"] == 0
+
+
+def test_peek_does_not_load_or_count():
+    loader = Loader()
+    cache = ImageCache(10 * IMAGE_BYTES, loader=loader)
+
+    assert cache.peek("a") is None
+    assert loader.loaded == []
+    assert cache.stats()["misses"] == 0
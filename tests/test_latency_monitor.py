@@ -0,0 +1,123 @@
+"""
+Tests for LatencyMonitor: matching inputs to paints, percentiles and
+histogram buckets
+"""
+
+import pytest
+
+from pdfpc_pyqt6.core import latency_monitor as latency_module
+from pdfpc_pyqt6.core.latency_monitor import LatencyMonitor, percentile
+
+
+class Clock:
+    """Stands in for the time module in latency_monitor"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(latency_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def monitor(clock):
+    return LatencyMonitor()
+
+
+def turn(monitor, clock, page, paints):
+    """Mark an input at time 0 and the given (display, hit, ms) paints"""
+    clock.now = 0.0
+    monitor.mark_input(page)
+    for display, cache_hit, ms in paints:
+        clock.now = ms / 1000.0
+        monitor.mark_painted(display, cache_hit)
+
+
+def test_percentile_uses_the_nearest_rank():
+    samples = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.95) == 95.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile(samples, 0.0) == 1.0
+    assert percentile(samples, 1.0) == 100.0
+    assert percentile([7.0], 0.99) == 7.0
+
+
+def test_samples_are_split_by_display_and_cache_hit(monitor, clock):
+    turn(monitor, clock, 1, [("projector", True, 10), ("presenter", False, 120)])
+    turn(monitor, clock, 2, [("projector", False, 300)])
+
+    summary = monitor.summary()
+    assert summary["projector"]["hit"]["count"] == 1
+    assert summary["projector"]["hit"]["p50_ms"] == 10.0
+    assert summary["projector"]["miss"]["max_ms"] == 300.0
+    assert set(summary["presenter"]) == {"miss"}
+    assert monitor.sample_count() == 3
+
+
+def test_each_display_answers_an_input_once(monitor, clock):
+    turn(monitor, clock, 1, [("projector", True, 10), ("projector", True, 20)])
+    assert monitor.sample_count() == 1
+
+    # A repaint with no new input is not a sample either
+    clock.now = 0.5
+    monitor.mark_painted("presenter", True)
+    assert monitor.summary()["presenter"]["hit"]["count"] == 1
+    monitor.mark_painted("presenter", True)
+    assert monitor.sample_count() == 2
+
+
+def test_paint_before_any_input_is_ignored(monitor, clock):
+    monitor.mark_painted("projector", True)
+    assert monitor.sample_count() == 0
+    assert monitor.summary() == {}
+
+
+def test_input_left_unanswered_too_long_is_dropped(monitor, clock):
+    limit_ms = LatencyMonitor.MAX_PENDING_S * 1000
+    turn(monitor, clock, 1, [("projector", True, limit_ms + 1)])
+    assert monitor.sample_count() == 0
+
+    # Dropped for every display, not just the one that was late
+    clock.now = LatencyMonitor.MAX_PENDING_S + 2
+    monitor.mark_painted("presenter", True)
+    assert monitor.sample_count() == 0
+
+    turn(monitor, clock, 2, [("projector", True, limit_ms)])
+    assert monitor.sample_count() == 1
+
+
+def test_histogram_bucket_bounds_are_inclusive(monitor, clock):
+    for page, ms in enumerate([4, 4.5, 2000, 2000.5, 0.5]):
+        turn(monitor, clock, page, [("projector", True, ms)])
+
+    histogram = monitor.summary()["projector"]["hit"]["histogram"]
+    assert histogram["<=4ms"] == 2
+    assert histogram["<=8ms"] == 1
+    assert histogram["<=2000ms"] == 1
+    assert histogram[">2000ms"] == 1
+    assert sum(histogram.values()) == 5
+
+
+def test_clear_drops_samples_and_the_pending_input(monitor, clock):
+    turn(monitor, clock, 1, [("projector", True, 10)])
+    monitor.clear()
+    monitor.mark_painted("presenter", True)
+
+    assert monitor.sample_count() == 0
+    assert monitor.format_report() == "No navigation latency samples yet"
+
+
+def test_dump_writes_the_summary(monitor, clock, tmp_path):
+    turn(monitor, clock, 1, [("projector", True, 10)])
+    path = tmp_path / "reports" / "latency.json"
+
+    assert monitor.dump(path)
+    assert '"projector"' in path.read_text()
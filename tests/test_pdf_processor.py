@@ -0,0 +1,110 @@
+"""
+Tests for document fingerprints and page cache keys
+"""
+
+import pytest
+
+from pdfpc_pyqt6.config import config
+from pdfpc_pyqt6.core import pdf_processor
+from pdfpc_pyqt6.core.mupdf import load_fitz
+from pdfpc_pyqt6.core.pdf_processor import PDFProcessor, document_fingerprint
+
+
+def write_deck(path, pages=2, text="Slide"):
+    fitz = load_fitz()
+    document = fitz.open()
+    for page_idx in range(pages):
+        page = document.new_page(width=320, height=240)
+        page.insert_text((20, 40), f"{text} {page_idx + 1}")
+    document.save(str(path))
+    document.close()
+
+
+def rewrite_byte(path, offset):
+    data = bytearray(path.read_bytes())
+    data[offset] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path / "cache")
+    processor = PDFProcessor()
+    yield processor
+    processor.close()
+
+
+def test_fingerprint_follows_the_content_not_the_path(tmp_path):
+    first, copy, edited = (tmp_path / name for name in ("a.pdf", "b.pdf", "c.pdf"))
+    write_deck(first)
+    copy.write_bytes(first.read_bytes())
+    write_deck(edited, text="Edited")
+
+    assert document_fingerprint(first) == document_fingerprint(copy)
+    assert document_fingerprint(first) != document_fingerprint(edited)
+    assert len(document_fingerprint(first)) == 32
+
+
+def test_large_file_fingerprint_samples_head_tail_and_middle(tmp_path, monkeypatch):
+    # Take the sampled path for anything over 64 KiB, with 1 KiB chunks
+    monkeypatch.setattr(pdf_processor, "FINGERPRINT_FULL_HASH_LIMIT", 64 * 1024)
+    monkeypatch.setattr(pdf_processor, "FINGERPRINT_CHUNK_SIZE", 1024)
+    path = tmp_path / "large.pdf"
+    size = 100_000
+    path.write_bytes(bytes(range(256)) * (size // 256) + bytes(size % 256))
+    original = document_fingerprint(path)
+
+    step = (size - 1024) // (pdf_processor.FINGERPRINT_SAMPLE_COUNT + 1)
+    for offset in (10, size - 10, 3 * step + 10):
+        rewrite_byte(path, offset)
+        assert document_fingerprint(path) != original, offset
+        rewrite_byte(path, offset)
+    assert document_fingerprint(path) == original
+
+    # The size is hashed too, so appending always changes the fingerprint
+    with open(path, "ab") as f:
+        f.write(b"%%EOF\n")
+    assert document_fingerprint(path) != original
+
+
+def test_cache_keys_differ_by_every_render_parameter(tmp_path, processor):
+    path = tmp_path / "deck.pdf"
+    write_deck(path)
+    assert processor.load_pdf(str(path))
+
+    # (page_index, scale, size, clip)
+    variants = [
+        (0, None, None, None),
+        (1, None, None, None),
+        (0, 1.0, None, None),
+        (0, None, (1920, 1080), None),
+        (0, None, (1080, 1920), None),
+        (0, None, (1920, 1080), (0.0, 0.0, 0.5, 1.0)),
+        (0, None, (1920, 1080), (0.5, 0.0, 0.5, 1.0)),
+    ]
+    keys = [processor.get_cache_path(*variant) for variant in variants]
+    assert len(set(keys)) == len(variants)
+    assert {key.parent.name for key in keys} == {processor.get_fingerprint()}
+    # Without a scale, the processor's default render scale is used
+    assert processor.get_cache_path(0) == processor.get_cache_path(
+        0, scale=config.DEFAULT_SCALE
+    )
+
+
+def test_cache_keys_differ_by_document_and_codec(tmp_path, monkeypatch):
+    decks = tmp_path / "a.pdf", tmp_path / "b.pdf"
+    write_deck(decks[0])
+    write_deck(decks[1], text="Other")
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path / "cache")
+
+    keys = set()
+    for codec in ("raw", "png"):
+        monkeypatch.setattr(config, "CACHE_CODEC", codec)
+        for deck in decks:
+            processor = PDFProcessor()
+            assert processor.load_pdf(str(deck))
+            key = processor.get_cache_path(0, size=(800, 600))
+            assert key.suffix == f".{codec}"
+            keys.add(key)
+            processor.close()
+    assert len(keys) == 4
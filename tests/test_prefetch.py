@@ -0,0 +1,74 @@
+"""
+Tests for PrefetchPredictor: the window, its direction, pace and jumps
+"""
+
+import pytest
+
+from pdfpc_pyqt6.core.prefetch import PrefetchPredictor
+
+
+@pytest.fixture
+def predictor():
+    return PrefetchPredictor(
+        ahead=3, behind=1, max_ahead=8, fast_turn_s=0.5, jump_targets=2
+    )
+
+
+def walk(predictor, pages, interval=10.0):
+    """Observe pages as current in turn, interval seconds apart"""
+    for turn, page in enumerate(pages):
+        predictor.observe(page, now=turn * interval)
+
+
+def test_window_looks_forward_by_default(predictor):
+    assert predictor.window(10, 100) == [10, 11, 12, 13, 9]
+
+
+def test_window_stays_inside_the_document(predictor):
+    assert predictor.window(99, 100) == [99, 98]
+    assert predictor.window(0, 100) == [0, 1, 2, 3]
+    assert predictor.window(5, 0) == []
+
+
+def test_stepping_back_reverses_the_window_but_keeps_the_next_page(predictor):
+    walk(predictor, [10, 9])
+    assert predictor.window(9, 100) == [9, 8, 10, 7, 6]
+
+
+def test_fast_turns_widen_the_look_ahead(predictor):
+    walk(predictor, range(6), interval=0.1)
+    assert predictor.look_ahead() == 8
+    assert predictor.window(5, 100)[:3] == [5, 6, 7]
+    assert 13 in predictor.window(5, 100)
+
+    predictor.observe(6, now=60.0)  # After a pause
+    assert predictor.look_ahead() == 3
+
+
+def test_window_keeps_both_ends_of_a_jump(predictor):
+    walk(predictor, [10, 40])
+    assert predictor.window(40, 100) == [40, 41, 10, 42, 43, 39]
+
+    predictor.observe(41, now=30.0)
+    assert predictor.window(41, 100) == [41, 42, 40, 10, 43, 44]
+
+
+def test_a_jump_resets_the_pace(predictor):
+    walk(predictor, range(4), interval=0.1)
+    assert predictor.look_ahead() > 3
+    predictor.observe(50, now=1.0)
+    assert predictor.look_ahead() == 3
+
+
+def test_repeated_jump_target_outranks_older_ones(predictor):
+    # Back to the agenda on page 2 from every detour
+    walk(predictor, [10, 2, 20, 2, 30])
+    window = predictor.window(30, 100)
+    assert window[:4] == [30, 31, 2, 20]
+    assert 10 not in window
+
+
+def test_reset_forgets_jumps_and_direction(predictor):
+    walk(predictor, [10, 40, 39])
+    predictor.reset()
+    assert predictor.window(39, 100) == [39, 40, 41, 42, 38]
@@ -0,0 +1,46 @@
+"""
+Tests for the process render backend
+"""
+
+import pytest
+
+from pdfpc_pyqt6.config import config
+from pdfpc_pyqt6.core.mupdf import load_fitz
+from pdfpc_pyqt6.core.pdf_processor import PDFProcessor
+from pdfpc_pyqt6.core.process_renderer import ProcessRenderBackend
+
+
+def write_deck(path, color):
+    """A one-page PDF filled with color"""
+    fitz = load_fitz()
+    document = fitz.open()
+    page = document.new_page(width=200, height=150)
+    page.draw_rect(page.rect, color=color, fill=color)
+    document.save(str(path))
+    document.close()
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path / "cache")
+    processor = PDFProcessor()
+    backend = ProcessRenderBackend(1, page_timeout=30.0)
+    processor.set_process_backend(backend)
+    yield processor
+    processor.set_process_backend(None)
+    backend.close()
+    processor.close()
+
+
+def test_file_rewritten_in_place_is_rendered_again(tmp_path, processor):
+    path = tmp_path / "deck.pdf"
+    write_deck(path, (1, 0, 0))
+    assert processor.load_pdf(str(path))
+    key = processor.render_page(0, size=(40, 30))
+    assert processor.image_cache.get(key).pixel(5, 5) == 0xFFFF0000
+
+    # Same path, new content: the worker must not reuse the old document
+    write_deck(path, (0, 0, 1))
+    assert processor.load_pdf(str(path))
+    key = processor.render_page(0, size=(40, 30))
+    assert processor.image_cache.get(key).pixel(5, 5) == 0xFF0000FF
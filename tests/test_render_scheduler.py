@@ -0,0 +1,113 @@
+"""
+Tests for RenderScheduler: ranking, deduplication and generations
+"""
+
+from pdfpc_pyqt6.core.threading_manager import RenderRequest, RenderScheduler
+
+
+def drain(scheduler):
+    """Take and finish every request, returning them in the order taken"""
+    taken = []
+    while True:
+        item = scheduler.take()
+        if item is None:
+            return taken
+        generation, request = item
+        scheduler.finish(request, True, generation)
+        taken.append(request)
+
+
+def test_ranks_window_then_thumbnails_then_nearest_pages():
+    scheduler = RenderScheduler(max_workers=2)
+    scheduler.set_current_page(5, window=[5, 6, 4, 7])
+    thumbnail = RenderRequest(9, (100, 75), thumbnail=True)
+    scheduler.enqueue([RenderRequest(page) for page in range(10)] + [thumbnail])
+
+    order = [
+        "thumb" if request.thumbnail else request.page_index
+        for request in drain(scheduler)
+    ]
+    # Window order, then thumbnails, then by distance with forward pages first
+    assert order == [5, 6, 4, 7, "thumb", 3, 8, 2, 9, 1, 0]
+
+
+def test_urgent_request_jumps_the_queue():
+    scheduler = RenderScheduler(max_workers=1)
+    scheduler.set_current_page(0, window=[0, 1])
+    scheduler.enqueue([RenderRequest(page) for page in range(5)])
+    scheduler.enqueue([RenderRequest(4)], urgent=True)
+
+    assert drain(scheduler)[0] == RenderRequest(4)
+
+
+def test_drafts_win_ties_against_frames():
+    scheduler = RenderScheduler(max_workers=1)
+    scheduler.set_current_page(0, window=[0])
+    frame = RenderRequest(0, (800, 600))
+    draft = RenderRequest(0, (200, 150), draft=True)
+    scheduler.enqueue([frame, draft])
+
+    assert drain(scheduler) == [draft, frame]
+
+
+def test_requests_are_queued_once():
+    scheduler = RenderScheduler(max_workers=1)
+    request = RenderRequest(3)
+    scheduler.enqueue([request, request])
+    scheduler.enqueue([request])
+    assert scheduler.pending_count() == 1
+
+    generation, taken = scheduler.take()
+    scheduler.enqueue([request])  # In flight
+    assert scheduler.pending_count() == 0
+
+    scheduler.finish(taken, True, generation)
+    scheduler.enqueue([request])  # Rendered
+    assert scheduler.pending_count() == 0
+    assert scheduler.is_rendered(3)
+
+    scheduler.forget([request])
+    scheduler.enqueue([request])
+    assert scheduler.pending_count() == 1
+
+
+def test_prefetch_requests_leaving_the_window_are_dropped():
+    scheduler = RenderScheduler(max_workers=1)
+    scheduler.set_current_page(0, window=[0, 1, 2])
+    scheduler.enqueue([RenderRequest(page) for page in (1, 2)], prefetch=True)
+    scheduler.enqueue([RenderRequest(2)])  # Also wanted outside the window
+
+    scheduler.set_current_page(10, window=[10, 11])
+    assert drain(scheduler) == [RenderRequest(2)]
+
+
+def test_results_of_an_old_generation_are_dropped():
+    scheduler = RenderScheduler(max_workers=2)
+    scheduler.enqueue([RenderRequest(0), RenderRequest(1)])
+    old_generation, request = scheduler.take()
+
+    scheduler.reset()
+    assert scheduler.generation == old_generation + 1
+    assert scheduler.pending_count() == 0
+
+    scheduler.finish(request, True, old_generation)
+    assert not scheduler.is_rendered(request.page_index)
+    assert scheduler.rendered_count() == 0
+
+    # The request can be queued again for the new document
+    scheduler.enqueue([request])
+    assert drain(scheduler) == [request]
+    assert scheduler.is_rendered(request.page_index)
+
+
+def test_background_work_waits_while_paused():
+    scheduler = RenderScheduler(max_workers=2, max_background=1)
+    scheduler.set_current_page(0, window=[0])
+    scheduler.pause_background()
+    scheduler.enqueue([RenderRequest(0), RenderRequest(5)])
+
+    assert drain(scheduler) == [RenderRequest(0)]
+    assert scheduler.pending_count() == 1
+
+    assert scheduler.resume_background() == 1
+    assert drain(scheduler) == [RenderRequest(5)]